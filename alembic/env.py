@@ -17,6 +17,11 @@ from src.database import Base
 from src.models.user_model import User
 from src.models.flight_model import Flight
 from src.models.booking_model import Booking
+from src.models.booking_passenger_model import BookingPassenger
+from src.models.hotel_model import Hotel
+from src.models.idempotency_model import IdempotencyKey
+from src.models.revoked_token_model import RevokedToken
+from src.models.refresh_token_model import RefreshToken
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -42,6 +47,14 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave out model items flagged for PostgreSQL only, or everywhere else only, as create_all does."""
+    postgresql = getattr(object, "info", {}).get("postgresql")
+    if reflected or postgresql is None:
+        return True
+    return postgresql == (context.get_context().dialect.name == "postgresql")
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -81,7 +94,8 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
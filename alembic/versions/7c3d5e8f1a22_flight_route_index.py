@@ -0,0 +1,40 @@
+"""flight route index
+
+Normalizes stored airport codes to upper-case and adds a composite
+(origin, destination, departure_time) index for equality route search.
+
+Revision ID: 7c3d5e8f1a22
+Revises: 4b1f0c2a9e01
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3d5e8f1a22'
+down_revision: Union[str, Sequence[str], None] = '4b1f0c2a9e01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE flights SET origin = UPPER(TRIM(origin)), destination = UPPER(TRIM(destination)) "
+        "WHERE origin <> UPPER(TRIM(origin)) OR destination <> UPPER(TRIM(destination))"
+    )
+    op.create_index(
+        'ix_flights_route_departure',
+        'flights',
+        ['origin', 'destination', 'departure_time'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_flights_route_departure', table_name='flights')
@@ -0,0 +1,38 @@
+"""flight updated_at
+
+Adds flights.updated_at as an indexed change cursor for incremental readers
+such as the in-memory search snapshot.
+
+Revision ID: 9e4a2b6c3d58
+Revises: 7c3d5e8f1a22
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a2b6c3d58'
+down_revision: Union[str, Sequence[str], None] = '7c3d5e8f1a22'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('flights') as batch_op:
+        batch_op.add_column(
+            sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now())
+        )
+        batch_op.alter_column('updated_at', server_default=None)
+    op.create_index(op.f('ix_flights_updated_at'), 'flights', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_flights_updated_at'), table_name='flights')
+    with op.batch_alter_table('flights') as batch_op:
+        batch_op.drop_column('updated_at')
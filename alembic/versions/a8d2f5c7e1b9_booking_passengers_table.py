@@ -0,0 +1,155 @@
+"""booking passengers table
+
+Moves passengers out of the bookings.passenger_data JSON blob into an
+indexed booking_passengers table, and replaces the blob with a seats count.
+The flight summary that was copied into the blob is read from flights.
+
+Revision ID: a8d2f5c7e1b9
+Revises: f3c6a9d1e7b4
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d2f5c7e1b9'
+down_revision: Union[str, Sequence[str], None] = 'f3c6a9d1e7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+PASSENGER_FIELDS = ('first_name', 'last_name', 'passport_number', 'date_of_birth')
+
+bookings = sa.table(
+    'bookings',
+    sa.column('id', sa.Integer),
+    sa.column('flight_id', sa.Integer),
+    sa.column('seats', sa.Integer),
+    sa.column('passenger_data', sa.JSON),
+)
+booking_passengers = sa.table(
+    'booking_passengers',
+    sa.column('booking_id', sa.Integer),
+    sa.column('flight_id', sa.Integer),
+    sa.column('position', sa.Integer),
+    *(sa.column(field, sa.String) for field in PASSENGER_FIELDS),
+)
+flights = sa.table(
+    'flights',
+    sa.column('id', sa.Integer),
+    sa.column('flight_id', sa.String),
+    sa.column('airline', sa.String),
+    sa.column('origin', sa.String),
+    sa.column('destination', sa.String),
+)
+
+
+def booking_batches(conn, *columns):
+    """Yield bookings in id order, BATCH_SIZE rows at a time."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(bookings.c.id, *columns)
+            .where(bookings.c.id > last_id)
+            .order_by(bookings.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'booking_passengers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('flight_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(), nullable=False),
+        sa.Column('last_name', sa.String(), nullable=False),
+        sa.Column('passport_number', sa.String(), nullable=False),
+        sa.Column('date_of_birth', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['booking_id'], ['bookings.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['flight_id'], ['flights.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_booking_passengers_booking_position', 'booking_passengers', ['booking_id', 'position'], unique=False)
+    op.create_index('ix_booking_passengers_flight_name', 'booking_passengers', ['flight_id', 'last_name', 'first_name'], unique=False)
+    op.create_index('ix_booking_passengers_passport_number', 'booking_passengers', ['passport_number'], unique=False)
+    op.add_column('bookings', sa.Column('seats', sa.Integer(), nullable=True))
+
+    conn = op.get_bind()
+    for rows in booking_batches(conn, bookings.c.flight_id, bookings.c.passenger_data):
+        passengers = []
+        for row in rows:
+            entries = (row.passenger_data or {}).get('passengers', [])
+            passengers.extend(
+                dict(
+                    booking_id=row.id,
+                    flight_id=row.flight_id,
+                    position=position,
+                    **{field: str(entry.get(field, '')) for field in PASSENGER_FIELDS}
+                )
+                for position, entry in enumerate(entries)
+            )
+            conn.execute(bookings.update().where(bookings.c.id == row.id).values(seats=len(entries)))
+        if passengers:
+            conn.execute(booking_passengers.insert(), passengers)
+
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.alter_column('seats', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('passenger_data')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('bookings', sa.Column('passenger_data', sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    for rows in booking_batches(conn, bookings.c.flight_id):
+        booking_ids = [row.id for row in rows]
+        passengers = {}
+        for passenger in conn.execute(
+            sa.select(booking_passengers)
+            .where(booking_passengers.c.booking_id.in_(booking_ids))
+            .order_by(booking_passengers.c.booking_id, booking_passengers.c.position)
+        ):
+            passengers.setdefault(passenger.booking_id, []).append(
+                {field: getattr(passenger, field) for field in PASSENGER_FIELDS}
+            )
+        flight_info = {
+            flight.id: {
+                'flight_id': flight.flight_id,
+                'airline': flight.airline,
+                'origin': flight.origin,
+                'destination': flight.destination
+            }
+            for flight in conn.execute(
+                sa.select(flights).where(flights.c.id.in_({row.flight_id for row in rows}))
+            )
+        }
+        for row in rows:
+            conn.execute(
+                bookings.update()
+                .where(bookings.c.id == row.id)
+                .values(passenger_data={
+                    'passengers': passengers.get(row.id, []),
+                    'flight_info': flight_info.get(row.flight_id, {})
+                })
+            )
+
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.alter_column('passenger_data', existing_type=sa.JSON(), nullable=False)
+        batch_op.drop_column('seats')
+    op.drop_index('ix_booking_passengers_passport_number', table_name='booking_passengers')
+    op.drop_index('ix_booking_passengers_flight_name', table_name='booking_passengers')
+    op.drop_index('ix_booking_passengers_booking_position', table_name='booking_passengers')
+    op.drop_table('booking_passengers')
@@ -0,0 +1,49 @@
+"""hotels table
+
+Moves the hotel catalog from in-code mock data into the database, with a
+functional lower(city) index for case-insensitive city search.
+
+Revision ID: b2d8f4a61c07
+Revises: 9e4a2b6c3d58
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d8f4a61c07'
+down_revision: Union[str, Sequence[str], None] = '9e4a2b6c3d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'hotels',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('hotel_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('city', sa.String(), nullable=False),
+        sa.Column('address', sa.String(), nullable=False),
+        sa.Column('rating', sa.Float(), nullable=False),
+        sa.Column('price_per_night', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('currency', sa.String(), nullable=False),
+        sa.Column('available_rooms', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_hotels_hotel_id'), 'hotels', ['hotel_id'], unique=True)
+    op.create_index(op.f('ix_hotels_id'), 'hotels', ['id'], unique=False)
+    op.create_index('ix_hotels_city_lower', 'hotels', [sa.text('lower(city)')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_hotels_city_lower', table_name='hotels')
+    op.drop_index(op.f('ix_hotels_id'), table_name='hotels')
+    op.drop_index(op.f('ix_hotels_hotel_id'), table_name='hotels')
+    op.drop_table('hotels')
@@ -0,0 +1,134 @@
+"""partition bookings by month
+
+On PostgreSQL, rebuilds bookings as a table range-partitioned by month on
+created_at, with partitions from the oldest booking's month through three
+months ahead plus a default partition. Unique keys must include the partition
+key, so the primary key becomes (id, created_at), booking_id is unique per
+(booking_id, created_at), and booking_passengers loses its foreign key to
+bookings. Other databases keep bookings as a plain table with its
+single-column keys, so the migration does nothing there.
+
+Later partitions are created (and old ones detached) by
+src.services.booking_partitions.
+
+Revision ID: b6e3d9a2f4c8
+Revises: a8d2f5c7e1b9
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e3d9a2f4c8'
+down_revision: Union[str, Sequence[str], None] = 'a8d2f5c7e1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = 'id, booking_id, user_id, flight_id, status, total_price, created_at, updated_at, seats'
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift a month start by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def bookings_table(name: str, partitioned: bool) -> None:
+    """Create a bookings table (the partitioned parent or a plain table)."""
+    op.create_table(
+        name,
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('bookings_id_seq')"), nullable=False),
+        sa.Column('booking_id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('flight_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('total_price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('seats', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['flight_id'], ['flights.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint(*(('id', 'created_at') if partitioned else ('id',))),
+        **({'postgresql_partition_by': 'RANGE (created_at)'} if partitioned else {})
+    )
+
+
+def bookings_indexes(partitioned: bool) -> None:
+    """Create the bookings indexes (on a partitioned table, one per partition)."""
+    op.create_index(op.f('ix_bookings_id'), 'bookings', ['id'], unique=False)
+    op.create_index(
+        'ix_bookings_booking_id', 'bookings',
+        ['booking_id', 'created_at'] if partitioned else ['booking_id'], unique=True
+    )
+    op.create_index('ix_bookings_status_created_at', 'bookings', ['status', 'created_at'], unique=False)
+    op.create_index('ix_bookings_user_created_id', 'bookings', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def drop_bookings_indexes() -> None:
+    """Drop the bookings indexes so their names can be reused."""
+    for index in ('ix_bookings_user_created_id', 'ix_bookings_status_created_at', 'ix_bookings_booking_id', 'ix_bookings_id'):
+        op.drop_index(index, table_name='bookings')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_constraint('booking_passengers_booking_id_fkey', 'booking_passengers', type_='foreignkey')
+
+    # Keep the id sequence while the old table is dropped
+    op.execute("ALTER SEQUENCE bookings_id_seq OWNED BY NONE")
+    drop_bookings_indexes()
+    op.rename_table('bookings', 'bookings_unpartitioned')
+    op.execute("ALTER TABLE bookings_unpartitioned RENAME CONSTRAINT bookings_pkey TO bookings_unpartitioned_pkey")
+    bookings_table('bookings', partitioned=True)
+
+    oldest = None
+    if not context.is_offline_mode():
+        oldest = op.get_bind().scalar(sa.text("SELECT min(created_at) FROM bookings_unpartitioned"))
+    oldest = oldest or datetime.utcnow()
+    month = date(oldest.year, oldest.month, 1)
+    now = datetime.utcnow()
+    last = add_months(date(now.year, now.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE bookings_y{month.year:04d}m{month.month:02d} PARTITION OF bookings "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        )
+        month = add_months(month, 1)
+    op.execute("CREATE TABLE bookings_default PARTITION OF bookings DEFAULT")
+
+    op.execute(f"INSERT INTO bookings ({COLUMNS}) SELECT {COLUMNS} FROM bookings_unpartitioned")
+    op.drop_table('bookings_unpartitioned')
+    op.execute("ALTER SEQUENCE bookings_id_seq OWNED BY bookings.id")
+    bookings_indexes(partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Only attached partitions are copied back; archived (detached) tables are left as they are
+    op.execute("ALTER SEQUENCE bookings_id_seq OWNED BY NONE")
+    drop_bookings_indexes()
+    op.rename_table('bookings', 'bookings_partitioned')
+    op.execute("ALTER TABLE bookings_partitioned RENAME CONSTRAINT bookings_pkey TO bookings_partitioned_pkey")
+    bookings_table('bookings', partitioned=False)
+    op.execute(f"INSERT INTO bookings ({COLUMNS}) SELECT {COLUMNS} FROM bookings_partitioned")
+    op.execute("DROP TABLE bookings_partitioned CASCADE")
+    op.execute("ALTER SEQUENCE bookings_id_seq OWNED BY bookings.id")
+    bookings_indexes(partitioned=False)
+
+    op.create_foreign_key(
+        'booking_passengers_booking_id_fkey', 'booking_passengers', 'bookings',
+        ['booking_id'], ['id'], ondelete='CASCADE'
+    )
@@ -0,0 +1,30 @@
+"""booking status created_at index
+
+Lets the hold sweeper find stale PENDING bookings by index range scan.
+
+Revision ID: d7a3c5e2f914
+Revises: c4e1a7d9b3f2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3c5e2f914'
+down_revision: Union[str, Sequence[str], None] = 'c4e1a7d9b3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookings_status_created_at', 'bookings', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_status_created_at', table_name='bookings')
@@ -0,0 +1,31 @@
+"""booking user history index
+
+Composite (user_id, created_at, id) index for keyset-paginated booking
+history; scanned backwards for newest-first pages.
+
+Revision ID: e5b9d2c8a6f3
+Revises: d7a3c5e2f914
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9d2c8a6f3'
+down_revision: Union[str, Sequence[str], None] = 'd7a3c5e2f914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookings_user_created_id', 'bookings', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_user_created_id', table_name='bookings')
@@ -0,0 +1,44 @@
+"""booking seats reserved
+
+Adds bookings.seats_reserved, set on bookings whose seats were taken from
+flights.available_seats when they were made. Existing rows get false: they
+may predate seat reservation, so expiring or cancelling them must not give
+seats back. The hold sweeper index gains the flag so it never scans them.
+
+Revision ID: e8b4f1c6d3a7
+Revises: d2a7c4e9f1b3
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b4f1c6d3a7'
+down_revision: Union[str, Sequence[str], None] = 'd2a7c4e9f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'bookings',
+        sa.Column('seats_reserved', sa.Boolean(), server_default=sa.false(), nullable=False)
+    )
+    op.drop_index('ix_bookings_status_created_at', table_name='bookings')
+    op.create_index(
+        'ix_bookings_status_reserved_created_at', 'bookings',
+        ['status', 'seats_reserved', 'created_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_status_reserved_created_at', table_name='bookings')
+    op.create_index('ix_bookings_status_created_at', 'bookings', ['status', 'created_at'], unique=False)
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.drop_column('seats_reserved')
@@ -0,0 +1,38 @@
+"""booking and user updated_at
+
+Adds bookings.updated_at and users.updated_at as row versions for weak ETags
+on booking and profile reads.
+
+Revision ID: f3c6a9d1e7b4
+Revises: e5b9d2c8a6f3
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c6a9d1e7b4'
+down_revision: Union[str, Sequence[str], None] = 'e5b9d2c8a6f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('bookings', 'users'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(
+                sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now())
+            )
+            batch_op.alter_column('updated_at', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('users', 'bookings'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('updated_at')
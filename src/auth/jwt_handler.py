@@ -4,6 +4,8 @@ JWT token creation and validation.
 Handles encoding and decoding of JSON Web Tokens for authentication.
 """
 
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -16,6 +18,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     Create a JWT access token.
     
+    Every token also gets a unique ``jti`` (so it can be revoked on its own)
+    and an ``iat`` with sub-second precision (so user-wide revocations can
+    tell tokens issued just before and just after them apart).
+    
     Args:
         data: Dictionary of claims to encode in the token
         expires_delta: Optional custom expiration time
@@ -30,7 +36,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": time.time(), "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     
     return encoded_jwt
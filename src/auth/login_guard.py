@@ -0,0 +1,235 @@
+"""
+Admission control and throttling for /auth/login.
+
+Every login attempt costs a bcrypt verification, so a credential-stuffing
+burst is a CPU denial of service. Attempts pass three cheap gates before any
+password work:
+
+1. a token bucket per client IP;
+2. a token bucket per account and client IP (the submitted email,
+   case-insensitive), so a client guessing one account's password is slowed
+   without locking the account for its owner on another address;
+3. an admission gate allowing LOGIN_MAX_CONCURRENT attempts at once, with
+   up to LOGIN_ADMISSION_QUEUE_SIZE more waiting at most
+   LOGIN_ADMISSION_TIMEOUT_SECONDS for a slot.
+
+Attempts stopped by any gate get 429 with a Retry-After, so the bcrypt pool
+only ever sees the admitted ones and legitimate logins stay responsive.
+
+The client IP is ``request.client.host``; behind a reverse proxy run uvicorn
+with ``--proxy-headers`` (and ``--forwarded-allow-ips``) so it is the real
+client address rather than the proxy's.
+"""
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Hashable, Optional
+
+from src.config import settings
+from src.services.cache import TTLCache
+
+
+class LoginThrottled(Exception):
+    """Raised when a login attempt is rate limited or shed."""
+
+    def __init__(self, message: str, retry_after: float):
+        """
+        Initialize the error.
+
+        Args:
+            message: Reason the attempt was refused
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After value: whole seconds, at least 1."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets: ``burst`` attempts at once, refilled at ``per_minute``."""
+
+    def __init__(
+        self,
+        burst: int,
+        per_minute: float,
+        max_keys: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize with every bucket full.
+
+        Args:
+            burst: Bucket capacity
+            per_minute: Refill rate (0 disables the limiter)
+            max_keys: Buckets kept before LRU eviction
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.burst = max(burst, 1)
+        self.rate = per_minute / 60.0
+        self._clock = clock
+        # key -> (tokens, updated_at); a bucket expires once it would be full again
+        self._buckets = TTLCache(max_entries=max_keys, ttl_seconds=self.burst / self.rate if self.rate > 0 else 0, clock=clock)
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Take one token from a key's bucket.
+
+        Args:
+            key: Client IP or account
+
+        Returns:
+            0 if the attempt may proceed, otherwise seconds until a token is available
+        """
+        if self.rate <= 0:
+            return 0.0
+        now = self._clock()
+        tokens, updated_at = self._buckets.get(key) or (float(self.burst), now)
+        tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate)
+        if tokens < 1:
+            self._buckets.set(key, (tokens, now), ttl_seconds=(self.burst - tokens) / self.rate)
+            return (1 - tokens) / self.rate
+        tokens -= 1
+        self._buckets.set(key, (tokens, now), ttl_seconds=(self.burst - tokens) / self.rate)
+        return 0.0
+
+
+class LoginGuard:
+    """Rate limits and bounded admission for login attempts."""
+
+    def __init__(
+        self,
+        ip_limiter: TokenBucketLimiter,
+        account_limiter: TokenBucketLimiter,
+        max_concurrent: int,
+        queue_size: int,
+        timeout_seconds: float
+    ):
+        """
+        Initialize the guard.
+
+        Args:
+            ip_limiter: Buckets keyed by client IP
+            account_limiter: Buckets keyed by (normalized email, client IP)
+            max_concurrent: Attempts verified at once
+            queue_size: Further attempts allowed to wait for a slot
+            timeout_seconds: Longest wait for a slot before shedding
+        """
+        self.ip_limiter = ip_limiter
+        self.account_limiter = account_limiter
+        self.max_concurrent = max(max_concurrent, 1)
+        self.queue_size = max(queue_size, 0)
+        self.timeout_seconds = timeout_seconds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waiting = 0
+        self.served = 0
+        self.queued = 0
+        self.rejected_ip = 0
+        self.rejected_account = 0
+        self.shed = 0
+        self.timed_out = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the admission semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+            self._waiting = 0
+        return self._semaphore
+
+    def check_limits(self, client_ip: Optional[str], account: str) -> None:
+        """
+        Charge an attempt to its IP bucket and its (account, IP) bucket.
+
+        Args:
+            client_ip: Client address (None if unknown)
+            account: Submitted email
+
+        Raises:
+            LoginThrottled: If either bucket is empty
+        """
+        if client_ip is not None:
+            retry_after = self.ip_limiter.acquire(client_ip)
+            if retry_after:
+                self.rejected_ip += 1
+                raise LoginThrottled("Too many login attempts from this address", retry_after)
+        retry_after = self.account_limiter.acquire((account.strip().lower(), client_ip))
+        if retry_after:
+            self.rejected_account += 1
+            raise LoginThrottled("Too many login attempts for this account", retry_after)
+
+    @asynccontextmanager
+    async def admit(self, client_ip: Optional[str], account: str) -> AsyncIterator[None]:
+        """
+        Hold an admission slot for one login attempt.
+
+        Args:
+            client_ip: Client address (None if unknown)
+            account: Submitted email
+
+        Raises:
+            LoginThrottled: If rate limited, the wait queue is full or no slot frees up in time
+        """
+        if settings.LOGIN_RATE_LIMIT_ENABLED:
+            self.check_limits(client_ip, account)
+
+        semaphore = self._get_semaphore()
+        if semaphore.locked():
+            if self._waiting >= self.queue_size:
+                self.shed += 1
+                raise LoginThrottled("Login is busy, try again shortly", 1.0)
+            self.queued += 1
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), self.timeout_seconds)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                raise LoginThrottled("Login is busy, try again shortly", 1.0) from None
+            finally:
+                self._waiting -= 1
+        else:
+            await semaphore.acquire()
+
+        self.served += 1
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get admission counters for monitoring.
+
+        Returns:
+            Dictionary of served, queued, waiting, rejected, shed and timed-out counts
+        """
+        return {
+            "served": self.served,
+            "queued": self.queued,
+            "waiting": self._waiting,
+            "rejected_ip": self.rejected_ip,
+            "rejected_account": self.rejected_account,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+        }
+
+
+# Process-wide login guard
+login_guard = LoginGuard(
+    ip_limiter=TokenBucketLimiter(
+        settings.LOGIN_IP_BURST, settings.LOGIN_IP_PER_MINUTE, settings.LOGIN_THROTTLE_MAX_KEYS
+    ),
+    account_limiter=TokenBucketLimiter(
+        settings.LOGIN_ACCOUNT_BURST, settings.LOGIN_ACCOUNT_PER_MINUTE, settings.LOGIN_THROTTLE_MAX_KEYS
+    ),
+    max_concurrent=settings.LOGIN_MAX_CONCURRENT,
+    queue_size=settings.LOGIN_ADMISSION_QUEUE_SIZE,
+    timeout_seconds=settings.LOGIN_ADMISSION_TIMEOUT_SECONDS
+)
@@ -0,0 +1,86 @@
+"""
+Cache of verified principals for authenticated requests.
+
+Tokens that carry only an email (``sub``), rather than the full set of user
+claims, make ``get_current_user`` load the user from the database. This
+cache maps such a verified token to the ``User`` it resolved to, so repeat
+requests with the same token skip the database round trip. Tokens issued by
+/auth/login carry the full claims and never reach it, so it only serves
+legacy tokens until the last of them expires.
+
+An entry never outlives its token: its TTL is capped at the token's ``exp``.
+Entries are tagged with the user ID and dropped when that user changes (e.g.
+is deactivated). The cache is per process, so other workers see such changes
+only after PRINCIPAL_CACHE_TTL_SECONDS; keep it short.
+"""
+
+import hashlib
+import time
+from typing import Optional
+
+from src.config import settings
+from src.schemas.auth_schema import User
+from src.services.cache import TTLCache
+
+# sha256(token) -> User, tagged ("user", id)
+principal_cache = TTLCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def token_key(token: str) -> bytes:
+    """Get the cache key for a token (a digest, so raw tokens are not kept)."""
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def user_tag(user_id: int) -> tuple:
+    """Get the tag shared by every cached token of a user."""
+    return ("user", user_id)
+
+
+def get_principal(token: str) -> Optional[User]:
+    """
+    Look up the user a token was verified as.
+
+    Args:
+        token: Bearer token
+
+    Returns:
+        Cached user, or None if caching is disabled or the token is not cached
+    """
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return None
+    return principal_cache.get(token_key(token))
+
+
+def cache_principal(token: str, user: User, expires_at: Optional[float]) -> None:
+    """
+    Remember the user a verified token resolved to.
+
+    Args:
+        token: Bearer token that was just verified
+        user: User it resolved to
+        expires_at: Token ``exp`` claim as a Unix timestamp (optional)
+    """
+    if not settings.PRINCIPAL_CACHE_ENABLED:
+        return
+    ttl = settings.PRINCIPAL_CACHE_TTL_SECONDS
+    if expires_at is not None:
+        ttl = min(ttl, expires_at - time.time())
+    if ttl <= 0:
+        return
+    principal_cache.set(token_key(token), user, tags=[user_tag(user.id)], ttl_seconds=ttl)
+
+
+def invalidate_user(user_id: int) -> int:
+    """
+    Drop every cached token of a user, e.g. after the user is deactivated.
+
+    Args:
+        user_id: User's database ID
+
+    Returns:
+        Number of entries removed
+    """
+    return principal_cache.invalidate_tag(user_tag(user_id))
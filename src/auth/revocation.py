@@ -0,0 +1,183 @@
+"""
+In-memory revocation list for self-contained access tokens.
+
+Access tokens carry everything ``get_current_user`` needs (user ID, email,
+name, active flag), so authenticating a request is a signature check plus a
+lookup here: no database read. Two kinds of revocation are kept:
+
+* by token ID (``jti``): one token, e.g. on logout;
+* by user: every token of that user issued at or before a cutoff, e.g. when
+  the user is deactivated and the ``act`` claim in their tokens goes stale.
+  Legacy tokens with only an email (``sub``) have no user ID to look up, so
+  ``get_current_user`` checks them against the cutoff once it has resolved
+  their user.
+
+Revocations made by this process apply at once. Each process also reloads the
+revocations of every other process from the revoked_tokens table every
+TOKEN_REVOCATION_SYNC_SECONDS. Entries are dropped once every token they
+cover has expired, so the list stays as small as the recent revocations.
+
+Plain dict lookups are used rather than a Bloom filter in front of a set: in
+CPython a dict probe is a single C-level hash lookup, cheaper than computing
+several Bloom hashes in Python, and the list is already small.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from src import database
+from src.models.revoked_token_model import RevokedToken
+from src.repositories.revoked_token_repo import RevokedTokenRepository
+
+
+def to_timestamp(value: datetime) -> float:
+    """Convert a naive UTC datetime to a Unix timestamp."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevocationList:
+    """Revoked token IDs and per-user cutoffs, each kept until its tokens expire."""
+
+    def __init__(self):
+        """Initialize an empty list."""
+        self._lock = threading.Lock()
+        # jti -> expiry of that token
+        self._tokens: Dict[str, float] = {}
+        # user ID -> (issued-at cutoff, expiry of the last covered token)
+        self._users: Dict[int, tuple] = {}
+        self.syncs = 0
+        self.rejections = 0
+
+    def revoke_token(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke one token.
+
+        Args:
+            jti: Token ID
+            expires_at: Token expiry (Unix timestamp)
+        """
+        with self._lock:
+            self._tokens[jti] = max(expires_at, self._tokens.get(jti, 0.0))
+
+    def revoke_user(self, user_id: int, issued_before: float, expires_at: float) -> None:
+        """
+        Revoke every token of a user issued at or before a cutoff.
+
+        Args:
+            user_id: User's database ID
+            issued_before: Cutoff compared with the ``iat`` claim (Unix timestamp)
+            expires_at: When every covered token has expired (Unix timestamp)
+        """
+        with self._lock:
+            cutoff, expiry = self._users.get(user_id, (0.0, 0.0))
+            self._users[user_id] = (max(cutoff, issued_before), max(expiry, expires_at))
+
+    def is_revoked(self, claims: dict) -> bool:
+        """
+        Check decoded token claims against the list.
+
+        Args:
+            claims: Verified token claims (``jti``, ``uid``, ``iat``)
+
+        Returns:
+            True if the token must be rejected
+        """
+        if claims.get("jti") in self._tokens:
+            self.rejections += 1
+            return True
+        return "uid" in claims and self.is_user_revoked(claims["uid"], claims.get("iat", 0))
+
+    def is_user_revoked(self, user_id: int, issued_at: float) -> bool:
+        """
+        Check a token's issue time against its user's cutoff.
+
+        ``is_revoked`` does this for tokens with a ``uid`` claim; tokens with
+        only an email (``sub``) are checked with this once the user they
+        name has been resolved.
+
+        Args:
+            user_id: User's database ID
+            issued_at: The token's ``iat`` (0 if it has none)
+
+        Returns:
+            True if the token must be rejected
+        """
+        if not self._users:
+            return False
+        entry = self._users.get(user_id)
+        revoked = entry is not None and issued_at <= entry[0]
+        if revoked:
+            self.rejections += 1
+        return revoked
+
+    def load(self, records: Iterable[RevokedToken], now: Optional[float] = None) -> None:
+        """
+        Merge revocations read from the database and drop expired entries.
+
+        Revocations are never undone, so merging (rather than replacing)
+        cannot resurrect a token, and keeps local revocations whose rows
+        were not yet visible to the read.
+
+        Args:
+            records: Revocations that still cover unexpired tokens
+            now: Current time (Unix timestamp, defaults to time.time())
+        """
+        for record in records:
+            if record.jti is not None:
+                self.revoke_token(record.jti, to_timestamp(record.expires_at))
+            else:
+                self.revoke_user(record.user_id, to_timestamp(record.revoked_at), to_timestamp(record.expires_at))
+        now = time.time() if now is None else now
+        with self._lock:
+            self._tokens = {jti: expiry for jti, expiry in self._tokens.items() if expiry > now}
+            self._users = {uid: entry for uid, entry in self._users.items() if entry[1] > now}
+
+    def refresh(self, db: Session) -> None:
+        """
+        Purge expired revocations and load the rest.
+
+        Args:
+            db: Database session
+        """
+        now = datetime.utcnow()
+        repo = RevokedTokenRepository(db)
+        repo.delete_expired(now)
+        db.commit()
+        self.load(repo.list_active(now), to_timestamp(now))
+        self.syncs += 1
+
+    def refresh_from_db(self) -> None:
+        """Sync on a short-lived session of its own."""
+        db = database.SessionLocal()
+        try:
+            self.refresh(db)
+        finally:
+            db.close()
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._tokens.clear()
+            self._users.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get revocation counters for monitoring.
+
+        Returns:
+            Dictionary of revoked token and user counts, syncs and rejections
+        """
+        return {
+            "tokens": len(self._tokens),
+            "users": len(self._users),
+            "syncs": self.syncs,
+            "rejections": self.rejections,
+        }
+
+
+# Process-wide revocation list, synced by a lifespan task
+revocation_list = RevocationList()
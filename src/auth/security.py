@@ -2,10 +2,24 @@
 Password hashing and verification utilities.
 
 Uses passlib with bcrypt for secure password storage.
+
+bcrypt is deliberately slow, so async code must not call ``hash_password`` or
+``verify_password`` directly: the async wrappers run them on a small bounded
+thread pool (bcrypt releases the GIL while hashing) and fail fast with
+``PasswordHasherBusy`` once too much work is waiting.
 """
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 
+from src.config import settings
+
+T = TypeVar("T")
+
 
 def hash_password(password: str) -> str:
     """
@@ -40,3 +54,101 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     hashed_bytes = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing pool has no room for another request."""
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt work, kept off the event loop."""
+    
+    def __init__(self, workers: int, queue_size: int):
+        """
+        Initialize the pool (threads start on first use).
+        
+        Args:
+            workers: Hashes computed concurrently
+            queue_size: Further requests allowed to wait for a worker
+        """
+        self.workers = max(workers, 1)
+        self.queue_size = max(queue_size, 0)
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it if needed."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+            return self._executor
+    
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run a password function on the pool.
+        
+        Args:
+            fn: Blocking function (hash_password or verify_password)
+            *args: Arguments for ``fn``
+            
+        Returns:
+            Whatever ``fn`` returns
+            
+        Raises:
+            PasswordHasherBusy: If every worker and queue slot is taken
+        """
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Password hashing is at capacity")
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Free the slot when the work finishes, even if the caller stops waiting
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads, dropping work that has not started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a plain text password without blocking the event loop.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Hashed password string
+        
+    Raises:
+        PasswordHasherBusy: If the hashing pool is at capacity
+    """
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password without blocking the event loop.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+        
+    Returns:
+        True if password matches, False otherwise
+        
+    Raises:
+        PasswordHasherBusy: If the hashing pool is at capacity
+    """
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
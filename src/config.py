@@ -5,6 +5,8 @@ Loads environment variables and provides application settings using pydantic-set
 All secrets and configuration must be managed through environment variables.
 """
 
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -19,6 +21,59 @@ class Settings(BaseSettings):
         ALGORITHM: JWT hashing algorithm (default: HS256)
         ACCESS_TOKEN_EXPIRE_MINUTES: JWT token expiration time in minutes
         DATABASE_URL: PostgreSQL database connection string
+        DATABASE_ASYNC: Serve route handlers from an AsyncEngine/AsyncSession
+        ASYNC_DATABASE_URL: Async driver connection string (derived from DATABASE_URL if unset)
+        DB_POOL_SIZE: Number of persistent connections kept by the async engine
+        DB_MAX_OVERFLOW: Extra connections the async engine may open under load
+        SEARCH_PAGE_SIZE: Default number of flights per search page
+        SEARCH_MAX_PAGE_SIZE: Upper bound clients may request per search page
+        SEARCH_CACHE_ENABLED: Serve repeated flight searches from an in-process cache
+        SEARCH_CACHE_TTL_SECONDS: Lifetime of a cached flight search page
+        SEARCH_CACHE_MAX_ENTRIES: Number of search pages kept before LRU eviction
+        SEARCH_STREAM_BATCH_SIZE: Rows fetched per round trip when streaming NDJSON search results
+        SEARCH_BATCH_MAX_IDS: Maximum flight IDs accepted by one batch lookup
+        FLIGHT_SNAPSHOT_ENABLED: Answer route searches from an in-memory columnar snapshot
+        FLIGHT_SNAPSHOT_REFRESH_SECONDS: Interval between incremental snapshot refreshes
+        HOTEL_CACHE_TTL_SECONDS: Lifetime of cached city and hotel-id lookups
+        HOTEL_CACHE_MAX_ENTRIES: Number of cities (and hotels) kept before LRU eviction
+        CONNECTION_SEARCH_ENABLED: Serve connecting-flight search from an in-memory route graph rebuilt in the background
+        ROUTE_GRAPH_REFRESH_SECONDS: Interval between rebuilds of the connecting-flight route graph
+        CONNECTION_MAX_STOPS: Upper bound clients may request for stops per itinerary
+        CONNECTION_MAX_RESULTS: Upper bound clients may request for itineraries per search
+        IDEMPOTENCY_KEY_TTL_HOURS: How long a booking Idempotency-Key replays its original response
+        BOOKING_GROUP_MAX_ITEMS: Maximum bookings accepted by one group booking request
+        BOOKINGS_PAGE_SIZE: Default number of bookings per booking history page
+        BOOKINGS_MAX_PAGE_SIZE: Upper bound clients may request per booking history page
+        BOOKING_HOLD_TTL_MINUTES: Minutes a PENDING booking holds its seats before it expires (0, the default, disables expiry)
+        BOOKING_SWEEP_INTERVAL_SECONDS: Interval between runs of the expired-hold sweeper
+        BOOKING_SWEEP_BATCH_SIZE: Bookings expired per sweeper transaction
+        BOOKING_QUEUE_ENABLED: Accept single bookings with 202 and write them from a background queue (statuses are per process: run one worker)
+        BOOKING_QUEUE_MAX_SIZE: Queued booking requests before new ones are refused with 503
+        BOOKING_QUEUE_WORKERS: Number of batch writers draining the booking queue
+        BOOKING_QUEUE_BATCH_SIZE: Maximum queued bookings one writer takes per batch
+        BOOKING_QUEUE_RESULT_TTL_SECONDS: How long a queued booking's status stays available for polling
+        BOOKING_QUEUE_MAX_RESULTS: Queued booking statuses kept for polling (never evicted before their TTL); when full, new ones get 503
+        BOOKING_QUEUE_DRAIN_SECONDS: On shutdown, how long writers may drain the queue before unwritten jobs are marked failed
+        MANIFEST_API_KEY: X-API-Key value that unlocks flight passenger manifests (unset disables them)
+        BOOKING_PARTITION_MONTHS_AHEAD: Monthly bookings partitions kept created ahead of the current month (PostgreSQL)
+        BOOKING_ARCHIVE_AFTER_MONTHS: Detach bookings partitions this many months older than the current one (0 disables archival)
+        BOOKING_PARTITION_MAINTENANCE_SECONDS: Interval between partition create/archive runs (0 disables the job)
+        PASSWORD_HASH_WORKERS: Threads hashing or verifying passwords concurrently
+        PASSWORD_HASH_QUEUE_SIZE: Password requests allowed to wait for a thread before 503
+        PRINCIPAL_CACHE_ENABLED: Cache the user each verified legacy (email-only) bearer token resolves to
+        PRINCIPAL_CACHE_TTL_SECONDS: Lifetime of a cached principal (also capped at token expiry)
+        PRINCIPAL_CACHE_MAX_ENTRIES: Number of tokens kept before LRU eviction
+        TOKEN_REVOCATION_SYNC_SECONDS: Interval between loads of other workers' token revocations
+        REFRESH_TOKEN_EXPIRE_DAYS: Lifetime of a refresh token (each use issues a new one)
+        LOGIN_RATE_LIMIT_ENABLED: Whether login attempts are throttled per IP and per (account, IP)
+        LOGIN_IP_BURST: Login attempts one IP may make at once before 429
+        LOGIN_IP_PER_MINUTE: Rate at which an IP regains login attempts
+        LOGIN_ACCOUNT_BURST: Login attempts against one email from one IP at once before 429
+        LOGIN_ACCOUNT_PER_MINUTE: Rate at which an email regains login attempts from one IP
+        LOGIN_THROTTLE_MAX_KEYS: IPs and emails tracked per limiter before LRU eviction
+        LOGIN_MAX_CONCURRENT: Login attempts verified at once
+        LOGIN_ADMISSION_QUEUE_SIZE: Login attempts allowed to wait for a slot before 429
+        LOGIN_ADMISSION_TIMEOUT_SECONDS: Longest wait for a login slot before 429
     """
     
     APP_NAME: str = "TravelAPI"
@@ -27,6 +82,59 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     DATABASE_URL: str
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 80
+    SEARCH_PAGE_SIZE: int = 50
+    SEARCH_MAX_PAGE_SIZE: int = 200
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: float = 30.0
+    SEARCH_CACHE_MAX_ENTRIES: int = 2048
+    SEARCH_STREAM_BATCH_SIZE: int = 500
+    SEARCH_BATCH_MAX_IDS: int = 100
+    FLIGHT_SNAPSHOT_ENABLED: bool = False
+    FLIGHT_SNAPSHOT_REFRESH_SECONDS: float = 5.0
+    HOTEL_CACHE_TTL_SECONDS: float = 300.0
+    HOTEL_CACHE_MAX_ENTRIES: int = 10000
+    CONNECTION_SEARCH_ENABLED: bool = False
+    ROUTE_GRAPH_REFRESH_SECONDS: float = 60.0
+    CONNECTION_MAX_STOPS: int = 3
+    CONNECTION_MAX_RESULTS: int = 50
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+    BOOKING_GROUP_MAX_ITEMS: int = 10
+    BOOKINGS_PAGE_SIZE: int = 20
+    BOOKINGS_MAX_PAGE_SIZE: int = 100
+    BOOKING_HOLD_TTL_MINUTES: int = 0
+    BOOKING_SWEEP_INTERVAL_SECONDS: float = 30.0
+    BOOKING_SWEEP_BATCH_SIZE: int = 500
+    BOOKING_QUEUE_ENABLED: bool = False
+    BOOKING_QUEUE_MAX_SIZE: int = 10000
+    BOOKING_QUEUE_WORKERS: int = 4
+    BOOKING_QUEUE_BATCH_SIZE: int = 100
+    BOOKING_QUEUE_RESULT_TTL_SECONDS: float = 600.0
+    BOOKING_QUEUE_MAX_RESULTS: int = 100000
+    BOOKING_QUEUE_DRAIN_SECONDS: float = 30.0
+    MANIFEST_API_KEY: Optional[str] = None
+    BOOKING_PARTITION_MONTHS_AHEAD: int = 3
+    BOOKING_ARCHIVE_AFTER_MONTHS: int = 0
+    BOOKING_PARTITION_MAINTENANCE_SECONDS: float = 3600.0
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 10.0
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 20.0
+    LOGIN_ACCOUNT_BURST: int = 10
+    LOGIN_ACCOUNT_PER_MINUTE: float = 5.0
+    LOGIN_THROTTLE_MAX_KEYS: int = 100000
+    LOGIN_MAX_CONCURRENT: int = 8
+    LOGIN_ADMISSION_QUEUE_SIZE: int = 32
+    LOGIN_ADMISSION_TIMEOUT_SECONDS: float = 2.0
     
     class Config:
         env_file = ".env"
@@ -2,14 +2,21 @@
 Database configuration and session management.
 
 Sets up SQLAlchemy engine and session factory for PostgreSQL database.
+When ``DATABASE_ASYNC`` is enabled an ``AsyncEngine`` is configured as well,
+so route handlers can await queries instead of blocking the event loop.
 """
 
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar, Union
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import settings
 
+T = TypeVar("T")
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
@@ -24,10 +31,79 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def matches_postgresql_info(ddl: Any, target: Any, bind: Any, **kw: Any) -> bool:
+    """
+    ``ddl_if`` predicate for schema items created only on, or only off, PostgreSQL.
+
+    The item's ``info["postgresql"]`` says which (True: only on PostgreSQL,
+    False: everywhere else). Used for the keys of bookings, which is
+    partitioned on PostgreSQL only; alembic/env.py reads the same flag.
+    """
+    return target.info["postgresql"] == (kw["dialect"].name == "postgresql")
+
+
+# Sync driver prefixes and their async counterparts
+ASYNC_DRIVERS = {
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+    "postgresql://": "postgresql+asyncpg://",
+    "postgres://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Convert a sync database URL to its async driver equivalent.
+
+    Args:
+        url: Database URL using a sync driver (psycopg2, pysqlite)
+
+    Returns:
+        Database URL using asyncpg for PostgreSQL or aiosqlite for SQLite.
+        URLs that already name another driver are returned unchanged.
+    """
+    for sync_prefix, async_prefix in ASYNC_DRIVERS.items():
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+def create_async_db_engine(url: str) -> AsyncEngine:
+    """
+    Create the async engine used when DATABASE_ASYNC is enabled.
+
+    Args:
+        url: Async database URL
+
+    Returns:
+        Configured AsyncEngine
+    """
+    options = {"pool_pre_ping": True, "echo": settings.DEBUG}
+    if not url.startswith("sqlite"):
+        # SQLite uses a single-file/static pool that does not accept sizing
+        options.update(pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW)
+    return create_async_engine(url, **options)
+
+
+# Async engine and session factory (only created in async mode)
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+if settings.DATABASE_ASYNC:
+    async_engine = create_async_db_engine(
+        settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        autoflush=False,
+        expire_on_commit=False  # Returned objects stay readable after commit
+    )
+
+
 def get_db():
     """
     Dependency function to get database session.
-    
+
     Yields:
         Database session that will be closed after use
     """
@@ -36,3 +112,65 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function to get an async database session.
+
+    Yields:
+        Async database session that will be closed after use
+
+    Raises:
+        RuntimeError: If DATABASE_ASYNC is not enabled
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database mode is disabled (set DATABASE_ASYNC=True)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session dependency for route handlers: AsyncSession in async mode, Session otherwise
+get_session = get_async_db if settings.DATABASE_ASYNC else get_db
+
+
+async def run_in_session(
+    db: Union[Session, AsyncSession],
+    fn: Callable[..., T],
+    *args: Any
+) -> T:
+    """
+    Run a sync service function against either session type.
+
+    On an AsyncSession the function runs through ``run_sync``, so its ORM
+    calls are awaited on the async driver instead of blocking the event loop.
+    On a sync Session it is called directly and its queries still block the
+    event loop, as they did before async mode existed.
+
+    Args:
+        db: Sync or async database session
+        fn: Function taking a sync Session as its first argument
+        *args: Remaining positional arguments for ``fn``
+
+    Returns:
+        Whatever ``fn`` returns
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args)
+    return fn(db, *args)
+
+
+async def release_connection(db: Union[Session, AsyncSession]) -> None:
+    """
+    Return the session's connection to the pool before slow non-database work.
+
+    Objects already loaded stay readable (they are detached, not expired), and
+    the session can still be used afterwards; it checks out a new connection.
+
+    Args:
+        db: Sync or async database session
+    """
+    if isinstance(db, AsyncSession):
+        await db.close()
+    else:
+        db.close()
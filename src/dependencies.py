@@ -4,29 +4,68 @@ Common dependency functions for FastAPI routes.
 Provides reusable dependencies for database sessions and user authentication.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Union
+import secrets
 
-from src.database import get_db
+from src.config import settings
+from src.database import get_session
 from src.auth.jwt_handler import decode_access_token
-from src.repositories.user_repo import UserRepository
+from src.auth.principal_cache import cache_principal, get_principal
+from src.auth.revocation import revocation_list
+from src.repositories.user_repo import AsyncUserRepository, UserRepository
 from src.schemas.auth_schema import User
 
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Dependency to verify the bearer token and return its claims.
+    
+    A pure CPU check: the signature and expiry are verified and the token
+    is looked up in the in-memory revocation list.
+    
+    Args:
+        token: JWT token from Authorization header
+        
+    Returns:
+        Verified token claims
+        
+    Raises:
+        HTTPException: If the token is invalid, expired or revoked
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None or revocation_list.is_revoked(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    claims: dict = Depends(get_token_claims),
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ) -> User:
     """
     Dependency to get current authenticated user from JWT token.
     
+    Tokens issued by /auth/login carry the user's ID, name and active flag,
+    so the user is built from the claims without a database read. Legacy
+    tokens with only an email (``sub``) are resolved through the principal
+    cache, falling back to the users table, and then checked against the
+    user's revocation cutoff (get_token_claims could not, lacking the ID).
+    
     Args:
         token: JWT token from Authorization header
+        claims: Verified token claims
         db: Database session
         
     Returns:
@@ -35,27 +74,33 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
-    
-    email: Optional[str] = payload.get("sub")
-    if email is None:
-        raise credentials_exception
-    
-    user_repo = UserRepository(db)
-    db_user = user_repo.get_by_email(email)
+    if "uid" in claims:
+        return User(
+            id=claims["uid"],
+            email=claims["sub"],
+            full_name=claims.get("name", ""),
+            is_active=claims.get("act", True)
+        )
     
-    if db_user is None:
-        raise credentials_exception
+    user = get_principal(token)
+    if user is None:
+        email: str = claims["sub"]
+        if isinstance(db, AsyncSession):
+            db_user = await AsyncUserRepository(db).get_by_email(email)
+        else:
+            db_user = UserRepository(db).get_by_email(email)
+        
+        if db_user is not None:
+            user = User.model_validate(db_user)
+            cache_principal(token, user, claims.get("exp"))
     
-    return User.model_validate(db_user)
+    if user is None or revocation_list.is_user_revoked(user.id, claims.get("iat", 0)):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
 
 
 async def get_current_active_user(
@@ -79,3 +124,23 @@ async def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+
+async def require_manifest_key(
+    x_api_key: Optional[str] = Header(None, description="Staff key for passenger manifests")
+) -> None:
+    """
+    Dependency to restrict passenger manifests to staff holding MANIFEST_API_KEY.
+    
+    Args:
+        x_api_key: X-API-Key header value
+        
+    Raises:
+        HTTPException: If manifests are disabled or the key is missing or wrong
+    """
+    expected = settings.MANIFEST_API_KEY
+    if not expected or not x_api_key or not secrets.compare_digest(x_api_key, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Manifest access denied"
+        )
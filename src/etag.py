@@ -0,0 +1,77 @@
+"""
+Weak ETags and conditional GET helpers.
+
+ETags are derived from a row's ``updated_at`` version, so a route can answer
+``If-None-Match`` with ``304 Not Modified`` after reading just that column,
+without loading or serializing the full object.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Response, status
+
+# Per-user data: clients may keep a copy but must revalidate before use
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(resource: str, resource_id: int, version: datetime) -> str:
+    """
+    Build a weak ETag for one version of a row.
+
+    Args:
+        resource: Resource kind (e.g. "booking")
+        resource_id: Row ID
+        version: Row ``updated_at``
+
+    Returns:
+        Weak entity tag, e.g. ``W/"booking-7-20261017T120000123456"``
+    """
+    return f'W/"{resource}-{resource_id}-{version:%Y%m%dT%H%M%S%f}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag (weak comparison).
+
+    Args:
+        if_none_match: If-None-Match header value (optional)
+        etag: Current entity tag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """
+    Attach validator headers to a full response.
+
+    Args:
+        response: Outgoing response
+        etag: Current entity tag
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build an empty 304 response for a client whose copy is current.
+
+    Args:
+        etag: Current entity tag
+
+    Returns:
+        304 Not Modified response
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
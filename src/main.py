@@ -4,11 +4,66 @@ Travel Booking API - Main Application
 FastAPI application for flight and hotel booking with JWT authentication.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.auth.login_guard import login_guard
+from src.auth.principal_cache import principal_cache
+from src.auth.revocation import revocation_list
+from src.auth.security import password_hasher
 from src.config import settings
+from src.database import async_engine, engine
 from src.routes import auth, search, bookings, users
+from src.services.booking_partitions import run_partition_maintainer
+from src.services.booking_queue import booking_queue
+from src.services.booking_service import run_hold_sweeper
+from src.services.flight_snapshot import flight_snapshot, run_refresh_loop
+from src.services.route_graph import route_graph
+from src.services.search_service import flight_search_cache, hotel_city_index, hotel_id_index
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: start background workers, release resources on shutdown.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    tasks = [
+        asyncio.create_task(run_refresh_loop(revocation_list, settings.TOKEN_REVOCATION_SYNC_SECONDS)),
+    ]
+    # Also purges expired idempotency keys, so it runs even with hold expiry off
+    tasks.append(asyncio.create_task(
+        run_hold_sweeper(settings.BOOKING_SWEEP_INTERVAL_SECONDS)
+    ))
+    if settings.BOOKING_PARTITION_MAINTENANCE_SECONDS > 0 and engine.dialect.name == "postgresql":
+        tasks.append(asyncio.create_task(
+            run_partition_maintainer(settings.BOOKING_PARTITION_MAINTENANCE_SECONDS)
+        ))
+    if settings.BOOKING_QUEUE_ENABLED:
+        tasks.extend(booking_queue.start(settings.BOOKING_QUEUE_WORKERS))
+    if settings.FLIGHT_SNAPSHOT_ENABLED:
+        tasks.append(asyncio.create_task(
+            run_refresh_loop(flight_snapshot, settings.FLIGHT_SNAPSHOT_REFRESH_SECONDS)
+        ))
+    if settings.CONNECTION_SEARCH_ENABLED:
+        tasks.append(asyncio.create_task(
+            run_refresh_loop(route_graph, settings.ROUTE_GRAPH_REFRESH_SECONDS)
+        ))
+    
+    yield
+    
+    await booking_queue.stop(settings.BOOKING_QUEUE_DRAIN_SECONDS)
+    password_hasher.shutdown()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 # Create FastAPI application
@@ -16,7 +71,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     description="Travel Booking API with authentication, search, and booking management",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -26,6 +82,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Register routers
@@ -65,6 +122,27 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["Root"])
+async def metrics():
+    """
+    In-process counters for monitoring.
+    
+    Returns:
+        Cache and throughput counters for this worker
+    """
+    return {
+        "search_cache": flight_search_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "login_admission": login_guard.stats(),
+        "token_revocations": revocation_list.stats(),
+        "flight_snapshot": flight_snapshot.stats(),
+        "route_graph": route_graph.stats(),
+        "hotel_city_index": hotel_city_index.stats(),
+        "hotel_id_index": hotel_id_index.stats(),
+        "booking_queue": booking_queue.stats()
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -4,12 +4,13 @@ Booking database model.
 SQLAlchemy model for bookings table.
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, ForeignKey, Enum as SQLEnum, JSON
+from sqlalchemy import Boolean, Column, Integer, String, Numeric, DateTime, ForeignKey, Index, false, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 
-from src.database import Base
+from src.database import Base, matches_postgresql_info
+from src.models.booking_passenger_model import BookingPassenger
 
 
 class BookingStatus(str, enum.Enum):
@@ -17,25 +18,78 @@ class BookingStatus(str, enum.Enum):
     PENDING = "PENDING"
     CONFIRMED = "CONFIRMED"
     CANCELLED = "CANCELLED"
+    EXPIRED = "EXPIRED"  # PENDING hold not confirmed within BOOKING_HOLD_TTL_MINUTES
 
 
 class Booking(Base):
-    """Booking model for database storage."""
+    """
+    Booking model for database storage.
+    
+    On PostgreSQL the table is range-partitioned by month on created_at
+    (see services.booking_partitions), so every unique key includes
+    created_at and no other table has a foreign key to it. Elsewhere it is
+    a plain table and keeps its single-column keys.
+    """
     
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Public booking reference; on PostgreSQL unique per partition key as
+        # partitioning requires, elsewhere globally unique
+        Index(
+            "ix_bookings_booking_id", "booking_id", "created_at", unique=True, info={"postgresql": True}
+        ).ddl_if(callable_=matches_postgresql_info),
+        Index(
+            "ix_bookings_booking_id", "booking_id", unique=True, info={"postgresql": False}
+        ).ddl_if(callable_=matches_postgresql_info),
+        # Serves the hold sweeper:
+        # WHERE status = 'PENDING' AND seats_reserved AND created_at < :cutoff
+        Index("ix_bookings_status_reserved_created_at", "status", "seats_reserved", "created_at"),
+        # Serves a user's booking history newest first, paginated by (created_at, id);
+        # read backwards, so ORDER BY created_at DESC, id DESC needs no sort
+        Index("ix_bookings_user_created_id", "user_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    booking_id = Column(String, unique=True, index=True, nullable=False)
+    booking_id = Column(String, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     flight_id = Column(Integer, ForeignKey("flights.id"), nullable=False)
     status = Column(String, default="PENDING", nullable=False)
     total_price = Column(Numeric(10, 2), nullable=False)
-    passenger_data = Column(JSON, nullable=False)
+    seats = Column(Integer, nullable=False)  # Number of passengers; seats to release on cancel/expiry
+    # Whether ``seats`` were taken from the flight; false for bookings that predate reservation
+    seats_reserved = Column(Boolean, default=True, server_default=false(), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Row version for weak ETags; bumped by every UPDATE, including bulk ones
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
     user = relationship("User", backref="bookings")
     flight = relationship("Flight", backref="bookings")
+    passengers = relationship(
+        BookingPassenger,
+        primaryjoin="Booking.id == foreign(BookingPassenger.booking_id)",
+        order_by=BookingPassenger.position,
+        cascade="all, delete-orphan"
+    )
+    
+    @property
+    def passenger_data(self) -> dict:
+        """
+        Passengers and flight summary in the API's ``passenger_data`` shape.
+        
+        Reads the ``passengers`` and ``flight`` relationships, so load them
+        up front (BOOKING_DETAIL_OPTIONS) when building many bookings.
+        """
+        flight = self.flight
+        return {
+            "passengers": [p.to_dict() for p in self.passengers],
+            "flight_info": {
+                "flight_id": flight.flight_id,
+                "airline": flight.airline,
+                "origin": flight.origin,
+                "destination": flight.destination
+            }
+        }
     
     def __repr__(self):
         return f"<Booking(id={self.id}, booking_id={self.booking_id}, status={self.status})>"
@@ -0,0 +1,50 @@
+"""
+Booking passenger database model.
+
+SQLAlchemy model for booking_passengers table.
+"""
+
+from sqlalchemy import Column, Integer, String, ForeignKey, ForeignKeyConstraint, Index
+
+from src.database import Base, matches_postgresql_info
+
+
+class BookingPassenger(Base):
+    """One traveller on a booking, stored as a row instead of inside a JSON blob."""
+
+    __tablename__ = "booking_passengers"
+    __table_args__ = (
+        # Serves a booking's passenger list in entry order
+        Index("ix_booking_passengers_booking_position", "booking_id", "position"),
+        # Serves flight manifests in name order without a sort
+        Index("ix_booking_passengers_flight_name", "flight_id", "last_name", "first_name"),
+        # Serves passenger lookups by passport
+        Index("ix_booking_passengers_passport_number", "passport_number"),
+        # Partitioned bookings (PostgreSQL) have no unique key on id alone to reference
+        ForeignKeyConstraint(
+            ["booking_id"], ["bookings.id"], ondelete="CASCADE",
+            name="fk_booking_passengers_booking_id_bookings", info={"postgresql": False}
+        ).ddl_if(callable_=matches_postgresql_info),
+    )
+
+    id = Column(Integer, primary_key=True)
+    booking_id = Column(Integer, nullable=False)
+    # Copied from the booking so manifests need no join to find their rows
+    flight_id = Column(Integer, ForeignKey("flights.id"), nullable=False)
+    position = Column(Integer, nullable=False)  # Order within the booking request
+    first_name = Column(String, nullable=False)
+    last_name = Column(String, nullable=False)
+    passport_number = Column(String, nullable=False)
+    date_of_birth = Column(String, nullable=False)  # Format: YYYY-MM-DD
+
+    def to_dict(self) -> dict:
+        """Passenger fields in the booking request's PassengerInfo shape."""
+        return {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "passport_number": self.passport_number,
+            "date_of_birth": self.date_of_birth
+        }
+
+    def __repr__(self):
+        return f"<BookingPassenger(id={self.id}, booking_id={self.booking_id}, position={self.position})>"
@@ -4,14 +4,37 @@ Flight database model.
 SQLAlchemy model for flights table.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
+from sqlalchemy.orm import validates
 from src.database import Base
 
 
+def normalize_airport_code(code: Optional[str]) -> Optional[str]:
+    """
+    Normalize an airport code to its stored form (trimmed, upper-case).
+    
+    Args:
+        code: Airport code as entered (e.g., " lhe")
+        
+    Returns:
+        Normalized code (e.g., "LHE"), or None if no code was given
+    """
+    if code is None:
+        return None
+    return code.strip().upper()
+
+
 class Flight(Base):
     """Flight model for database storage."""
     
     __tablename__ = "flights"
+    __table_args__ = (
+        # Serves equality search on route, ordered by departure
+        Index("ix_flights_route_departure", "origin", "destination", "departure_time"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     flight_id = Column(String, unique=True, index=True, nullable=False)
@@ -23,6 +46,13 @@ class Flight(Base):
     price = Column(Float, nullable=False)
     currency = Column(String, default="USD", nullable=False)
     available_seats = Column(Integer, nullable=False)
+    # Change cursor for incremental readers (e.g. the search snapshot)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
+    
+    @validates("origin", "destination")
+    def validate_airport_code(self, key: str, code: str) -> str:
+        """Store airport codes upper-case so search can use equality predicates."""
+        return normalize_airport_code(code)
     
     def __repr__(self):
         return f"<Flight(id={self.id}, flight_id={self.flight_id}, route={self.origin}-{self.destination})>"
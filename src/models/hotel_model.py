@@ -0,0 +1,44 @@
+"""
+Hotel database model.
+
+SQLAlchemy model for hotels table.
+"""
+
+from sqlalchemy import Column, Integer, String, Float, Numeric, Index, func, text
+from src.database import Base
+
+
+def normalize_city(city: str) -> str:
+    """
+    Normalize a city name for case-insensitive lookup.
+    
+    Args:
+        city: City name as entered (e.g., " Dubai")
+        
+    Returns:
+        Lookup key matching ``lower(city)`` (e.g., "dubai")
+    """
+    return city.strip().lower()
+
+
+class Hotel(Base):
+    """Hotel model for database storage."""
+    
+    __tablename__ = "hotels"
+    __table_args__ = (
+        # Serves case-insensitive city search: WHERE lower(city) = :city
+        Index("ix_hotels_city_lower", func.lower(text("city"))),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    hotel_id = Column(String, unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    city = Column(String, nullable=False)
+    address = Column(String, nullable=False)
+    rating = Column(Float, nullable=False)
+    price_per_night = Column(Numeric(10, 2), nullable=False)
+    currency = Column(String, default="USD", nullable=False)
+    available_rooms = Column(Integer, nullable=False)
+    
+    def __repr__(self):
+        return f"<Hotel(id={self.id}, hotel_id={self.hotel_id}, city={self.city})>"
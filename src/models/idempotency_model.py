@@ -0,0 +1,31 @@
+"""
+Idempotency key database model.
+
+SQLAlchemy model for idempotency_keys table.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, UniqueConstraint
+from datetime import datetime
+
+from src.database import Base
+
+
+class IdempotencyKey(Base):
+    """Stored result of a request made with an Idempotency-Key header."""
+    
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        # Keys are scoped per user; also the lookup index for replays
+        UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_key"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    key = Column(String(255), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    request_hash = Column(String(64), nullable=False)  # SHA-256 hex of the request body
+    response_body = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    
+    def __repr__(self):
+        return f"<IdempotencyKey(id={self.id}, user_id={self.user_id}, key={self.key})>"
@@ -0,0 +1,34 @@
+"""
+Refresh token database model.
+
+SQLAlchemy model for refresh_tokens table.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from datetime import datetime
+
+from src.database import Base
+
+
+class RefreshToken(Base):
+    """
+    One refresh token of a login session, stored as a SHA-256 hash.
+    
+    Each use rotates the token: the old row is marked used and a new one is
+    issued in the same family. A used or revoked token presented again
+    means it leaked, and revokes the whole family.
+    """
+    
+    __tablename__ = "refresh_tokens"
+    
+    id = Column(Integer, primary_key=True)
+    token_hash = Column(String(64), nullable=False, unique=True)  # SHA-256 hex of the token
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    family_id = Column(String(32), nullable=False, index=True)  # Shared by every rotation of one login
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    used_at = Column(DateTime, nullable=True)  # Set when rotated
+    revoked_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<RefreshToken(id={self.id}, user_id={self.user_id}, family_id={self.family_id})>"
@@ -0,0 +1,30 @@
+"""
+Revoked token database model.
+
+SQLAlchemy model for revoked_tokens table.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from datetime import datetime
+
+from src.database import Base
+
+
+class RevokedToken(Base):
+    """
+    Revocation of one access token, or of every token a user was issued so far.
+    
+    Rows are only needed until the tokens they cover have expired; they are
+    then purged, which keeps the table (and its in-memory copy) small.
+    """
+    
+    __tablename__ = "revoked_tokens"
+    
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(64), nullable=True, unique=True)  # Token ID; NULL revokes all of the user's tokens
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # User-wide: tokens issued up to here
+    expires_at = Column(DateTime, nullable=False, index=True)  # When every covered token has expired
+    
+    def __repr__(self):
+        return f"<RevokedToken(id={self.id}, user_id={self.user_id}, jti={self.jti})>"
@@ -4,7 +4,9 @@ User database model.
 SQLAlchemy model for users table.
 """
 
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from datetime import datetime
+
 from src.database import Base
 
 
@@ -18,6 +20,8 @@ class User(Base):
     full_name = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    # Row version for weak ETags on the profile
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email})>"
@@ -4,12 +4,110 @@ Booking repository for database operations.
 Handles CRUD operations for Booking model.
 """
 
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import Row, Select, select, true, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional, Tuple
 from datetime import datetime
 import uuid
 
 from src.models.booking_model import Booking, BookingStatus
+from src.models.booking_passenger_model import BookingPassenger
+from src.models.flight_model import Flight
+
+# Columns of the booking list "summary" view (everything but passenger_data)
+BOOKING_SUMMARY_COLUMNS = (
+    Booking.id,
+    Booking.user_id,
+    Booking.flight_id,
+    Booking.status,
+    Booking.total_price,
+    Booking.created_at,
+)
+
+# Loader options for building full bookings (passenger_data) without lazy loads
+BOOKING_DETAIL_OPTIONS = (
+    selectinload(Booking.passengers),
+    selectinload(Booking.flight),
+)
+
+
+def build_booking(
+    user_id: int,
+    flight_id: int,
+    total_price: float,
+    passengers: List[dict],
+    created_at: datetime,
+    flight: Optional[Flight] = None
+) -> Booking:
+    """
+    Build a PENDING booking with its passenger rows, ready to be added.
+    
+    The passenger rows are inserted with the booking in the same flush, as
+    one multi-row INSERT per flush.
+    
+    Args:
+        user_id: ID of the user creating the booking
+        flight_id: ID of the flight to book
+        total_price: Calculated total price
+        passengers: Passenger dicts (first_name, last_name, passport_number, date_of_birth)
+        created_at: Creation timestamp
+        flight: Already loaded flight (optional), so passenger_data needs no query
+        
+    Returns:
+        New, unsaved booking object
+    """
+    db_booking = Booking(
+        booking_id=str(uuid.uuid4()),
+        user_id=user_id,
+        flight_id=flight_id,
+        status=BookingStatus.PENDING,
+        total_price=total_price,
+        seats=len(passengers),
+        created_at=created_at,
+        passengers=[
+            BookingPassenger(flight_id=flight_id, position=position, **passenger)
+            for position, passenger in enumerate(passengers)
+        ]
+    )
+    if flight is not None:
+        db_booking.flight = flight
+    return db_booking
+
+
+def build_user_bookings_query(
+    user_id: int,
+    limit: int,
+    status: Optional[str] = None,
+    after: Optional[Tuple[datetime, int]] = None,
+    summary: bool = False
+) -> Select:
+    """
+    Build one page of a user's booking history, newest first.
+    
+    Served by ix_bookings_user_created_id; fetches one row past ``limit`` so
+    the caller can tell whether another page exists.
+    
+    Args:
+        user_id: User's database ID
+        limit: Page size
+        status: Only bookings with this status (optional)
+        after: Keyset position (created_at, id) of the previous page's last row
+        summary: Select BOOKING_SUMMARY_COLUMNS rows instead of Booking objects
+        
+    Returns:
+        SELECT statement for the page
+    """
+    if summary:
+        query = select(*BOOKING_SUMMARY_COLUMNS)
+    else:
+        query = select(Booking).options(*BOOKING_DETAIL_OPTIONS)
+    query = query.where(Booking.user_id == user_id)
+    if status:
+        query = query.where(Booking.status == status)
+    if after:
+        query = query.where(tuple_(Booking.created_at, Booking.id) < after)
+    return query.order_by(Booking.created_at.desc(), Booking.id.desc()).limit(limit + 1)
 
 
 class BookingRepository:
@@ -29,60 +127,136 @@ class BookingRepository:
         user_id: int,
         flight_id: int,
         total_price: float,
-        passenger_data: dict
+        passengers: List[dict],
+        flight: Optional[Flight] = None
     ) -> Booking:
         """
-        Create a new booking.
+        Create a new booking and its passenger rows.
         
         Args:
             user_id: ID of the user creating the booking
             flight_id: ID of the flight to book
             total_price: Calculated total price
-            passenger_data: JSON data with passenger information
+            passengers: Passenger dicts, in request order
+            flight: Already loaded flight (optional)
             
         Returns:
             Created booking object
         """
-        db_booking = Booking(
-            booking_id=str(uuid.uuid4()),
-            user_id=user_id,
-            flight_id=flight_id,
-            status=BookingStatus.PENDING,
-            total_price=total_price,
-            passenger_data=passenger_data,
-            created_at=datetime.utcnow()
-        )
+        db_booking = build_booking(user_id, flight_id, total_price, passengers, datetime.utcnow(), flight)
         self.db.add(db_booking)
         self.db.flush()
         return db_booking
     
-    def get_by_id(self, booking_id: int) -> Optional[Booking]:
+    def create_many(self, bookings: List[dict]) -> List[Booking]:
+        """
+        Create several bookings and all their passengers with a single flush.
+        
+        Args:
+            bookings: Dicts with user_id, flight_id, total_price, passengers
+                and optionally the loaded flight
+            
+        Returns:
+            Created booking objects, in input order
+        """
+        created_at = datetime.utcnow()
+        db_bookings = [build_booking(created_at=created_at, **booking) for booking in bookings]
+        self.db.add_all(db_bookings)
+        self.db.flush()
+        return db_bookings
+    
+    def get_by_id(self, booking_id: int, details: bool = False) -> Optional[Booking]:
         """
         Get booking by ID.
         
         Args:
             booking_id: Booking ID
+            details: Also load passengers and flight (for passenger_data)
             
         Returns:
             Booking object if found, None otherwise
         """
-        return self.db.query(Booking).filter(
-            Booking.id == booking_id
-        ).first()
+        query = self.db.query(Booking).filter(Booking.id == booking_id)
+        if details:
+            query = query.options(*BOOKING_DETAIL_OPTIONS)
+        return query.first()
     
-    def get_user_bookings(self, user_id: int) -> List[Booking]:
+    def get_version(self, booking_id: int, user_id: int) -> Optional[datetime]:
         """
-        Get all bookings for a user.
+        Get a user's booking's row version without loading the booking.
+        
+        Args:
+            booking_id: Booking ID
+            user_id: ID of the user who must own the booking
+            
+        Returns:
+            The booking's updated_at, or None if not found or not the user's
+        """
+        return self.db.scalar(
+            select(Booking.updated_at).where(Booking.id == booking_id, Booking.user_id == user_id)
+        )
+    
+    def get_flight_manifest(self, flight_id: int) -> List[Row]:
+        """
+        Get the passengers of a flight's active bookings, by name.
+        
+        Reads booking_passengers through ix_booking_passengers_flight_name
+        and joins each row to its booking by primary key for the status.
+        
+        Args:
+            flight_id: Flight database ID
+            
+        Returns:
+            Rows (booking_id, status, first_name, last_name, passport_number,
+            date_of_birth)
+        """
+        return list(self.db.execute(
+            select(
+                BookingPassenger.booking_id,
+                Booking.status,
+                BookingPassenger.first_name,
+                BookingPassenger.last_name,
+                BookingPassenger.passport_number,
+                BookingPassenger.date_of_birth
+            )
+            .join(Booking, Booking.id == BookingPassenger.booking_id)
+            .where(
+                BookingPassenger.flight_id == flight_id,
+                Booking.status.in_([BookingStatus.PENDING.value, BookingStatus.CONFIRMED.value])
+            )
+            .order_by(
+                BookingPassenger.last_name,
+                BookingPassenger.first_name,
+                BookingPassenger.booking_id,
+                BookingPassenger.position
+            )
+        ).all())
+    
+    def get_user_bookings(
+        self,
+        user_id: int,
+        limit: int,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        summary: bool = False
+    ) -> List:
+        """
+        Get one page of a user's bookings, newest first.
         
         Args:
             user_id: User's database ID
+            limit: Page size (one extra row is returned if more exist)
+            status: Only bookings with this status (optional)
+            after: Keyset position (created_at, id) to continue after
+            summary: Return BOOKING_SUMMARY_COLUMNS rows instead of Booking objects
             
         Returns:
-            List of user's bookings
+            List of bookings or summary rows
         """
-        return self.db.query(Booking).filter(
-            Booking.user_id == user_id
-        ).order_by(Booking.created_at.desc()).all()
+        query = build_user_bookings_query(user_id, limit, status, after, summary)
+        if summary:
+            return list(self.db.execute(query).all())
+        return list(self.db.scalars(query).all())
     
     def update_status(
         self,
@@ -105,6 +279,88 @@ class BookingRepository:
             self.db.flush()
         return booking
     
+    def cancel(self, booking_id: int, user_id: int) -> Optional[Booking]:
+        """
+        Cancel a user's active booking with one guarded UPDATE ... RETURNING.
+        
+        Args:
+            booking_id: Booking ID
+            user_id: ID of the user who must own the booking
+            
+        Returns:
+            The cancelled booking, or None if the booking does not exist,
+            belongs to another user or is not active
+        """
+        return self.db.scalars(
+            update(Booking)
+            .where(
+                Booking.id == booking_id,
+                Booking.user_id == user_id,
+                Booking.status.in_([BookingStatus.PENDING.value, BookingStatus.CONFIRMED.value])
+            )
+            .values(status=BookingStatus.CANCELLED.value)
+            .returning(Booking)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).first()
+    
+    def transition_status(self, booking_id: int, from_status: str, to_status: str) -> bool:
+        """
+        Change a booking's status only if it still has the expected status.
+        
+        Args:
+            booking_id: Booking ID
+            from_status: Status the booking must currently have
+            to_status: New status value
+            
+        Returns:
+            True if the booking was updated, False if its status had changed
+        """
+        result = self.db.execute(
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status == from_status)
+            .values(status=to_status)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount == 1
+    
+    def expire_pending(self, cutoff: datetime, limit: int) -> List[Row]:
+        """
+        Mark the oldest PENDING bookings created before ``cutoff`` as EXPIRED.
+        
+        Only bookings that reserved their seats are expired; older bookings
+        never took seats from the flight, so there is nothing to release.
+        Candidates are read through ix_bookings_status_reserved_created_at. On
+        PostgreSQL rows locked by another sweeper or a concurrent
+        confirm/cancel are skipped, and the UPDATE re-checks the status.
+        
+        Args:
+            cutoff: Bookings created before this time have expired
+            limit: Maximum bookings to expire in this batch
+            
+        Returns:
+            Rows (id, flight_id, seats) of the expired bookings
+        """
+        stale_ids = self.db.scalars(
+            select(Booking.id)
+            .where(
+                Booking.status == BookingStatus.PENDING.value,
+                Booking.seats_reserved == true(),
+                Booking.created_at < cutoff
+            )
+            .order_by(Booking.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not stale_ids:
+            return []
+        return self.db.execute(
+            update(Booking)
+            .where(Booking.id.in_(stale_ids), Booking.status == BookingStatus.PENDING.value)
+            .values(status=BookingStatus.EXPIRED.value)
+            .returning(Booking.id, Booking.flight_id, Booking.seats)
+            .execution_options(synchronize_session=False)
+        ).all()
+    
     def delete(self, booking_id: int) -> bool:
         """
         Delete a booking.
@@ -121,3 +377,140 @@ class BookingRepository:
             self.db.flush()
             return True
         return False
+
+
+class AsyncBookingRepository:
+    """Repository for Booking database operations on an AsyncSession."""
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+    
+    async def create(
+        self,
+        user_id: int,
+        flight_id: int,
+        total_price: float,
+        passengers: List[dict],
+        flight: Optional[Flight] = None
+    ) -> Booking:
+        """
+        Create a new booking and its passenger rows.
+        
+        Args:
+            user_id: ID of the user creating the booking
+            flight_id: ID of the flight to book
+            total_price: Calculated total price
+            passengers: Passenger dicts, in request order
+            flight: Already loaded flight (optional)
+            
+        Returns:
+            Created booking object
+        """
+        db_booking = build_booking(user_id, flight_id, total_price, passengers, datetime.utcnow(), flight)
+        self.db.add(db_booking)
+        await self.db.flush()
+        return db_booking
+    
+    async def get_by_id(self, booking_id: int, details: bool = False) -> Optional[Booking]:
+        """
+        Get booking by ID.
+        
+        Args:
+            booking_id: Booking ID
+            details: Also load passengers and flight (for passenger_data)
+            
+        Returns:
+            Booking object if found, None otherwise
+        """
+        if details:
+            return await self.db.scalar(
+                select(Booking).where(Booking.id == booking_id).options(*BOOKING_DETAIL_OPTIONS)
+            )
+        return await self.db.get(Booking, booking_id)
+    
+    async def get_version(self, booking_id: int, user_id: int) -> Optional[datetime]:
+        """
+        Get a user's booking's row version without loading the booking.
+        
+        Args:
+            booking_id: Booking ID
+            user_id: ID of the user who must own the booking
+            
+        Returns:
+            The booking's updated_at, or None if not found or not the user's
+        """
+        return await self.db.scalar(
+            select(Booking.updated_at).where(Booking.id == booking_id, Booking.user_id == user_id)
+        )
+    
+    async def get_user_bookings(
+        self,
+        user_id: int,
+        limit: int,
+        status: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        summary: bool = False
+    ) -> List:
+        """
+        Get one page of a user's bookings, newest first.
+        
+        Args:
+            user_id: User's database ID
+            limit: Page size (one extra row is returned if more exist)
+            status: Only bookings with this status (optional)
+            after: Keyset position (created_at, id) to continue after
+            summary: Return BOOKING_SUMMARY_COLUMNS rows instead of Booking objects
+            
+        Returns:
+            List of bookings or summary rows
+        """
+        query = build_user_bookings_query(user_id, limit, status, after, summary)
+        if summary:
+            result = await self.db.execute(query)
+            return list(result.all())
+        result = await self.db.scalars(query)
+        return list(result.all())
+    
+    async def update_status(
+        self,
+        booking_id: int,
+        new_status: str
+    ) -> Booking:
+        """
+        Update booking status.
+        
+        Args:
+            booking_id: Booking ID
+            new_status: New status value
+            
+        Returns:
+            Updated booking
+        """
+        booking = await self.get_by_id(booking_id)
+        if booking:
+            booking.status = new_status
+            await self.db.flush()
+        return booking
+    
+    async def delete(self, booking_id: int) -> bool:
+        """
+        Delete a booking.
+        
+        Args:
+            booking_id: Booking ID
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        booking = await self.get_by_id(booking_id)
+        if booking:
+            await self.db.delete(booking)
+            await self.db.flush()
+            return True
+        return False
@@ -0,0 +1,81 @@
+"""
+Flight repository for database operations.
+
+Handles seat inventory updates for the Flight model.
+"""
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from src.models.flight_model import Flight
+
+
+class FlightRepository:
+    """Repository for Flight database operations."""
+
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def exists(self, flight_id: int) -> bool:
+        """
+        Check if a flight exists.
+
+        Args:
+            flight_id: Flight database ID
+
+        Returns:
+            True if the flight exists, False otherwise
+        """
+        return self.db.execute(select(Flight.id).where(Flight.id == flight_id)).first() is not None
+
+    def reserve_seats(self, flight_id: int, seats: int) -> Optional[Flight]:
+        """
+        Take seats from a flight's inventory if enough remain.
+
+        The availability check and the decrement are one conditional UPDATE,
+        so concurrent reservations cannot oversell: the database row lock
+        serializes them and each re-checks ``available_seats >= seats``.
+
+        Args:
+            flight_id: Flight database ID
+            seats: Number of seats to take
+
+        Returns:
+            The updated flight (loaded from RETURNING, so bookings can
+            reference it without another query), or None if the flight does
+            not exist or has too few seats
+        """
+        return self.db.scalars(
+            update(Flight)
+            .where(Flight.id == flight_id, Flight.available_seats >= seats)
+            .values(available_seats=Flight.available_seats - seats)
+            .returning(Flight)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).first()
+
+    def release_seats(self, flight_id: int, seats: int) -> Optional[Flight]:
+        """
+        Return seats to a flight's inventory.
+
+        Args:
+            flight_id: Flight database ID
+            seats: Number of seats to give back
+
+        Returns:
+            The updated flight (loaded from RETURNING), or None if the flight
+            does not exist
+        """
+        return self.db.scalars(
+            update(Flight)
+            .where(Flight.id == flight_id)
+            .values(available_seats=Flight.available_seats + seats)
+            .returning(Flight)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).first()
@@ -0,0 +1,99 @@
+"""
+Idempotency key repository for database operations.
+
+Handles storage and lookup of replayable request results.
+"""
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime
+
+from src.models.idempotency_model import IdempotencyKey
+
+
+class IdempotencyRepository:
+    """Repository for IdempotencyKey database operations."""
+    
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+    
+    def get(self, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        """
+        Get a stored key for a user.
+        
+        Args:
+            user_id: ID of the user who sent the key
+            key: Idempotency-Key header value
+            
+        Returns:
+            IdempotencyKey object if found (expired or not), None otherwise
+        """
+        return self.db.scalars(
+            select(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key
+            )
+        ).first()
+    
+    def create(
+        self,
+        user_id: int,
+        key: str,
+        request_hash: str,
+        response_body: dict,
+        expires_at: datetime
+    ) -> IdempotencyKey:
+        """
+        Store the result of a request.
+        
+        Args:
+            user_id: ID of the user who sent the key
+            key: Idempotency-Key header value
+            request_hash: SHA-256 hex digest of the request body
+            response_body: JSON response to replay
+            expires_at: When the key may be reused
+            
+        Returns:
+            Created IdempotencyKey object
+        """
+        record = IdempotencyKey(
+            key=key,
+            user_id=user_id,
+            request_hash=request_hash,
+            response_body=response_body,
+            created_at=datetime.utcnow(),
+            expires_at=expires_at
+        )
+        self.db.add(record)
+        self.db.flush()
+        return record
+    
+    def delete(self, record: IdempotencyKey) -> None:
+        """
+        Delete a stored key.
+        
+        Args:
+            record: IdempotencyKey object to delete
+        """
+        self.db.delete(record)
+        self.db.flush()
+    
+    def delete_expired(self, now: datetime) -> int:
+        """
+        Delete every key that expired before ``now``.
+        
+        Args:
+            now: Current UTC time
+            
+        Returns:
+            Number of keys deleted
+        """
+        result = self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now))
+        return result.rowcount
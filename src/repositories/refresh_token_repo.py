@@ -0,0 +1,147 @@
+"""
+Refresh token repository for database operations.
+
+Handles issuing, rotating and revoking hashed refresh tokens.
+"""
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime
+
+from src.models.refresh_token_model import RefreshToken
+
+
+class RefreshTokenRepository:
+    """Repository for RefreshToken database operations."""
+    
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+    
+    def create(
+        self,
+        token_hash: str,
+        user_id: int,
+        family_id: str,
+        created_at: datetime,
+        expires_at: datetime
+    ) -> RefreshToken:
+        """
+        Store a new refresh token.
+        
+        Args:
+            token_hash: SHA-256 hex digest of the token
+            user_id: ID of the token owner
+            family_id: Login session the token belongs to
+            created_at: When the token was issued
+            expires_at: When the token stops being accepted
+            
+        Returns:
+            Created RefreshToken object
+        """
+        record = RefreshToken(
+            token_hash=token_hash,
+            user_id=user_id,
+            family_id=family_id,
+            created_at=created_at,
+            expires_at=expires_at
+        )
+        self.db.add(record)
+        self.db.flush()
+        return record
+    
+    def get_by_hash(self, token_hash: str) -> Optional[RefreshToken]:
+        """
+        Get a refresh token by its hash.
+        
+        Args:
+            token_hash: SHA-256 hex digest of the token
+            
+        Returns:
+            RefreshToken object if found, None otherwise
+        """
+        return self.db.scalars(select(RefreshToken).where(RefreshToken.token_hash == token_hash)).first()
+    
+    def mark_used(self, token_id: int, now: datetime) -> bool:
+        """
+        Consume a refresh token with one guarded UPDATE.
+        
+        Args:
+            token_id: RefreshToken ID
+            now: Current UTC time
+            
+        Returns:
+            True if the token was unused and not revoked, False otherwise
+            (including when a concurrent request consumed it first)
+        """
+        result = self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.id == token_id,
+                RefreshToken.used_at.is_(None),
+                RefreshToken.revoked_at.is_(None)
+            )
+            .values(used_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+    
+    def revoke_family(self, family_id: str, now: datetime) -> int:
+        """
+        Revoke every token of a login session.
+        
+        Args:
+            family_id: Login session to revoke
+            now: Current UTC time
+            
+        Returns:
+            Number of tokens revoked
+        """
+        result = self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    def revoke_user(self, user_id: int, now: datetime) -> int:
+        """
+        Revoke every refresh token of a user.
+        
+        Args:
+            user_id: User's database ID
+            now: Current UTC time
+            
+        Returns:
+            Number of tokens revoked
+        """
+        result = self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    def delete_expired(self, user_id: int, now: datetime) -> int:
+        """
+        Delete a user's refresh tokens that have expired.
+        
+        Args:
+            user_id: User's database ID
+            now: Current UTC time
+            
+        Returns:
+            Number of tokens deleted
+        """
+        result = self.db.execute(
+            delete(RefreshToken).where(RefreshToken.user_id == user_id, RefreshToken.expires_at <= now)
+        )
+        return result.rowcount
@@ -0,0 +1,74 @@
+"""
+Revoked token repository for database operations.
+
+Handles storage, listing and purging of access token revocations.
+"""
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+
+from src.models.revoked_token_model import RevokedToken
+
+
+class RevokedTokenRepository:
+    """Repository for RevokedToken database operations."""
+    
+    def __init__(self, db: Session):
+        """
+        Initialize repository with database session.
+        
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+    
+    def create(
+        self,
+        user_id: int,
+        jti: Optional[str],
+        revoked_at: datetime,
+        expires_at: datetime
+    ) -> RevokedToken:
+        """
+        Record a revocation.
+        
+        Args:
+            user_id: ID of the token owner
+            jti: ID of the revoked token, or None to revoke all tokens issued up to ``revoked_at``
+            revoked_at: When the revocation was made
+            expires_at: When every covered token has expired
+            
+        Returns:
+            Created RevokedToken object
+        """
+        record = RevokedToken(jti=jti, user_id=user_id, revoked_at=revoked_at, expires_at=expires_at)
+        self.db.add(record)
+        self.db.flush()
+        return record
+    
+    def list_active(self, now: datetime) -> List[RevokedToken]:
+        """
+        List revocations that still cover unexpired tokens.
+        
+        Args:
+            now: Current UTC time
+            
+        Returns:
+            RevokedToken objects
+        """
+        return list(self.db.scalars(select(RevokedToken).where(RevokedToken.expires_at > now)))
+    
+    def delete_expired(self, now: datetime) -> int:
+        """
+        Delete revocations whose tokens have all expired.
+        
+        Args:
+            now: Current UTC time
+            
+        Returns:
+            Number of revocations deleted
+        """
+        result = self.db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+        return result.rowcount
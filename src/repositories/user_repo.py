@@ -4,6 +4,8 @@ User repository for database operations.
 Handles CRUD operations for User model.
 """
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 
@@ -80,3 +82,113 @@ class UserRepository:
             True if user exists, False otherwise
         """
         return self.db.query(User).filter(User.email == email).first() is not None
+    
+    def set_active(self, user_id: int, is_active: bool) -> Optional[User]:
+        """
+        Activate or deactivate a user.
+        
+        Args:
+            user_id: User's database ID
+            is_active: New active flag
+            
+        Returns:
+            Updated user object if found, None otherwise
+        """
+        db_user = self.get_by_id(user_id)
+        if db_user is None:
+            return None
+        db_user.is_active = is_active
+        self.db.commit()
+        self.db.refresh(db_user)
+        return db_user
+
+
+class AsyncUserRepository:
+    """Repository for User database operations on an AsyncSession."""
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize repository with async database session.
+        
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+    
+    async def create(self, user_data: UserRegister, hashed_password: str) -> User:
+        """
+        Create a new user.
+        
+        Args:
+            user_data: User registration data
+            hashed_password: Hashed password
+            
+        Returns:
+            Created user object
+        """
+        db_user = User(
+            email=user_data.email,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+            is_active=True
+        )
+        self.db.add(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """
+        Get user by email address.
+        
+        Args:
+            email: User's email address
+            
+        Returns:
+            User object if found, None otherwise
+        """
+        return await self.db.scalar(select(User).where(User.email == email))
+    
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """
+        Get user by ID.
+        
+        Args:
+            user_id: User's database ID
+            
+        Returns:
+            User object if found, None otherwise
+        """
+        return await self.db.get(User, user_id)
+    
+    async def exists_by_email(self, email: str) -> bool:
+        """
+        Check if user exists by email.
+        
+        Args:
+            email: Email to check
+            
+        Returns:
+            True if user exists, False otherwise
+        """
+        user_id = await self.db.scalar(select(User.id).where(User.email == email))
+        return user_id is not None
+    
+    async def set_active(self, user_id: int, is_active: bool) -> Optional[User]:
+        """
+        Activate or deactivate a user.
+        
+        Args:
+            user_id: User's database ID
+            is_active: New active flag
+            
+        Returns:
+            Updated user object if found, None otherwise
+        """
+        db_user = await self.get_by_id(user_id)
+        if db_user is None:
+            return None
+        db_user.is_active = is_active
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
@@ -2,20 +2,43 @@
 Authentication routes for user registration and login with database integration.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Request, Response, status, Depends
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing import Optional, Union
 
-from src.schemas.auth_schema import UserRegister, Token, User
+from src.auth.login_guard import LoginThrottled, login_guard
+from src.auth.security import PasswordHasherBusy
+from src.schemas.auth_schema import UserRegister, Token, TokenRefresh, User
 from src.services.auth_service import AuthService
-from src.database import get_db
+from src.database import get_session, run_in_session
+from src.dependencies import get_current_user, get_token_claims
+
+
+def hasher_busy(e: PasswordHasherBusy) -> HTTPException:
+    """Map a full password hashing pool to 503 so clients back off and retry."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"}
+    )
+
+
+def login_throttled(e: LoginThrottled) -> HTTPException:
+    """Map a throttled or shed login attempt to 429 with the time until it may be retried."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(e),
+        headers={"Retry-After": e.retry_after_header}
+    )
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: Union[Session, AsyncSession] = Depends(get_session)):
     """
     Register a new user.
     
@@ -27,13 +50,15 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
         Created user object
         
     Raises:
-        HTTPException: If email already registered
+        HTTPException: If email already registered, or 503 if password hashing is at capacity
     """
     try:
-        user = AuthService.register_user(db, user_data)
+        user = await AuthService.register_user(db, user_data)
         return user
     except HTTPException:
         raise
+    except PasswordHasherBusy as e:
+        raise hasher_busy(e) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -43,33 +68,105 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
 
 @router.post("/login", response_model=Token)
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
-    Login and receive JWT access token.
+    Login and receive JWT access token and refresh token.
+    
+    Attempts are throttled per client IP and per email from that IP, and
+    only a bounded number are verified at once, before any password hashing
+    is done.
     
     Args:
+        request: Incoming request (for the client IP)
         form_data: OAuth2 password form (username=email, password)
         db: Database session
         
     Returns:
-        JWT access token
+        JWT access token and refresh token
         
     Raises:
-        HTTPException: If credentials are invalid
+        HTTPException: If credentials are invalid, 429 if throttled or shed,
+            or 503 if password hashing is at capacity
     """
+    client_ip = request.client.host if request.client else None
     try:
-        access_token = AuthService.authenticate_user(
-            db,
-            form_data.username,
-            form_data.password
-        )
-        return Token(access_token=access_token, token_type="bearer")
+        async with login_guard.admit(client_ip, form_data.username):
+            return await AuthService.authenticate_user(
+                db,
+                form_data.username,
+                form_data.password
+            )
     except HTTPException:
         raise
+    except LoginThrottled as e:
+        raise login_throttled(e) from e
+    except PasswordHasherBusy as e:
+        raise hasher_busy(e) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Login failed: {str(e)}"
         ) from e
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    refresh_data: TokenRefresh,
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    Trade a refresh token for a new access token and refresh token.
+    
+    No password check (and no bcrypt) is involved. Each refresh token
+    works once; presenting a spent one revokes the whole session.
+    
+    Args:
+        refresh_data: Refresh token from login or the previous refresh
+        db: Database session
+        
+    Returns:
+        New JWT access token and refresh token
+        
+    Raises:
+        HTTPException: If the refresh token is invalid, expired, revoked or reused
+    """
+    try:
+        return await AuthService.refresh_session(db, refresh_data.refresh_token)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Refresh failed: {str(e)}"
+        ) from e
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    refresh_data: Optional[TokenRefresh] = None,
+    claims: dict = Depends(get_token_claims),
+    current_user: User = Depends(get_current_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    Revoke the access token sent with this request.
+    
+    If the session's refresh token is sent as well, the session is ended so
+    it can no longer be refreshed.
+    
+    Args:
+        refresh_data: Refresh token of the session (optional)
+        claims: Verified claims of the bearer token
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Empty 204 response
+    """
+    await AuthService.revoke_token(db, claims, current_user.id)
+    if refresh_data is not None:
+        await run_in_session(db, AuthService.end_refresh_session, refresh_data.refresh_token, current_user.id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,41 +2,92 @@
 Booking routes for creating and managing bookings.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Path
+from fastapi import APIRouter, HTTPException, Depends, Header, Response, status, Path
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing import List, Optional, Union
 
-from src.schemas.booking_schema import Booking, BookingCreate
+from src.config import settings
+from src.database import run_in_session
+from src.etag import etag_matches, not_modified, set_etag, weak_etag
+from src.schemas.booking_schema import Booking, BookingCreate, BookingJobStatus, GroupBookingCreate, ManifestEntry
 from src.schemas.auth_schema import User
-from src.services.booking_service import BookingService
-from src.dependencies import get_db, get_current_user
+from src.services.booking_queue import BookingQueueFull, booking_queue
+from src.services.booking_service import AsyncBookingService, BookingService, IdempotencyKeyReused
+from src.dependencies import get_session, get_current_active_user, require_manifest_key
 
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 
-@router.post("", response_model=Booking, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=Booking,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": BookingJobStatus}}
+)
 async def create_booking(
     booking_data: BookingCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    idempotency_key: Optional[str] = Header(
+        None,
+        max_length=255,
+        description="Client-chosen key; retries with the same key return the original booking"
+    ),
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
     Create a new booking (requires authentication).
     
+    With BOOKING_QUEUE_ENABLED, requests without an Idempotency-Key are
+    queued and answered with 202 and a Location to poll for the result.
+    
     Args:
         booking_data: Booking creation data
+        idempotency_key: Idempotency-Key header (optional)
         current_user: Current authenticated user
         db: Database session
         
     Returns:
-        Created booking object
+        Created booking object (the original one when a key is replayed),
+        or the queued job status
         
     Raises:
-        HTTPException: If booking creation fails
+        HTTPException: If the key was reused for another request, the queue
+            is full or booking creation fails
     """
+    if settings.BOOKING_QUEUE_ENABLED and not idempotency_key:
+        try:
+            job = booking_queue.submit(current_user.id, booking_data)
+        except BookingQueueFull as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": "1"}
+            ) from e
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            ) from e
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(job),
+            headers={"Location": f"{router.prefix}/jobs/{job.job_id}"}
+        )
+    
     try:
-        booking = BookingService.create_booking(db, booking_data, current_user.id)
+        booking = await run_in_session(
+            db, BookingService.create_booking, booking_data, current_user.id, idempotency_key
+        )
         return booking
+    except IdempotencyKeyReused as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        ) from e
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -49,33 +100,146 @@ async def create_booking(
         ) from e
 
 
+@router.post("/group", response_model=List[Booking], status_code=status.HTTP_201_CREATED)
+async def create_group_booking(
+    group_data: GroupBookingCreate,
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    Book several flights at once, all or nothing (requires authentication).
+    
+    Args:
+        group_data: Bookings to create together
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Created booking objects, in request order
+        
+    Raises:
+        HTTPException: If any booking cannot be made or creation fails
+    """
+    try:
+        return await run_in_session(db, BookingService.create_group_booking, group_data, current_user.id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Group booking failed: {str(e)}"
+        ) from e
+
+
+@router.get("/jobs/{job_id}", response_model=BookingJobStatus)
+async def get_booking_job(
+    job_id: str = Path(..., description="Job ID from the 202 response"),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Poll a queued booking request (requires authentication).
+    
+    Args:
+        job_id: Job identifier
+        current_user: Current authenticated user
+        
+    Returns:
+        Job status, with the booking once it is written
+        
+    Raises:
+        HTTPException: If the job is unknown, expired or belongs to another user
+    """
+    job = booking_queue.get_status(job_id, current_user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Booking job not found"
+        )
+    return job
+
+
+@router.get(
+    "/manifest/{flight_id}",
+    response_model=List[ManifestEntry],
+    dependencies=[Depends(require_manifest_key)]
+)
+async def get_flight_manifest(
+    flight_id: int = Path(..., description="Flight database ID"),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    List passengers on a flight's pending and confirmed bookings (staff only).
+    
+    Args:
+        flight_id: Flight database ID
+        db: Database session
+        
+    Returns:
+        Manifest entries ordered by passenger name
+        
+    Raises:
+        HTTPException: If the X-API-Key is wrong or the flight does not exist
+    """
+    manifest = await run_in_session(db, BookingService.get_flight_manifest, flight_id)
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Flight not found"
+        )
+    return manifest
+
+
 @router.get("/{booking_id}", response_model=Booking)
 async def get_booking(
+    response: Response,
     booking_id: int = Path(..., description="Booking ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None, description="ETag of the client's cached copy"),
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
     Get booking details by ID (requires authentication).
     
+    Responses carry a weak ETag; a request whose If-None-Match still matches
+    is answered 304 Not Modified after reading only the row version.
+    
     Args:
+        response: Outgoing response (carries the ETag header)
         booking_id: Booking identifier
+        if_none_match: If-None-Match header (optional)
         current_user: Current authenticated user
         db: Database session
         
     Returns:
-        Booking object
+        Booking object, or an empty 304 response
         
     Raises:
         HTTPException: If booking not found
     """
     try:
-        booking = BookingService.get_booking(db, booking_id, current_user.id)
+        if if_none_match:
+            if isinstance(db, AsyncSession):
+                version = await AsyncBookingService.get_booking_version(db, booking_id, current_user.id)
+            else:
+                version = BookingService.get_booking_version(db, booking_id, current_user.id)
+            if version is not None:
+                etag = weak_etag("booking", booking_id, version)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+        
+        if isinstance(db, AsyncSession):
+            booking = await AsyncBookingService.get_booking(db, booking_id, current_user.id)
+        else:
+            booking = BookingService.get_booking(db, booking_id, current_user.id)
         if not booking:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Booking not found"
             )
+        set_etag(response, weak_etag("booking", booking.id, booking.updated_at))
         return booking
     except HTTPException:
         raise
@@ -86,11 +250,53 @@ async def get_booking(
         ) from e
 
 
+@router.post("/{booking_id}/confirm", response_model=Booking)
+async def confirm_booking(
+    booking_id: int = Path(..., description="Booking ID"),
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    Confirm a pending booking before its seat hold expires (requires authentication).
+    
+    Args:
+        booking_id: Booking identifier
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Confirmed booking object
+        
+    Raises:
+        HTTPException: If booking not found, not pending or its hold expired
+    """
+    try:
+        booking = await run_in_session(db, BookingService.confirm_booking, booking_id, current_user.id)
+        if not booking:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Booking not found"
+            )
+        return booking
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Booking confirmation failed: {str(e)}"
+        ) from e
+
+
 @router.delete("/{booking_id}", response_model=Booking)
 async def cancel_booking(
     booking_id: int = Path(..., description="Booking ID"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
     Cancel a booking (requires authentication).
@@ -107,7 +313,7 @@ async def cancel_booking(
         HTTPException: If booking not found or cancellation fails
     """
     try:
-        booking = BookingService.cancel_booking(db, booking_id, current_user.id)
+        booking = await run_in_session(db, BookingService.cancel_booking, booking_id, current_user.id)
         if not booking:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
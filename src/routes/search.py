@@ -2,61 +2,279 @@
 Search routes for flights and hotels.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends, status
-from typing import List, Optional
+from datetime import date
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Iterator, List, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.schemas.search_schema import Flight, Hotel
-from src.services.search_service import SearchService
-from src.dependencies import get_db
+from src import database
+from src.config import settings
+from src.schemas.search_schema import ConnectionSearchParams, Flight, FlightSearchParams, Hotel, Itinerary
+from src.services.route_graph import RouteGraphNotLoaded
+from src.services.search_service import AsyncSearchService, SearchService, decode_cursor
+from src.dependencies import get_session
 
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _stream_flights(params: FlightSearchParams) -> Iterator[bytes]:
+    """
+    Stream search results on a session owned by the response body.
+    
+    Args:
+        params: Flight search parameters
+        
+    Yields:
+        NDJSON lines
+    """
+    db = database.SessionLocal()
+    try:
+        yield from SearchService.stream_flights(db, params)
+    finally:
+        db.close()
+
+
+async def _stream_flights_async(params: FlightSearchParams) -> AsyncIterator[bytes]:
+    """
+    Stream search results on an async session owned by the response body.
+    
+    Args:
+        params: Flight search parameters
+        
+    Yields:
+        NDJSON lines
+    """
+    async with database.AsyncSessionLocal() as db:
+        async for line in AsyncSearchService.stream_flights(db, params):
+            yield line
+
 
 @router.get("/flights", response_model=List[Flight])
 async def search_flights(
+    request: Request,
     origin: Optional[str] = Query(None, description="Origin airport code (e.g., JFK)"),
     destination: Optional[str] = Query(None, description="Destination airport code (e.g., LAX)"),
-    db: Session = Depends(get_db)
+    departure_date: Optional[date] = Query(None, description="Departure date (YYYY-MM-DD)"),
+    date_window_days: int = Query(0, ge=0, le=7, description="Also match flights +/- this many days"),
+    passengers: int = Query(1, ge=1, le=9, description="Minimum seats that must be available"),
+    limit: int = Query(
+        settings.SEARCH_PAGE_SIZE,
+        ge=1,
+        le=settings.SEARCH_MAX_PAGE_SIZE,
+        description="Maximum flights per page"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
-    Search for flights by origin and destination.
+    Search for flights by route, departure date window and seat availability.
+    
+    Results are ordered by departure time and paginated by keyset; when more
+    results exist, the cursor for the next page is sent in ``X-Next-Cursor``.
+    Clients sending ``Accept: application/x-ndjson`` instead receive every
+    match (starting after ``cursor``) streamed one flight per line.
     
     Args:
+        request: Incoming request (its Accept header selects streaming)
         origin: Origin airport code (optional)
         destination: Destination airport code (optional)
+        departure_date: Departure date (optional)
+        date_window_days: Days either side of departure_date to include
+        passengers: Number of seats required
+        limit: Page size
+        cursor: Continuation cursor (optional)
         db: Database session
         
     Returns:
         List of matching flights
+        
+    Raises:
+        HTTPException: If the cursor is invalid or search fails
     """
+    params = FlightSearchParams(
+        origin=origin,
+        destination=destination,
+        departure_date=departure_date,
+        date_window_days=date_window_days,
+        passengers=passengers,
+        limit=limit,
+        cursor=cursor
+    )
+    
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # Validate before streaming starts, while an error status can still be sent
+        if cursor:
+            try:
+                decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                ) from e
+        stream = _stream_flights_async(params) if isinstance(db, AsyncSession) else _stream_flights(params)
+        return StreamingResponse(stream, media_type=NDJSON_MEDIA_TYPE)
+    
     try:
-        flights = SearchService.search_flights(db, origin, destination)
-        return flights
+        if isinstance(db, AsyncSession):
+            page = await AsyncSearchService.search_flights(db, params)
+        else:
+            page = SearchService.search_flights(db, params)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Flight search failed: {str(e)}"
         ) from e
+    
+    # Page content is already JSON; skip response_model re-validation
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else None
+    return Response(content=page.content, media_type="application/json", headers=headers)
+
+
+@router.get("/flights/batch", response_model=List[Flight])
+async def get_flights_batch(
+    ids: str = Query(..., description="Comma-separated flight IDs (e.g., 3,1,7)"),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    Look up many flights by ID in one request.
+    
+    Args:
+        ids: Comma-separated flight database IDs
+        db: Database session
+        
+    Returns:
+        Found flights in request order; unknown IDs are omitted
+        
+    Raises:
+        HTTPException: If the IDs are malformed or too many are requested
+    """
+    try:
+        flight_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers"
+        ) from e
+    
+    if len(flight_ids) > settings.SEARCH_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.SEARCH_BATCH_MAX_IDS} flight IDs per request"
+        )
+    
+    if isinstance(db, AsyncSession):
+        return await AsyncSearchService.get_flights_by_ids(db, flight_ids)
+    return SearchService.get_flights_by_ids(db, flight_ids)
+
+
+@router.get("/flights/connections", response_model=List[Itinerary])
+async def search_connections(
+    origin: str = Query(..., description="Origin airport code (e.g., LHE)"),
+    destination: str = Query(..., description="Destination airport code (e.g., JFK)"),
+    departure_date: date = Query(..., description="Departure date of the first leg (YYYY-MM-DD)"),
+    date_window_days: int = Query(0, ge=0, le=7, description="Also depart +/- this many days"),
+    passengers: int = Query(1, ge=1, le=9, description="Seats required on every leg"),
+    max_stops: int = Query(1, ge=0, le=settings.CONNECTION_MAX_STOPS, description="Maximum connections"),
+    min_layover_minutes: int = Query(45, ge=0, description="Minimum connection time"),
+    max_layover_minutes: int = Query(720, ge=1, description="Maximum connection time"),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=settings.CONNECTION_MAX_RESULTS,
+        description="Maximum itineraries to return"
+    )
+):
+    """
+    Search for direct and connecting itineraries, earliest arrival first.
+    
+    Served from the in-memory route graph, so no database session is used.
+    
+    Args:
+        origin: Origin airport code
+        destination: Destination airport code
+        departure_date: Departure date of the first leg
+        date_window_days: Days either side of departure_date to include
+        passengers: Number of seats required on every leg
+        max_stops: Maximum number of connections
+        min_layover_minutes: Minimum time between landing and the next departure
+        max_layover_minutes: Maximum time between landing and the next departure
+        limit: Maximum itineraries to return
+        
+    Returns:
+        List of itineraries
+        
+    Raises:
+        HTTPException: 404 if connection search is disabled, 400 if the layover
+            bounds are inconsistent, 503 while the route graph is still loading
+            or 500 if search fails
+    """
+    if not settings.CONNECTION_SEARCH_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Connection search is not enabled"
+        )
+    if min_layover_minutes > max_layover_minutes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_layover_minutes cannot exceed max_layover_minutes"
+        )
+    
+    params = ConnectionSearchParams(
+        origin=origin,
+        destination=destination,
+        departure_date=departure_date,
+        date_window_days=date_window_days,
+        passengers=passengers,
+        max_stops=max_stops,
+        min_layover_minutes=min_layover_minutes,
+        max_layover_minutes=max_layover_minutes,
+        limit=limit
+    )
+    
+    try:
+        return SearchService.search_connections(params)
+    except RouteGraphNotLoaded as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Connection search failed: {str(e)}"
+        ) from e
 
 
 @router.get("/hotels", response_model=List[Hotel])
 async def search_hotels(
-    city: str = Query(..., description="City name (e.g., Dubai)")
+    city: str = Query(..., description="City name (e.g., Dubai)"),
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
-    Search for hotels by city.
+    Search for hotels by city (case-insensitive).
     
     Args:
         city: City name to search in
+        db: Database session
         
     Returns:
         List of matching hotels
     """
     try:
-        hotels = SearchService.search_hotels(city)
-        return hotels
+        if isinstance(db, AsyncSession):
+            return await AsyncSearchService.search_hotels(db, city)
+        return SearchService.search_hotels(db, city)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -2,48 +2,154 @@
 User profile routes with database integration.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional, Union
 
+from src.config import settings
+from src.etag import etag_matches, not_modified, set_etag, weak_etag
+from src.models.booking_model import BookingStatus
+from src.repositories.user_repo import AsyncUserRepository, UserRepository
 from src.schemas.auth_schema import User
-from src.schemas.booking_schema import Booking
-from src.services.booking_service import BookingService
+from src.schemas.booking_schema import Booking, BookingSummary
+from src.services.auth_service import AuthService
+from src.services.booking_service import AsyncBookingService, BookingService
 from src.dependencies import get_current_active_user
-from src.database import get_db
+from src.database import get_session
 
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/me", response_model=User)
-async def get_current_user_profile(current_user: User = Depends(get_current_active_user)):
+async def get_current_user_profile(
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="ETag of the client's cached copy"),
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
     """
     Get current user's profile (requires authentication).
     
+    The profile is read from the database rather than from the token's
+    claims, so it is current. Responses carry a weak ETag; a matching
+    If-None-Match is answered 304 Not Modified without serializing the
+    profile.
+    
     Args:
+        response: Outgoing response (carries the ETag header)
+        if_none_match: If-None-Match header (optional)
         current_user: Current authenticated user
+        db: Database session
         
     Returns:
-        User profile object
+        User profile object, or an empty 304 response
+        
+    Raises:
+        HTTPException: If the user no longer exists
     """
-    return current_user
+    if isinstance(db, AsyncSession):
+        db_user = await AsyncUserRepository(db).get_by_id(current_user.id)
+    else:
+        db_user = UserRepository(db).get_by_id(current_user.id)
+    if db_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    if db_user.updated_at is not None:
+        etag = weak_etag("user", db_user.id, db_user.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+    return User.model_validate(db_user)
 
 
-@router.get("/me/bookings", response_model=List[Booking])
+@router.get("/me/bookings", response_model=List[Union[Booking, BookingSummary]])
 async def get_user_bookings(
+    response: Response,
+    booking_status: Optional[BookingStatus] = Query(None, alias="status", description="Only bookings with this status"),
+    view: Literal["full", "summary"] = Query("full", description="'summary' omits passenger_data"),
+    limit: int = Query(
+        settings.BOOKINGS_PAGE_SIZE,
+        ge=1,
+        le=settings.BOOKINGS_MAX_PAGE_SIZE,
+        description="Maximum bookings per page"
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Union[Session, AsyncSession] = Depends(get_session)
 ):
     """
-    Get current user's booking history (requires authentication).
+    Get current user's booking history, newest first (requires authentication).
+    
+    Results are paginated by keyset; when more bookings exist, the cursor
+    for the next page is sent in ``X-Next-Cursor``.
     
     Args:
+        response: Outgoing response (carries the next-page cursor header)
+        booking_status: Status filter (optional)
+        view: "full" bookings or "summary" rows without passenger_data
+        limit: Page size
+        cursor: Continuation cursor (optional)
         current_user: Current authenticated user
         db: Database session
         
     Returns:
         List of user's bookings
+        
+    Raises:
+        HTTPException: If the cursor is invalid
+    """
+    options = dict(
+        status=booking_status.value if booking_status else None,
+        limit=limit,
+        cursor=cursor,
+        summary=view == "summary"
+    )
+    try:
+        if isinstance(db, AsyncSession):
+            page = await AsyncBookingService.get_user_bookings(db, current_user.id, **options)
+        else:
+            page = BookingService.get_user_bookings(db, current_user.id, **options)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return page.items
+
+
+@router.post("/me/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate_current_user(
+    current_user: User = Depends(get_current_active_user),
+    db: Union[Session, AsyncSession] = Depends(get_session)
+):
+    """
+    Deactivate the current user's account (requires authentication).
+    
+    Every access and refresh token issued to the user so far is revoked, so
+    the token used for this call stops working too, and later logins are
+    refused.
+    
+    Args:
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Empty 204 response
+        
+    Raises:
+        HTTPException: If the user no longer exists
     """
-    bookings = BookingService.get_user_bookings(db, current_user.id)
-    return bookings
+    if await AuthService.set_user_active(db, current_user.id, False) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,6 +2,7 @@
 Authentication request and response schemas.
 """
 
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr
 
@@ -23,6 +24,12 @@ class Token(BaseModel):
     """JWT token response schema."""
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None  # Exchange on /auth/refresh for a new pair
+
+
+class TokenRefresh(BaseModel):
+    """Refresh token request schema."""
+    refresh_token: str
 
 
 class TokenData(BaseModel):
@@ -36,6 +43,7 @@ class User(BaseModel):
     email: EmailStr
     full_name: str
     is_active: bool = True
+    updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
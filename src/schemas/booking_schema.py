@@ -4,7 +4,7 @@ Booking request and response schemas.
 
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Literal, Optional, List
+from typing import Literal, Optional, List, Union
 from decimal import Decimal
 
 
@@ -22,6 +22,11 @@ class BookingCreate(BaseModel):
     passengers: List[PassengerInfo]
 
 
+class GroupBookingCreate(BaseModel):
+    """Create several bookings (legs of a trip or sub-groups) in one request."""
+    bookings: List[BookingCreate]
+
+
 class Booking(BaseModel):
     """Booking response schema."""
     id: int
@@ -31,6 +36,47 @@ class Booking(BaseModel):
     total_price: float
     passenger_data: dict
     created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class BookingSummary(BaseModel):
+    """Booking list entry without passenger details."""
+    id: int
+    user_id: int
+    flight_id: int
+    status: str
+    total_price: float
+    created_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class ManifestEntry(BaseModel):
+    """One passenger on a flight manifest."""
+    booking_id: int
+    status: str
+    first_name: str
+    last_name: str
+    passport_number: str
+    date_of_birth: str
+
+    class Config:
+        from_attributes = True
+
+
+class BookingPage(BaseModel):
+    """One page of a user's bookings, newest first."""
+    items: List[Union[Booking, BookingSummary]]
+    next_cursor: Optional[str] = None  # Opaque keyset cursor for the next page
+
+
+class BookingJobStatus(BaseModel):
+    """Progress of a booking request accepted into the background queue."""
+    job_id: str
+    status: Literal["queued", "succeeded", "failed"]
+    booking: Optional[Booking] = None  # Set once the booking is written
+    error: Optional[str] = None  # Why the booking could not be made
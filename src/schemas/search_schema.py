@@ -4,16 +4,19 @@ Search request and response schemas for flights and hotels.
 
 from pydantic import BaseModel
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 
 class FlightSearchParams(BaseModel):
     """Flight search query parameters."""
-    origin: str
-    destination: str
+    origin: Optional[str] = None
+    destination: Optional[str] = None
     departure_date: Optional[date] = None
     return_date: Optional[date] = None
     passengers: int = 1
+    date_window_days: int = 0  # Also match +/- this many days around departure_date
+    limit: int = 50
+    cursor: Optional[str] = None  # Opaque keyset cursor from a previous page
 
 
 class Flight(BaseModel):
@@ -30,6 +33,36 @@ class Flight(BaseModel):
     available_seats: int
 
 
+class FlightSearchPage(BaseModel):
+    """One page of flight search results, serialized once."""
+    content: bytes  # JSON array of Flight objects
+    next_cursor: Optional[str] = None
+
+
+class ConnectionSearchParams(BaseModel):
+    """Connecting-flight search query parameters."""
+    origin: str
+    destination: str
+    departure_date: date
+    date_window_days: int = 0
+    passengers: int = 1
+    max_stops: int = 1
+    min_layover_minutes: int = 45
+    max_layover_minutes: int = 720
+    limit: int = 10
+
+
+class Itinerary(BaseModel):
+    """One or more connecting flights from origin to destination."""
+    legs: List[Flight]
+    stops: int
+    departure_time: str
+    arrival_time: str
+    duration_minutes: int
+    total_price: float
+    currency: str = "USD"
+
+
 class HotelSearchParams(BaseModel):
     """Hotel search query parameters."""
     city: str
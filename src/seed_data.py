@@ -1,11 +1,12 @@
 """
-Seed database with initial flight data for testing.
+Seed database with initial flight and hotel data for testing.
 """
 
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from src.database import SessionLocal
 from src.models.flight_model import Flight
+from src.models.hotel_model import Hotel
 
 
 def seed_flights():
@@ -250,5 +251,62 @@ def seed_flights():
         db.close()
 
 
+def seed_hotels():
+    """Add sample hotels to the database."""
+    db: Session = SessionLocal()
+    
+    try:
+        existing_ids = {h.hotel_id for h in db.query(Hotel.hotel_id).all()}
+        
+        all_hotels = [
+            Hotel(
+                hotel_id="HT001",
+                name="Burj Al Arab",
+                city="Dubai",
+                address="Jumeirah Street, Dubai",
+                rating=5.0,
+                price_per_night=1200.00,
+                available_rooms=15
+            ),
+            Hotel(
+                hotel_id="HT002",
+                name="Atlantis The Palm",
+                city="Dubai",
+                address="Crescent Road, Palm Jumeirah",
+                rating=4.8,
+                price_per_night=850.00,
+                available_rooms=32
+            ),
+            Hotel(
+                hotel_id="HT003",
+                name="Pearl Continental",
+                city="Lahore",
+                address="Shahrah-e-Quaid-e-Azam",
+                rating=4.5,
+                price_per_night=180.00,
+                available_rooms=45
+            ),
+        ]
+        
+        # Filter out hotels that already exist
+        hotels = [h for h in all_hotels if h.hotel_id not in existing_ids]
+        
+        if not hotels:
+            print("✓ All hotels already exist in database. No new hotels to add.")
+            return
+        
+        db.add_all(hotels)
+        db.commit()
+        print(f"✓ Successfully seeded {len(hotels)} new hotels into the database!")
+        
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error seeding database: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     seed_flights()
+    seed_hotels()
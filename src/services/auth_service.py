@@ -4,25 +4,46 @@ Authentication service with database integration.
 Handles user registration and authentication logic.
 """
 
+import hashlib
+import logging
+import secrets
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from typing import Optional, Tuple, Union
 
-from src.repositories.user_repo import UserRepository
-from src.schemas.auth_schema import UserRegister, User
-from src.auth.security import hash_password, verify_password
+from src.config import settings
+from src.database import release_connection, run_in_session
+from src.repositories.refresh_token_repo import RefreshTokenRepository
+from src.repositories.revoked_token_repo import RevokedTokenRepository
+from src.repositories.user_repo import AsyncUserRepository, UserRepository
+from src.schemas.auth_schema import Token, UserRegister, User
+from src.auth.security import hash_password_async, verify_password_async
 from src.auth.jwt_handler import create_access_token
+from src.auth.principal_cache import invalidate_user
+from src.auth.revocation import revocation_list, to_timestamp
+
+logger = logging.getLogger(__name__)
 
 
 class AuthService:
-    """Service for authentication operations."""
+    """
+    Service for authentication operations.
+    
+    Password hashing runs on the bounded bcrypt pool in src.auth.security, so
+    these methods are async and never block the event loop on bcrypt.
+    """
     
     @staticmethod
-    def register_user(db: Session, user_data: UserRegister) -> User:
+    async def register_user(db: Union[Session, AsyncSession], user_data: UserRegister) -> User:
         """
         Register a new user.
         
         Args:
-            db: Database session
+            db: Sync or async database session
             user_data: User registration data
             
         Returns:
@@ -30,48 +51,338 @@ class AuthService:
             
         Raises:
             HTTPException: If email already registered
+            PasswordHasherBusy: If the hashing pool is at capacity
         """
-        user_repo = UserRepository(db)
-        
         # Check if user already exists
-        if user_repo.exists_by_email(user_data.email):
+        if isinstance(db, AsyncSession):
+            exists = await AsyncUserRepository(db).exists_by_email(user_data.email)
+        else:
+            exists = UserRepository(db).exists_by_email(user_data.email)
+        if exists:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
-        # Hash password and create user
-        hashed_password = hash_password(user_data.password)
-        db_user = user_repo.create(user_data, hashed_password)
+        # Hash password off the event loop (without holding a pooled connection), then create user
+        await release_connection(db)
+        hashed_password = await hash_password_async(user_data.password)
+        if isinstance(db, AsyncSession):
+            db_user = await AsyncUserRepository(db).create(user_data, hashed_password)
+        else:
+            db_user = UserRepository(db).create(user_data, hashed_password)
         
         return User.model_validate(db_user)
     
     @staticmethod
-    def authenticate_user(db: Session, email: str, password: str) -> str:
+    async def authenticate_user(db: Union[Session, AsyncSession], email: str, password: str) -> Token:
         """
-        Authenticate user and return JWT token.
+        Authenticate user and return an access token and a refresh token.
         
         Args:
-            db: Database session
+            db: Sync or async database session
             email: User's email
             password: User's password
             
         Returns:
-            JWT access token
+            JWT access token and the first refresh token of a new session
             
         Raises:
-            HTTPException: If credentials are invalid
+            HTTPException: If credentials are invalid or the user is inactive
+            PasswordHasherBusy: If the hashing pool is at capacity
         """
-        user_repo = UserRepository(db)
-        db_user = user_repo.get_by_email(email)
+        if isinstance(db, AsyncSession):
+            db_user = await AsyncUserRepository(db).get_by_email(email)
+        else:
+            db_user = UserRepository(db).get_by_email(email)
         
-        if not db_user or not verify_password(password, db_user.hashed_password):
+        # Don't hold a pooled connection while bcrypt runs
+        await release_connection(db)
+        
+        if not db_user or not await verify_password_async(password, db_user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        if not db_user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Inactive user"
+            )
+        
+        # Create access token, and a refresh token so the session can be renewed without bcrypt
+        access_token = AuthService.issue_access_token(db_user)
+        refresh_token = await run_in_session(db, AuthService.issue_refresh_token, db_user.id)
+        return Token(access_token=access_token, refresh_token=refresh_token)
+    
+    @staticmethod
+    def issue_access_token(user: User) -> str:
+        """
+        Create an access token carrying every claim get_current_user needs.
+        
+        Args:
+            user: User the token is issued to (ORM object or schema)
+            
+        Returns:
+            JWT access token
+        """
+        return create_access_token(data={
+            "sub": user.email,
+            "uid": user.id,
+            "name": user.full_name,
+            "act": user.is_active
+        })
+    
+    @staticmethod
+    def hash_refresh_token(token: str) -> str:
+        """
+        Hash a refresh token for storage and lookup.
+        
+        Refresh tokens are long random strings, so a fast SHA-256 is enough;
+        unlike passwords they need no slow hash.
+        
+        Args:
+            token: Refresh token
+            
+        Returns:
+            SHA-256 hex digest
+        """
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def create_refresh_token(db: Session, user_id: int, family_id: str, now: datetime) -> str:
+        """
+        Store a new refresh token (the caller commits).
+        
+        Args:
+            db: Database session
+            user_id: ID of the token owner
+            family_id: Login session the token belongs to
+            now: Current UTC time
+            
+        Returns:
+            Refresh token (only its hash is stored)
+        """
+        token = secrets.token_urlsafe(32)
+        RefreshTokenRepository(db).create(
+            AuthService.hash_refresh_token(token),
+            user_id,
+            family_id,
+            now,
+            now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        )
+        return token
+    
+    @staticmethod
+    def issue_refresh_token(db: Session, user_id: int) -> str:
+        """
+        Start a new login session, purging the user's expired refresh tokens.
+        
+        Args:
+            db: Database session
+            user_id: ID of the user who logged in
+            
+        Returns:
+            Refresh token
+        """
+        now = datetime.utcnow()
+        RefreshTokenRepository(db).delete_expired(user_id, now)
+        token = AuthService.create_refresh_token(db, user_id, uuid.uuid4().hex, now)
+        db.commit()
+        return token
+    
+    @staticmethod
+    def rotate_refresh_token(db: Session, token: str) -> Optional[Tuple[User, str]]:
+        """
+        Consume a refresh token and issue its successor in the same session.
+        
+        A token that was already used or revoked is a leaked copy (either
+        the client or an attacker is replaying it), so its whole session is
+        revoked.
+        
+        Args:
+            db: Database session
+            token: Refresh token presented by the client
+            
+        Returns:
+            The user and the new refresh token, or None if the token is
+            unknown, expired, reused or belongs to an inactive user
+        """
+        now = datetime.utcnow()
+        repo = RefreshTokenRepository(db)
+        record = repo.get_by_hash(AuthService.hash_refresh_token(token))
+        if record is None or record.expires_at <= now or record.revoked_at is not None:
+            return None
+        
+        user_id, family_id = record.user_id, record.family_id
+        if not repo.mark_used(record.id, now):
+            repo.revoke_family(family_id, now)
+            db.commit()
+            logger.warning("Refresh token reuse for user %s; session %s revoked", user_id, family_id)
+            return None
+        
+        db_user = UserRepository(db).get_by_id(user_id)
+        if db_user is None or not db_user.is_active:
+            db.rollback()
+            return None
+        
+        user = User.model_validate(db_user)
+        new_token = AuthService.create_refresh_token(db, user_id, family_id, now)
+        db.commit()
+        return user, new_token
+    
+    @staticmethod
+    async def refresh_session(db: Union[Session, AsyncSession], token: str) -> Token:
+        """
+        Renew a session: rotate the refresh token and issue a new access token.
+        
+        Args:
+            db: Sync or async database session
+            token: Refresh token presented by the client
+            
+        Returns:
+            New access token and refresh token
+            
+        Raises:
+            HTTPException: If the refresh token is invalid, expired or reused
+        """
+        rotated = await run_in_session(db, AuthService.rotate_refresh_token, token)
+        if rotated is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user, refresh_token = rotated
+        return Token(access_token=AuthService.issue_access_token(user), refresh_token=refresh_token)
+    
+    @staticmethod
+    def end_refresh_session(db: Session, token: str, user_id: int) -> bool:
+        """
+        Revoke the login session a refresh token belongs to (e.g. on logout).
+        
+        Args:
+            db: Database session
+            token: Refresh token presented by the client
+            user_id: ID of the user who must own the token
+            
+        Returns:
+            True if a session of this user was found and revoked
+        """
+        repo = RefreshTokenRepository(db)
+        record = repo.get_by_hash(AuthService.hash_refresh_token(token))
+        if record is None or record.user_id != user_id:
+            return False
+        repo.revoke_family(record.family_id, datetime.utcnow())
+        db.commit()
+        return True
+    
+    @staticmethod
+    def revoke_refresh_tokens(db: Session, user_id: int) -> int:
+        """
+        Revoke every refresh token of a user.
+        
+        Args:
+            db: Database session
+            user_id: User's database ID
+            
+        Returns:
+            Number of tokens revoked
+        """
+        revoked = RefreshTokenRepository(db).revoke_user(user_id, datetime.utcnow())
+        db.commit()
+        return revoked
+    
+    @staticmethod
+    def record_revocation(
+        db: Session,
+        user_id: int,
+        jti: Optional[str],
+        revoked_at: datetime,
+        expires_at: datetime
+    ) -> None:
+        """
+        Store a revocation so other workers pick it up on their next sync.
+        
+        Args:
+            db: Database session
+            user_id: ID of the token owner
+            jti: Revoked token ID, or None to revoke every token issued up to ``revoked_at``
+            revoked_at: When the revocation was made
+            expires_at: When every covered token has expired
+        """
+        try:
+            RevokedTokenRepository(db).create(user_id, jti, revoked_at, expires_at)
+            db.commit()
+        except IntegrityError:
+            # The same token was revoked concurrently
+            db.rollback()
+    
+    @staticmethod
+    async def revoke_token(db: Union[Session, AsyncSession], claims: dict, user_id: int) -> bool:
+        """
+        Revoke one access token (e.g. on logout).
+        
+        Args:
+            db: Sync or async database session
+            claims: Verified claims of the token
+            user_id: ID of the token owner
+            
+        Returns:
+            False if the token has no ``jti`` and so cannot be revoked on its own
+        """
+        jti = claims.get("jti")
+        if jti is None:
+            return False
+        expires_at = float(claims["exp"])
+        await run_in_session(
+            db, AuthService.record_revocation,
+            user_id, jti, datetime.utcnow(), datetime.utcfromtimestamp(expires_at)
+        )
+        revocation_list.revoke_token(jti, expires_at)
+        return True
+    
+    @staticmethod
+    async def revoke_user_tokens(db: Union[Session, AsyncSession], user_id: int) -> None:
+        """
+        Revoke every access and refresh token issued to a user so far.
+        
+        Args:
+            db: Sync or async database session
+            user_id: User's database ID
+        """
+        revoked_at = datetime.utcnow()
+        expires_at = revoked_at + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        await run_in_session(db, AuthService.record_revocation, user_id, None, revoked_at, expires_at)
+        await run_in_session(db, AuthService.revoke_refresh_tokens, user_id)
+        revocation_list.revoke_user(user_id, to_timestamp(revoked_at), to_timestamp(expires_at))
+        invalidate_user(user_id)
+    
+    @staticmethod
+    async def set_user_active(db: Union[Session, AsyncSession], user_id: int, is_active: bool) -> Optional[User]:
+        """
+        Activate or deactivate a user.
+        
+        The user's existing tokens carry the old active flag, so they are all
+        revoked (and cached principals dropped): they stop working on this
+        worker at once, and on others after their next revocation sync.
+        
+        Args:
+            db: Sync or async database session
+            user_id: User's database ID
+            is_active: New active flag
+            
+        Returns:
+            Updated user object, or None if the user does not exist
+        """
+        if isinstance(db, AsyncSession):
+            db_user = await AsyncUserRepository(db).set_active(user_id, is_active)
+        else:
+            db_user = UserRepository(db).set_active(user_id, is_active)
+        if db_user is None:
+            return None
         
-        # Create access token
-        access_token = create_access_token(data={"sub": db_user.email})
-        return access_token
+        user = User.model_validate(db_user)
+        await AuthService.revoke_user_tokens(db, user_id)
+        return user
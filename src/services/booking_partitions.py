@@ -0,0 +1,251 @@
+"""
+Monthly range partitions of the bookings table (PostgreSQL only).
+
+The bookings migration turns ``bookings`` into a table partitioned by range on
+``created_at``, with one partition per calendar month named
+``bookings_yYYYYmMM`` and a ``bookings_default`` partition as a safety net.
+Bookings that landed in the default partition because their month was
+missing are moved into the month's partition when it is created.
+Each partition carries its own small copy of every booking index, so hot-path
+lookups and vacuum only touch recent months.
+
+A background job keeps ``BOOKING_PARTITION_MONTHS_AHEAD`` future months
+created and, when ``BOOKING_ARCHIVE_AFTER_MONTHS`` is set, detaches older
+months. Detached partitions stay in the database as standalone tables with
+the same name, so they can be dumped, moved or re-attached. Their bookings
+leave every API query. In the same transaction their passengers are moved
+out of ``booking_passengers`` into ``booking_passengers_yYYYYmMM``, so that
+table only holds passengers of attached bookings (move them back before
+re-attaching a month).
+
+On other databases (SQLite in development and tests) bookings is a plain
+table and every function here is a no-op.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src import database
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "bookings"
+
+DEFAULT_PARTITION = "bookings_default"
+
+PASSENGERS_TABLE = "booking_passengers"
+
+_PARTITION_NAME = re.compile(r"^bookings_y(\d{4})m(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    """Get the first day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift a month start by a (possibly negative) number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Get the partition table name for a month, e.g. ``bookings_y2026m10``."""
+    return f"{PARENT_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def passenger_archive_name(month: date) -> str:
+    """Get the table archived passengers of a month go to, e.g. ``booking_passengers_y2026m10``."""
+    return f"{PASSENGERS_TABLE}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """
+    Get the month a partition table holds.
+
+    Args:
+        name: Partition table name
+
+    Returns:
+        First day of the month, or None for names that are not monthly partitions
+    """
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def months_to_create(now: datetime, months_ahead: int) -> List[date]:
+    """
+    Get the months that must have a partition: this one and the next few.
+
+    Args:
+        now: Current UTC time
+        months_ahead: Future months to keep created
+
+    Returns:
+        Month starts, oldest first
+    """
+    current = month_start(now)
+    return [add_months(current, offset) for offset in range(max(months_ahead, 0) + 1)]
+
+
+def partitions_to_archive(names: Iterable[str], now: datetime, archive_after_months: int) -> List[str]:
+    """
+    Pick the monthly partitions older than the archive horizon.
+
+    Args:
+        names: Attached partition table names
+        now: Current UTC time
+        archive_after_months: Months before the current one to keep attached (0 keeps all)
+
+    Returns:
+        Partition names to detach, oldest first
+    """
+    if archive_after_months <= 0:
+        return []
+    horizon = add_months(month_start(now), -archive_after_months)
+    months = {name: partition_month(name) for name in names}
+    return sorted(name for name, month in months.items() if month is not None and month < horizon)
+
+
+def is_partitioned(db: Session) -> bool:
+    """
+    Check whether bookings is a partitioned table in this database.
+
+    Args:
+        db: Database session
+
+    Returns:
+        True on PostgreSQL once the partitioning migration has run
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return db.execute(
+        text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:parent)"),
+        {"parent": PARENT_TABLE}
+    ).first() is not None
+
+
+def attached_partitions(db: Session) -> List[str]:
+    """
+    List the partitions currently attached to bookings.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Partition table names
+    """
+    return list(db.scalars(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:parent)"
+        ),
+        {"parent": PARENT_TABLE}
+    ))
+
+
+def create_partitions(db: Session, now: Optional[datetime] = None) -> List[str]:
+    """
+    Create any missing partitions for this month and the months ahead.
+
+    PostgreSQL refuses to add a partition while the default partition holds
+    rows in its range, so each month is built as a standalone table, its rows
+    are moved out of the default partition, and then it is attached, all in
+    one transaction.
+
+    Args:
+        db: Database session
+        now: Current UTC time (defaults to utcnow)
+
+    Returns:
+        Names of the partitions created
+    """
+    existing = set(attached_partitions(db))
+    created = []
+    for month in months_to_create(now or datetime.utcnow(), settings.BOOKING_PARTITION_MONTHS_AHEAD):
+        name = partition_name(month)
+        if name in existing:
+            continue
+        # Names and bounds are generated here, never taken from input
+        start, end = month.isoformat(), add_months(month, 1).isoformat()
+        db.execute(text(
+            f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        ))
+        db.execute(text(
+            f"WITH moved AS ("
+            f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= '{start}' AND created_at < '{end}' RETURNING *"
+            f") INSERT INTO {name} SELECT * FROM moved"
+        ))
+        db.execute(text(
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')"
+        ))
+        db.commit()
+        created.append(name)
+    return created
+
+
+def archive_partitions(db: Session, now: Optional[datetime] = None) -> List[str]:
+    """
+    Detach partitions older than BOOKING_ARCHIVE_AFTER_MONTHS and archive their passengers.
+
+    Each month is detached and its passengers moved in one transaction.
+
+    Args:
+        db: Database session
+        now: Current UTC time (defaults to utcnow)
+
+    Returns:
+        Names of the partitions detached
+    """
+    names = partitions_to_archive(
+        attached_partitions(db), now or datetime.utcnow(), settings.BOOKING_ARCHIVE_AFTER_MONTHS
+    )
+    for name in names:
+        archive = passenger_archive_name(partition_month(name))
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        db.execute(text(f"CREATE TABLE IF NOT EXISTS {archive} (LIKE {PASSENGERS_TABLE})"))
+        db.execute(text(
+            f"WITH moved AS ("
+            f"DELETE FROM {PASSENGERS_TABLE} p USING {name} b WHERE p.booking_id = b.id RETURNING p.*"
+            f") INSERT INTO {archive} SELECT * FROM moved"
+        ))
+        db.commit()
+    return names
+
+
+def maintain_partitions() -> None:
+    """Create upcoming and archive old partitions on a session of its own."""
+    db = database.SessionLocal()
+    try:
+        if not is_partitioned(db):
+            return
+        created = create_partitions(db)
+        archived = archive_partitions(db)
+        if created or archived:
+            logger.info("Booking partitions created: %s; archived: %s", created, archived)
+    finally:
+        db.close()
+
+
+async def run_partition_maintainer(interval_seconds: float) -> None:
+    """
+    Maintain booking partitions periodically until cancelled.
+
+    Args:
+        interval_seconds: Delay between runs
+    """
+    while True:
+        try:
+            await asyncio.to_thread(maintain_partitions)
+        except Exception:
+            logger.exception("Booking partition maintenance failed")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,317 @@
+"""
+Background booking queue for absorbing bursts of booking requests.
+
+When enabled, ``POST /bookings`` validates the request, puts it on a bounded
+in-process queue and answers ``202 Accepted`` with a status URL. A pool of
+writer tasks drains the queue in batches: jobs for the same flight are booked
+together with one seat reservation, one multi-row insert and one commit, so a
+hot flight costs one row lock per batch instead of one per booking. If the
+combined reservation does not fit, the batch's jobs are retried one by one in
+arrival order so each gets its own answer.
+
+The queue and job statuses live in this process and are not durable. Run the
+API as a single worker process when the queue is enabled: a status poll that
+reaches another worker gets 404. On shutdown the queue stops taking jobs and
+its writers drain it for up to BOOKING_QUEUE_DRAIN_SECONDS; jobs still
+unwritten after that are marked failed. Writers call a ``processor`` function,
+so a durable broker with a shared status store can replace the in-process
+queue without changing the routes.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src import database
+from src.config import settings
+from src.schemas.booking_schema import BookingCreate, BookingJobStatus
+from src.services.booking_service import BookingService
+
+logger = logging.getLogger(__name__)
+
+
+class BookingJob(NamedTuple):
+    """One queued booking request."""
+    job_id: str
+    user_id: int
+    booking_data: BookingCreate
+
+
+class BookingQueueFull(Exception):
+    """Raised when the queue is at capacity and cannot take another booking."""
+
+
+def process_booking_batch(jobs: List[BookingJob]) -> Dict[str, BookingJobStatus]:
+    """
+    Write a batch of queued bookings on a session of its own.
+
+    Jobs are grouped by flight and each group is booked in one transaction.
+    A group that cannot be booked as a whole is retried job by job.
+
+    Args:
+        jobs: Queued jobs, in arrival order
+
+    Returns:
+        Final status of every job, keyed by job ID
+    """
+    by_flight: Dict[int, List[BookingJob]] = {}
+    for job in jobs:
+        by_flight.setdefault(job.booking_data.flight_id, []).append(job)
+
+    results: Dict[str, BookingJobStatus] = {}
+    db = database.SessionLocal()
+    try:
+        for group in by_flight.values():
+            if len(group) > 1:
+                try:
+                    bookings = BookingService.create_bookings(
+                        db, [(job.user_id, job.booking_data) for job in group]
+                    )
+                    for job, booking in zip(group, bookings):
+                        results[job.job_id] = BookingJobStatus(
+                            job_id=job.job_id, status="succeeded", booking=booking
+                        )
+                    continue
+                except ValueError:
+                    pass  # Not enough seats for all of them: book in arrival order
+                except Exception:
+                    logger.exception("Booking batch for flight %d failed", group[0].booking_data.flight_id)
+            for job in group:
+                results[job.job_id] = _book_one(db, job)
+    finally:
+        db.close()
+    return results
+
+
+def _book_one(db: Session, job: BookingJob) -> BookingJobStatus:
+    """Book a single job in its own transaction and describe the outcome."""
+    try:
+        booking = BookingService.create_bookings(db, [(job.user_id, job.booking_data)])[0]
+    except ValueError as e:
+        return BookingJobStatus(job_id=job.job_id, status="failed", error=str(e))
+    except Exception:
+        logger.exception("Queued booking %s failed", job.job_id)
+        return BookingJobStatus(job_id=job.job_id, status="failed", error="Booking creation failed")
+    return BookingJobStatus(job_id=job.job_id, status="succeeded", booking=booking)
+
+
+class BookingQueue:
+    """Bounded queue of booking requests drained by batch writer tasks."""
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        result_ttl_seconds: float,
+        max_results: int,
+        processor: Callable[[List[BookingJob]], Dict[str, BookingJobStatus]] = process_booking_batch,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an idle queue; call ``start`` to begin processing.
+
+        Args:
+            max_size: Queued jobs before ``submit`` refuses new ones
+            batch_size: Maximum jobs one writer takes per batch
+            result_ttl_seconds: How long a finished job's status stays available
+            max_results: Job statuses kept (at least ``max_size``) before ``submit``
+                refuses new jobs
+            processor: Function that writes a batch and returns job statuses
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_results = max(max_results, max_size)
+        self.processor = processor
+        self._clock = clock
+        self._queue: Optional[asyncio.Queue] = None
+        # job_id -> (user_id, status); nothing is evicted before it expires, so a
+        # client polling within the TTL always finds its job
+        self._results: Dict[str, Tuple[int, BookingJobStatus]] = {}
+        # (expires_at, job_id) of finished jobs; one TTL, so oldest first
+        self._expiry: Deque[Tuple[float, str]] = deque()
+        self.submitted = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether writers have been started."""
+        return self._queue is not None
+
+    def start(self, workers: int) -> List[asyncio.Task]:
+        """
+        Create the queue on the running event loop and start writer tasks.
+
+        Args:
+            workers: Number of writer tasks
+
+        Returns:
+            Writer tasks, to be cancelled on shutdown after ``stop``
+        """
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        return [asyncio.create_task(self.run_writer(self._queue)) for _ in range(workers)]
+
+    async def stop(self, timeout_seconds: float) -> None:
+        """
+        Stop accepting jobs and let the writers drain the queue.
+
+        Call before cancelling the writer tasks. Jobs not written within the
+        timeout are taken off the queue and marked failed, so their owners
+        see an answer rather than a job that stays queued.
+
+        Args:
+            timeout_seconds: Longest wait for the queued jobs to be written
+        """
+        queue, self._queue = self._queue, None
+        if queue is None:
+            return
+        try:
+            await asyncio.wait_for(queue.join(), timeout_seconds)
+            return
+        except asyncio.TimeoutError:
+            pass
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            queue.task_done()
+        for job_id, (user_id, status) in list(self._results.items()):
+            if status.status == "queued":
+                self._finish(job_id, user_id, BookingJobStatus(
+                    job_id=job_id, status="failed", error="Booking queue stopped before the booking was written"
+                ))
+        logger.warning("Booking queue stopped with unwritten jobs; they were marked failed")
+
+    def _purge_expired(self) -> None:
+        """Drop statuses of jobs that finished more than the TTL ago."""
+        now = self._clock()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, job_id = self._expiry.popleft()
+            self._results.pop(job_id, None)
+
+    def submit(self, user_id: int, booking_data: BookingCreate) -> BookingJobStatus:
+        """
+        Validate a booking request and queue it.
+
+        Args:
+            user_id: ID of the user creating the booking
+            booking_data: Booking creation data
+
+        Returns:
+            Queued job status, with the job ID to poll
+
+        Raises:
+            ValueError: If the request has no passengers
+            BookingQueueFull: If the queue or the status store is full, or not running
+        """
+        if not booking_data.passengers:
+            raise ValueError("At least one passenger is required")
+        queue = self._queue
+        if queue is None:
+            raise BookingQueueFull("Booking queue is not running")
+
+        self._purge_expired()
+        job = BookingJob(uuid.uuid4().hex, user_id, booking_data)
+        status = BookingJobStatus(job_id=job.job_id, status="queued")
+        try:
+            if len(self._results) >= self.max_results:
+                raise asyncio.QueueFull
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise BookingQueueFull("Booking queue is full") from None
+        self._results[job.job_id] = (user_id, status)
+        self.submitted += 1
+        return status
+
+    def get_status(self, job_id: str, user_id: int) -> Optional[BookingJobStatus]:
+        """
+        Look up a job's status for its owner.
+
+        Args:
+            job_id: Job ID returned by ``submit``
+            user_id: ID of the requesting user
+
+        Returns:
+            Job status, or None if unknown, expired or owned by another user
+        """
+        self._purge_expired()
+        entry = self._results.get(job_id)
+        if entry is None or entry[0] != user_id:
+            return None
+        return entry[1]
+
+    async def run_writer(self, queue: asyncio.Queue) -> None:
+        """
+        Drain the queue in batches until cancelled.
+
+        Args:
+            queue: Queue to drain
+        """
+        while True:
+            jobs = [await queue.get()]
+            while len(jobs) < self.batch_size:
+                try:
+                    jobs.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                results = await asyncio.to_thread(self.processor, jobs)
+            except Exception:
+                logger.exception("Booking batch of %d jobs failed", len(jobs))
+                results = {}
+            self.batches += 1
+
+            for job in jobs:
+                self._finish(job.job_id, job.user_id, results.get(job.job_id) or BookingJobStatus(
+                    job_id=job.job_id, status="failed", error="Booking creation failed"
+                ))
+                queue.task_done()
+
+    def _finish(self, job_id: str, user_id: int, status: BookingJobStatus) -> None:
+        """Record a job's final status and start its TTL."""
+        if status.status == "succeeded":
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self._results[job_id] = (user_id, status)
+        self._expiry.append((self._clock() + self.result_ttl_seconds, job_id))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get queue counters for monitoring.
+
+        Returns:
+            Dictionary of depth, submission, outcome and batch counts
+        """
+        queue = self._queue
+        return {
+            "depth": queue.qsize() if queue is not None else 0,
+            "max_size": self.max_size,
+            "statuses": len(self._results),
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+# Process-wide queue (used only when BOOKING_QUEUE_ENABLED is set)
+booking_queue = BookingQueue(
+    max_size=settings.BOOKING_QUEUE_MAX_SIZE,
+    batch_size=settings.BOOKING_QUEUE_BATCH_SIZE,
+    result_ttl_seconds=settings.BOOKING_QUEUE_RESULT_TTL_SECONDS,
+    max_results=settings.BOOKING_QUEUE_MAX_RESULTS
+)
@@ -2,69 +2,261 @@
 Booking service for managing flight bookings with database integration.
 """
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
 from decimal import Decimal
+import asyncio
+import hashlib
 import json
+import logging
 
-from src.repositories.booking_repo import BookingRepository
-from src.schemas.booking_schema import Booking, BookingCreate
-from src.services.search_service import SearchService
+from src import database
+from src.config import settings
+from src.models.booking_model import BookingStatus
+from src.repositories.booking_repo import AsyncBookingRepository, BookingRepository
+from src.repositories.flight_repo import FlightRepository
+from src.repositories.idempotency_repo import IdempotencyRepository
+from src.schemas.booking_schema import (
+    Booking, BookingCreate, BookingPage, BookingSummary, GroupBookingCreate, ManifestEntry
+)
+from src.services.search_service import SearchService, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeyReused(ValueError):
+    """Raised when an Idempotency-Key is sent again with a different request body."""
 
 
 class BookingService:
     """Service for managing bookings with database."""
     
     @staticmethod
-    def create_booking(db: Session, booking_data: BookingCreate, user_id: int) -> Booking:
+    def hash_request(booking_data: BookingCreate) -> str:
+        """
+        Fingerprint a booking request for idempotency checks.
+        
+        Args:
+            booking_data: Booking creation data
+            
+        Returns:
+            SHA-256 hex digest of the canonical request JSON
+        """
+        return hashlib.sha256(booking_data.model_dump_json().encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def replay_booking(db: Session, user_id: int, idempotency_key: str, request_hash: str) -> Optional[Booking]:
+        """
+        Get the stored result of an earlier request with the same key.
+        
+        Expired keys are deleted so the key can be used again.
+        
+        Args:
+            db: Database session
+            user_id: ID of the user creating the booking
+            idempotency_key: Idempotency-Key header value
+            request_hash: Fingerprint of the current request
+            
+        Returns:
+            The originally created booking, or None if the key is new or expired
+            
+        Raises:
+            IdempotencyKeyReused: If the key was used for a different request
+        """
+        idempotency_repo = IdempotencyRepository(db)
+        record = idempotency_repo.get(user_id, idempotency_key)
+        if not record:
+            return None
+        if record.expires_at <= datetime.utcnow():
+            idempotency_repo.delete(record)
+            return None
+        if record.request_hash != request_hash:
+            raise IdempotencyKeyReused("Idempotency-Key was already used with a different request")
+        return Booking.model_validate(record.response_body)
+    
+    @staticmethod
+    def create_booking(
+        db: Session,
+        booking_data: BookingCreate,
+        user_id: int,
+        idempotency_key: Optional[str] = None
+    ) -> Booking:
         """
         Create a new booking.
         
+        With an idempotency key, the created booking is stored with the key in
+        the same transaction, and retries with the same key and body return it
+        without booking again.
+        
         Args:
             db: Database session
             booking_data: Booking creation data
             user_id: ID of the user creating the booking
+            idempotency_key: Client-chosen retry key (optional)
             
         Returns:
-            Created booking object
+            Created (or originally created) booking object
             
         Raises:
-            ValueError: If flight not found or unavailable
+            IdempotencyKeyReused: If the key was used for a different request
+            ValueError: If flight not found or has too few seats
         """
-        # Validate flight exists
-        flight = SearchService.get_flight_by_id(db, booking_data.flight_id)
+        request_hash = None
+        if idempotency_key:
+            request_hash = BookingService.hash_request(booking_data)
+            booking = BookingService.replay_booking(db, user_id, idempotency_key, request_hash)
+            if booking:
+                return booking
+        
+        seats = len(booking_data.passengers)
+        if seats < 1:
+            raise ValueError("At least one passenger is required")
+        
+        # Check and take seats in one conditional UPDATE; it rolls back with
+        # the booking insert if anything below fails
+        flight_repo = FlightRepository(db)
+        flight = flight_repo.reserve_seats(booking_data.flight_id, seats)
         if not flight:
-            raise ValueError(f"Flight {booking_data.flight_id} not found")
-        if flight.available_seats < len(booking_data.passengers):
+            db.rollback()
+            if not flight_repo.exists(booking_data.flight_id):
+                raise ValueError(f"Flight {booking_data.flight_id} not found")
             raise ValueError("Not enough available seats")
         
         # Calculate total price
-        total_price = Decimal(str(flight.price)) * len(booking_data.passengers)
-        
-        # Convert passenger list to dict for JSON storage
-        passenger_data = {
-            "passengers": [p.model_dump() for p in booking_data.passengers],
-            "flight_info": {
-                "flight_id": flight.flight_id,
-                "airline": flight.airline,
-                "origin": flight.origin,
-                "destination": flight.destination
-            }
-        }
-        
-        # Create booking
+        total_price = Decimal(str(flight.price)) * seats
+        
+        route = (flight.origin, flight.destination)
+        
+        # Create booking; its passenger rows go in with the same flush
         booking_repo = BookingRepository(db)
-        db_booking = booking_repo.create(
-            user_id=user_id,
-            flight_id=booking_data.flight_id,
-            total_price=total_price,
-            passenger_data=passenger_data
-        )
+        try:
+            db_booking = booking_repo.create(
+                user_id=user_id,
+                flight_id=booking_data.flight_id,
+                total_price=total_price,
+                passengers=[p.model_dump() for p in booking_data.passengers],
+                flight=flight
+            )
+            # Every field is set by the flush, so no refresh is needed after commit
+            booking = Booking.model_validate(db_booking)
+            if idempotency_key:
+                IdempotencyRepository(db).create(
+                    user_id=user_id,
+                    key=idempotency_key,
+                    request_hash=request_hash,
+                    response_body=booking.model_dump(mode="json"),
+                    expires_at=datetime.utcnow() + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+                )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            if idempotency_key and isinstance(e, IntegrityError):
+                # A concurrent retry stored the key first; its booking stands
+                booking = BookingService.replay_booking(db, user_id, idempotency_key, request_hash)
+                if booking:
+                    return booking
+            raise
         
-        db.commit()
-        db.refresh(db_booking)
+        # Cached searches on this route now show stale seat counts
+        SearchService.invalidate_route(*route)
         
-        return Booking.model_validate(db_booking)
+        return booking
+    
+    @staticmethod
+    def create_group_booking(db: Session, group_data: GroupBookingCreate, user_id: int) -> List[Booking]:
+        """
+        Book several flights (legs or sub-groups) in one transaction.
+        
+        Seats are reserved flight by flight in ascending flight ID order, so
+        concurrent group bookings take row locks in the same order and cannot
+        deadlock. All bookings are inserted with one flush and one commit;
+        if any flight lacks seats nothing is booked.
+        
+        Args:
+            db: Database session
+            group_data: Bookings to create together
+            user_id: ID of the user creating the bookings
+            
+        Returns:
+            Created booking objects, in request order
+            
+        Raises:
+            ValueError: If the group is empty or too large, or any flight is
+                missing or has too few seats
+        """
+        items = group_data.bookings
+        if not items:
+            raise ValueError("At least one booking is required")
+        if len(items) > settings.BOOKING_GROUP_MAX_ITEMS:
+            raise ValueError(f"At most {settings.BOOKING_GROUP_MAX_ITEMS} bookings per group")
+        if any(not item.passengers for item in items):
+            raise ValueError("At least one passenger is required")
+        
+        return BookingService.create_bookings(db, [(user_id, item) for item in items])
+    
+    @staticmethod
+    def create_bookings(db: Session, requests: List[Tuple[int, BookingCreate]]) -> List[Booking]:
+        """
+        Create several bookings, possibly for different users, all or nothing.
+        
+        Seats are reserved with one conditional UPDATE per flight, in
+        ascending flight ID order, so concurrent callers take row locks in the
+        same order and cannot deadlock. All bookings are inserted with one
+        flush and one commit.
+        
+        Args:
+            db: Database session
+            requests: (user ID, booking data) pairs, each with passengers
+            
+        Returns:
+            Created booking objects, in request order
+            
+        Raises:
+            ValueError: If any flight is missing or has too few seats
+        """
+        seats_by_flight = {}
+        for _, item in requests:
+            seats_by_flight[item.flight_id] = seats_by_flight.get(item.flight_id, 0) + len(item.passengers)
+        
+        flight_repo = FlightRepository(db)
+        flights = {}
+        for flight_id in sorted(seats_by_flight):
+            flight = flight_repo.reserve_seats(flight_id, seats_by_flight[flight_id])
+            if not flight:
+                db.rollback()
+                if not flight_repo.exists(flight_id):
+                    raise ValueError(f"Flight {flight_id} not found")
+                raise ValueError(f"Not enough available seats on flight {flight_id}")
+            flights[flight_id] = flight
+        
+        booking_repo = BookingRepository(db)
+        try:
+            db_bookings = booking_repo.create_many([
+                {
+                    "user_id": user_id,
+                    "flight_id": item.flight_id,
+                    "total_price": Decimal(str(flights[item.flight_id].price)) * len(item.passengers),
+                    "passengers": [p.model_dump() for p in item.passengers],
+                    "flight": flights[item.flight_id]
+                }
+                for user_id, item in requests
+            ])
+            # Every field is set by the flush, so no refresh is needed after commit
+            bookings = [Booking.model_validate(b) for b in db_bookings]
+            routes = {(f.origin, f.destination) for f in flights.values()}
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        # Cached searches on these routes now show stale seat counts
+        for route in routes:
+            SearchService.invalidate_route(*route)
+        
+        return bookings
     
     @staticmethod
     def get_booking(db: Session, booking_id: int, user_id: int) -> Optional[Booking]:
@@ -80,7 +272,7 @@ class BookingService:
             Booking object if found and belongs to user, None otherwise
         """
         booking_repo = BookingRepository(db)
-        db_booking = booking_repo.get_by_id(booking_id)
+        db_booking = booking_repo.get_by_id(booking_id, details=True)
         
         if not db_booking or db_booking.user_id != user_id:
             return None
@@ -88,26 +280,108 @@ class BookingService:
         return Booking.model_validate(db_booking)
     
     @staticmethod
-    def get_user_bookings(db: Session, user_id: int) -> List[Booking]:
+    def get_flight_manifest(db: Session, flight_id: int) -> Optional[List[ManifestEntry]]:
+        """
+        Get the passengers holding or confirmed on a flight.
+        
+        Args:
+            db: Database session
+            flight_id: Flight database ID
+            
+        Returns:
+            Manifest entries ordered by passenger name, or None if the flight
+            does not exist
+        """
+        rows = BookingRepository(db).get_flight_manifest(flight_id)
+        if not rows and not FlightRepository(db).exists(flight_id):
+            return None
+        return [ManifestEntry.model_validate(row) for row in rows]
+    
+    @staticmethod
+    def get_booking_version(db: Session, booking_id: int, user_id: int) -> Optional[datetime]:
         """
-        Get all bookings for a user.
+        Get a booking's row version for conditional requests.
+        
+        Args:
+            db: Database session
+            booking_id: Booking identifier
+            user_id: ID of the requesting user
+            
+        Returns:
+            The booking's updated_at if found and belongs to user, None otherwise
+        """
+        return BookingRepository(db).get_version(booking_id, user_id)
+    
+    @staticmethod
+    def history_page_size(limit: Optional[int]) -> int:
+        """
+        Get the effective booking history page size, capped by settings.
+        
+        Args:
+            limit: Requested page size (optional)
+            
+        Returns:
+            Number of bookings to return per page
+        """
+        return max(1, min(limit or settings.BOOKINGS_PAGE_SIZE, settings.BOOKINGS_MAX_PAGE_SIZE))
+    
+    @staticmethod
+    def to_booking_page(rows: List, limit: int, summary: bool) -> BookingPage:
+        """
+        Convert fetched booking rows to a page with its continuation cursor.
+        
+        Args:
+            rows: Bookings or summary rows (page size + 1 at most)
+            limit: Page size
+            summary: Whether rows are summary rows
+            
+        Returns:
+            Page of bookings and the cursor for the next page, if any
+        """
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
+        schema = BookingSummary if summary else Booking
+        return BookingPage(items=[schema.model_validate(b) for b in page], next_cursor=next_cursor)
+    
+    @staticmethod
+    def get_user_bookings(
+        db: Session,
+        user_id: int,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        summary: bool = False
+    ) -> BookingPage:
+        """
+        Get one page of a user's bookings, newest first.
         
         Args:
             db: Database session
             user_id: User ID
+            status: Only bookings with this status (optional)
+            limit: Page size (optional, capped by settings)
+            cursor: Cursor from the previous page (optional)
+            summary: Omit passenger_data from each booking
             
         Returns:
-            List of booking objects
+            Page of booking objects
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
+        limit = BookingService.history_page_size(limit)
+        after = decode_cursor(cursor) if cursor else None
         booking_repo = BookingRepository(db)
-        db_bookings = booking_repo.get_user_bookings(user_id)
+        rows = booking_repo.get_user_bookings(user_id, limit, status, after, summary)
         
-        return [Booking.model_validate(b) for b in db_bookings]
+        return BookingService.to_booking_page(rows, limit, summary)
     
     @staticmethod
     def cancel_booking(db: Session, booking_id: int, user_id: int) -> Optional[Booking]:
         """
-        Cancel a booking.
+        Cancel a booking and return its seats to the flight.
         
         Args:
             db: Database session
@@ -118,7 +392,65 @@ class BookingService:
             Updated booking object or None if not found
             
         Raises:
-            ValueError: If booking already cancelled
+            ValueError: If booking already cancelled or expired
+        """
+        booking_repo = BookingRepository(db)
+        
+        # One guarded statement checks ownership and status and cancels; a
+        # concurrent cancel or the hold sweeper cannot release seats twice
+        cancelled = booking_repo.cancel(booking_id, user_id)
+        if not cancelled:
+            db.rollback()
+            db_booking = booking_repo.get_by_id(booking_id)
+            if not db_booking or db_booking.user_id != user_id:
+                return None
+            raise ValueError(f"Booking already {db_booking.status.lower()}")
+        
+        # Bookings that predate seat reservation never took seats, so give none back
+        flight = None
+        if cancelled.seats_reserved:
+            flight = FlightRepository(db).release_seats(cancelled.flight_id, cancelled.seats)
+        # Built before commit expires the objects
+        booking = Booking.model_validate(cancelled)
+        route = (flight.origin, flight.destination) if flight else None
+        db.commit()
+        
+        # Cached searches on this route now show stale seat counts
+        if route:
+            SearchService.invalidate_route(*route)
+        
+        return booking
+    
+    @staticmethod
+    def hold_cutoff(now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Get the creation time before which PENDING holds have expired.
+        
+        Args:
+            now: Current UTC time (defaults to utcnow)
+            
+        Returns:
+            Cutoff time, or None if hold expiry is disabled
+        """
+        if settings.BOOKING_HOLD_TTL_MINUTES <= 0:
+            return None
+        return (now or datetime.utcnow()) - timedelta(minutes=settings.BOOKING_HOLD_TTL_MINUTES)
+    
+    @staticmethod
+    def confirm_booking(db: Session, booking_id: int, user_id: int) -> Optional[Booking]:
+        """
+        Confirm a PENDING booking while its seat hold is still valid.
+        
+        Args:
+            db: Database session
+            booking_id: Booking identifier
+            user_id: ID of the user confirming
+            
+        Returns:
+            Updated booking object or None if not found
+            
+        Raises:
+            ValueError: If the booking is not PENDING or its hold has expired
         """
         booking_repo = BookingRepository(db)
         db_booking = booking_repo.get_by_id(booking_id)
@@ -126,11 +458,174 @@ class BookingService:
         if not db_booking or db_booking.user_id != user_id:
             return None
         
-        if db_booking.status == "CANCELLED":
-            raise ValueError("Booking already cancelled")
+        if db_booking.status != BookingStatus.PENDING:
+            raise ValueError(f"Booking is already {db_booking.status.lower()}")
+        
+        cutoff = BookingService.hold_cutoff()
+        if cutoff and db_booking.created_at < cutoff:
+            raise ValueError("Booking hold has expired")
+        
+        # Guarded so a booking the sweeper expired meanwhile stays expired
+        if not booking_repo.transition_status(booking_id, BookingStatus.PENDING.value, BookingStatus.CONFIRMED.value):
+            db.rollback()
+            raise ValueError("Booking hold has expired")
+        db.commit()
+        db.refresh(db_booking)
+        
+        return Booking.model_validate(db_booking)
+    
+    @staticmethod
+    def expire_stale_holds(db: Session, now: Optional[datetime] = None) -> int:
+        """
+        Expire one batch of stale PENDING bookings and return their seats.
+        
+        Args:
+            db: Database session
+            now: Current UTC time (defaults to utcnow)
+            
+        Returns:
+            Number of bookings expired
+        """
+        cutoff = BookingService.hold_cutoff(now)
+        if cutoff is None:
+            return 0
+        
+        expired = BookingRepository(db).expire_pending(cutoff, settings.BOOKING_SWEEP_BATCH_SIZE)
+        if not expired:
+            db.rollback()
+            return 0
+        
+        seats_by_flight = {}
+        for booking in expired:
+            seats_by_flight[booking.flight_id] = seats_by_flight.get(booking.flight_id, 0) + booking.seats
+        
+        # Same lock order as group booking
+        flight_repo = FlightRepository(db)
+        flights = [flight_repo.release_seats(flight_id, seats_by_flight[flight_id]) for flight_id in sorted(seats_by_flight)]
+        routes = {(f.origin, f.destination) for f in flights if f}
+        db.commit()
+        
+        # Cached searches on these routes now show stale seat counts
+        for route in routes:
+            SearchService.invalidate_route(*route)
         
-        updated_booking = booking_repo.update_status(booking_id, "CANCELLED")
+        return len(expired)
+
+
+def sweep_expired_holds() -> int:
+    """
+    Expire every stale hold, batch by batch, on a session of its own.
+    
+    Expired idempotency keys are purged in the same pass.
+    
+    Returns:
+        Number of bookings expired
+    """
+    db = database.SessionLocal()
+    try:
+        total = 0
+        while True:
+            expired = BookingService.expire_stale_holds(db)
+            total += expired
+            if expired < settings.BOOKING_SWEEP_BATCH_SIZE:
+                break
+        IdempotencyRepository(db).delete_expired(datetime.utcnow())
         db.commit()
-        db.refresh(updated_booking)
+        return total
+    finally:
+        db.close()
+
+
+async def run_hold_sweeper(interval_seconds: float) -> None:
+    """
+    Expire stale holds periodically until cancelled.
+    
+    Args:
+        interval_seconds: Delay between sweeps
+    """
+    while True:
+        try:
+            expired = await asyncio.to_thread(sweep_expired_holds)
+            if expired:
+                logger.info("Expired %d unconfirmed bookings", expired)
+        except Exception:
+            logger.exception("Booking hold sweep failed")
+        await asyncio.sleep(interval_seconds)
+
+
+class AsyncBookingService:
+    """
+    Read-side booking operations on an AsyncSession.
+    
+    Writes keep a single implementation in BookingService and are run on the
+    async session through ``run_in_session``.
+    """
+    
+    @staticmethod
+    async def get_booking(db: AsyncSession, booking_id: int, user_id: int) -> Optional[Booking]:
+        """
+        Get a booking by ID.
+        
+        Args:
+            db: Async database session
+            booking_id: Booking identifier
+            user_id: ID of the requesting user
+            
+        Returns:
+            Booking object if found and belongs to user, None otherwise
+        """
+        booking_repo = AsyncBookingRepository(db)
+        db_booking = await booking_repo.get_by_id(booking_id, details=True)
+        
+        if not db_booking or db_booking.user_id != user_id:
+            return None
+        
+        return Booking.model_validate(db_booking)
+    
+    @staticmethod
+    async def get_booking_version(db: AsyncSession, booking_id: int, user_id: int) -> Optional[datetime]:
+        """
+        Get a booking's row version for conditional requests.
+        
+        Args:
+            db: Async database session
+            booking_id: Booking identifier
+            user_id: ID of the requesting user
+            
+        Returns:
+            The booking's updated_at if found and belongs to user, None otherwise
+        """
+        return await AsyncBookingRepository(db).get_version(booking_id, user_id)
+    
+    @staticmethod
+    async def get_user_bookings(
+        db: AsyncSession,
+        user_id: int,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        summary: bool = False
+    ) -> BookingPage:
+        """
+        Get one page of a user's bookings, newest first.
+        
+        Args:
+            db: Async database session
+            user_id: User ID
+            status: Only bookings with this status (optional)
+            limit: Page size (optional, capped by settings)
+            cursor: Cursor from the previous page (optional)
+            summary: Omit passenger_data from each booking
+            
+        Returns:
+            Page of booking objects
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        limit = BookingService.history_page_size(limit)
+        after = decode_cursor(cursor) if cursor else None
+        booking_repo = AsyncBookingRepository(db)
+        rows = await booking_repo.get_user_bookings(user_id, limit, status, after, summary)
         
-        return Booking.model_validate(updated_booking)
+        return BookingService.to_booking_page(rows, limit, summary)
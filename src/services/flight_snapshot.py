@@ -0,0 +1,334 @@
+"""
+In-memory columnar snapshot of the flights table for read-heavy search.
+
+Flights are held in compact typed arrays sorted by (origin, destination,
+departure_time, id), with airport codes, airlines and currencies interned to
+small integers. A route search is a dict lookup for the route's slice plus a
+binary search on departure time, so it never touches the database.
+
+The snapshot refreshes incrementally from ``flights.updated_at``: seat and
+price changes are patched in place, while new flights or changed routes and
+departure times trigger a rebuild that is swapped in atomically. Searches the
+snapshot cannot answer (no full route, unknown route, not loaded yet) return
+None so the caller falls back to SQL.
+"""
+
+import asyncio
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Protocol, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src import database
+from src.models.flight_model import Flight as FlightModel, normalize_airport_code
+from src.schemas.search_schema import FlightSearchParams
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+# Re-read changes this far behind the cursor so rows committed after a
+# newer row (but stamped earlier) are not skipped
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+class FlightRow(NamedTuple):
+    """One flight, in the same field order as search_service.FLIGHT_COLUMNS."""
+    id: int
+    flight_id: str
+    airline: str
+    origin: str
+    destination: str
+    departure_time: datetime
+    arrival_time: datetime
+    price: float
+    currency: str
+    available_seats: int
+
+
+def to_epoch_us(value: datetime) -> int:
+    """Convert a naive UTC datetime to integer microseconds since the epoch."""
+    return (value - EPOCH) // MICROSECOND
+
+
+def from_epoch_us(value: int) -> datetime:
+    """Convert integer microseconds since the epoch to a naive UTC datetime."""
+    return EPOCH + timedelta(microseconds=value)
+
+
+class _Columns:
+    """Immutable-layout column set; seat and price arrays may be patched in place."""
+
+    def __init__(self, rows: Sequence[FlightRow]):
+        """
+        Build sorted columns from flight rows.
+
+        Args:
+            rows: Flight rows in any order
+        """
+        self.strings: List[str] = []
+        self.string_ids: Dict[str, int] = {}
+        intern = self.intern
+
+        rows = sorted(rows, key=lambda r: (r[3], r[4], r[5], r[0]))
+        self.ids = array("q", (r[0] for r in rows))
+        self.flight_ids: List[str] = [r[1] for r in rows]
+        self.airlines = array("i", (intern(r[2]) for r in rows))
+        self.origins = array("i", (intern(r[3]) for r in rows))
+        self.destinations = array("i", (intern(r[4]) for r in rows))
+        self.departures = array("q", (to_epoch_us(r[5]) for r in rows))
+        self.arrivals = array("q", (to_epoch_us(r[6]) for r in rows))
+        self.prices = array("d", (r[7] for r in rows))
+        self.currencies = array("i", (intern(r[8]) for r in rows))
+        self.seats = array("l", (r[9] for r in rows))
+
+        # (origin id, destination id) -> [start, end) slice of the sorted arrays
+        self.routes: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # flight database id -> array position
+        self.positions: Dict[int, int] = {}
+        for position in range(len(rows)):
+            route = (self.origins[position], self.destinations[position])
+            start, _ = self.routes.get(route, (position, position))
+            self.routes[route] = (start, position + 1)
+            self.positions[self.ids[position]] = position
+
+    def intern(self, value: str) -> int:
+        """Map a string to its small-integer id, adding it if new."""
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self.string_ids[value] = string_id
+        return string_id
+
+    def row(self, position: int) -> FlightRow:
+        """Rebuild the flight row stored at an array position."""
+        strings = self.strings
+        return FlightRow(
+            self.ids[position],
+            self.flight_ids[position],
+            strings[self.airlines[position]],
+            strings[self.origins[position]],
+            strings[self.destinations[position]],
+            from_epoch_us(self.departures[position]),
+            from_epoch_us(self.arrivals[position]),
+            self.prices[position],
+            strings[self.currencies[position]],
+            self.seats[position],
+        )
+
+    def rows(self) -> Iterable[FlightRow]:
+        """Iterate over every stored flight row."""
+        return (self.row(position) for position in range(len(self.ids)))
+
+
+class FlightSnapshot:
+    """Columnar flight inventory answering route searches by binary search."""
+
+    def __init__(self):
+        """Initialize an empty (unloaded) snapshot."""
+        self._columns: Optional[_Columns] = None
+        self._cursor: Optional[datetime] = None
+        self._refresh_lock = threading.Lock()
+        self.hits = 0
+        self.fallbacks = 0
+        self.rebuilds = 0
+        self.patches = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the snapshot holds data."""
+        return self._columns is not None
+
+    def load(self, rows: Sequence[FlightRow], cursor: Optional[datetime] = None) -> None:
+        """
+        Replace the snapshot contents.
+
+        Args:
+            rows: All flight rows
+            cursor: Latest ``updated_at`` covered by ``rows``
+        """
+        self._columns = _Columns(rows)
+        self._cursor = cursor
+        self.rebuilds += 1
+
+    def apply_changes(self, rows: Sequence[FlightRow], cursor: Optional[datetime] = None) -> None:
+        """
+        Merge changed flight rows into the snapshot.
+
+        Changes that keep a flight's sort position (seats, price, arrival
+        time, airline) are patched in place. New flights, or flights whose
+        route or departure moved, trigger a rebuild.
+
+        Args:
+            rows: Changed flight rows
+            cursor: Latest ``updated_at`` covered by ``rows``
+        """
+        columns = self._columns
+        if columns is None:
+            self.load(rows, cursor)
+            return
+
+        string_ids = columns.string_ids
+        for row in rows:
+            position = columns.positions.get(row[0])
+            if (
+                position is None
+                or columns.origins[position] != string_ids.get(row[3])
+                or columns.destinations[position] != string_ids.get(row[4])
+                or columns.departures[position] != to_epoch_us(row[5])
+            ):
+                merged = {existing[0]: existing for existing in columns.rows()}
+                merged.update((changed[0], changed) for changed in rows)
+                self.load(list(merged.values()), cursor or self._cursor)
+                return
+
+        for row in rows:
+            position = columns.positions[row[0]]
+            columns.flight_ids[position] = row[1]
+            columns.airlines[position] = columns.intern(row[2])
+            columns.arrivals[position] = to_epoch_us(row[6])
+            columns.prices[position] = row[7]
+            columns.currencies[position] = columns.intern(row[8])
+            columns.seats[position] = row[9]
+        self.patches += len(rows)
+        if cursor is not None:
+            self._cursor = cursor
+
+    def search(
+        self,
+        params: FlightSearchParams,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> Optional[List[FlightRow]]:
+        """
+        Answer a route search from the snapshot.
+
+        Args:
+            params: Flight search parameters (origin and destination required)
+            limit: Maximum rows to return
+            after: Decoded keyset cursor (departure_time, id) to resume after
+
+        Returns:
+            Matching rows in (departure_time, id) order, or None if the
+            snapshot cannot answer and the caller should query SQL
+        """
+        columns = self._columns
+        origin = normalize_airport_code(params.origin)
+        destination = normalize_airport_code(params.destination)
+        if columns is None or not origin or not destination:
+            self.fallbacks += 1
+            return None
+
+        route = (columns.string_ids.get(origin), columns.string_ids.get(destination))
+        bounds = columns.routes.get(route)
+        if bounds is None:
+            self.fallbacks += 1
+            return None
+        lo, hi = bounds
+        departures = columns.departures
+
+        if params.departure_date:
+            window = timedelta(days=params.date_window_days)
+            start = datetime.combine(params.departure_date - window, datetime.min.time())
+            end = datetime.combine(params.departure_date + window + timedelta(days=1), datetime.min.time())
+            hi = bisect_left(departures, to_epoch_us(end), lo, hi)
+            lo = bisect_left(departures, to_epoch_us(start), lo, hi)
+
+        if after is not None:
+            last_departure, last_id = after
+            last_us = to_epoch_us(last_departure)
+            lo = bisect_left(departures, last_us, lo, hi)
+            while lo < hi and departures[lo] == last_us and columns.ids[lo] <= last_id:
+                lo += 1
+
+        rows: List[FlightRow] = []
+        seats = columns.seats
+        for position in range(lo, hi):
+            if seats[position] >= params.passengers:
+                rows.append(columns.row(position))
+                if len(rows) == limit:
+                    break
+        self.hits += 1
+        return rows
+
+    def refresh(self, db: Session) -> None:
+        """
+        Load the snapshot, or pull rows changed since the last refresh.
+
+        Args:
+            db: Database session
+        """
+        # Imported here: search_service imports this module
+        from src.services.search_service import FLIGHT_COLUMNS
+
+        with self._refresh_lock:
+            query = select(*FLIGHT_COLUMNS, FlightModel.updated_at)
+            if self._columns is not None and self._cursor is not None:
+                query = query.where(FlightModel.updated_at > self._cursor - REFRESH_OVERLAP)
+            result = db.execute(query).all()
+
+            cursor = max((r[-1] for r in result), default=self._cursor)
+            rows = [FlightRow(*r[:-1]) for r in result]
+            if self._columns is None:
+                self.load(rows, cursor)
+            elif rows:
+                self.apply_changes(rows, cursor)
+
+    def refresh_from_db(self) -> None:
+        """Refresh on a short-lived session of its own."""
+        db = database.SessionLocal()
+        try:
+            self.refresh(db)
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get snapshot counters for monitoring.
+
+        Returns:
+            Dictionary of size, hit, fallback, rebuild and patch counts
+        """
+        columns = self._columns
+        return {
+            "flights": len(columns.ids) if columns is not None else 0,
+            "routes": len(columns.routes) if columns is not None else 0,
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+            "rebuilds": self.rebuilds,
+            "patches": self.patches,
+        }
+
+
+class Refreshable(Protocol):
+    """In-memory structure that reloads itself from the database."""
+
+    def refresh_from_db(self) -> None:
+        """Refresh on a short-lived session of its own."""
+
+
+async def run_refresh_loop(snapshot: Refreshable, interval_seconds: float) -> None:
+    """
+    Keep a snapshot (or other in-memory structure) fresh until cancelled.
+
+    Args:
+        snapshot: Snapshot to refresh
+        interval_seconds: Delay between refreshes
+    """
+    while True:
+        try:
+            await asyncio.to_thread(snapshot.refresh_from_db)
+        except Exception:
+            logger.exception("%s refresh failed", type(snapshot).__name__)
+        await asyncio.sleep(interval_seconds)
+
+
+# Process-wide snapshot (used only when FLIGHT_SNAPSHOT_ENABLED is set)
+flight_snapshot = FlightSnapshot()
@@ -0,0 +1,227 @@
+"""
+Precomputed time-dependent route graph for connecting-flight search.
+
+Each airport maps to its outgoing flights sorted by departure time, with
+departure and arrival times held as integer microseconds. Finding the next
+legs out of an airport is a binary search for the layover window, and
+itineraries are enumerated best-first by arrival time (a time-dependent
+Dijkstra that keeps the k best labels per airport), so connection search
+never self-joins the flights table.
+
+When CONNECTION_SEARCH_ENABLED is set, the graph is built and rebuilt from
+upcoming flights by a lifespan task on a fixed interval, never by a request. Seat counts are as of the last rebuild;
+booking re-checks availability.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src import database
+from src.models.flight_model import Flight as FlightModel
+from src.services.flight_snapshot import FlightRow, to_epoch_us
+
+logger = logging.getLogger(__name__)
+
+MINUTE_US = 60_000_000
+
+Itinerary = Tuple[FlightRow, ...]
+
+
+class RouteGraphNotLoaded(Exception):
+    """Raised when connections are searched before the first graph build."""
+
+
+class _Departures:
+    """Outgoing flights of one airport, sorted by departure time."""
+
+    __slots__ = ("departures", "arrivals", "rows")
+
+    def __init__(self, rows: Sequence[FlightRow]):
+        """
+        Build the sorted departure board.
+
+        Args:
+            rows: Flights leaving the airport, in any order
+        """
+        rows = sorted(rows, key=lambda r: (r.departure_time, r.id))
+        self.departures = array("q", (to_epoch_us(r.departure_time) for r in rows))
+        self.arrivals = array("q", (to_epoch_us(r.arrival_time) for r in rows))
+        self.rows: List[FlightRow] = rows
+
+    def window(self, start_us: int, end_us: int) -> range:
+        """
+        Get positions of flights departing in [start_us, end_us].
+
+        Args:
+            start_us: Earliest departure (epoch microseconds)
+            end_us: Latest departure (epoch microseconds)
+
+        Returns:
+            Range of positions into the sorted arrays
+        """
+        return range(
+            bisect_left(self.departures, start_us),
+            bisect_right(self.departures, end_us)
+        )
+
+
+class RouteGraph:
+    """Airport adjacency of upcoming flights, keyed by time-sorted departures."""
+
+    def __init__(self):
+        """Initialize an empty (unloaded) graph."""
+        self._airports: Optional[Dict[str, _Departures]] = None
+        self._refresh_lock = threading.Lock()
+        self.loaded_at: Optional[float] = None
+        self.searches = 0
+        self.rebuilds = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the graph holds data."""
+        return self._airports is not None
+
+    def load(self, rows: Sequence[FlightRow]) -> None:
+        """
+        Replace the graph contents.
+
+        Args:
+            rows: All flights that may appear in an itinerary
+        """
+        by_origin: Dict[str, List[FlightRow]] = {}
+        for row in rows:
+            by_origin.setdefault(row.origin, []).append(row)
+        # Swapped in whole so concurrent searches see the old or the new graph
+        self._airports = {airport: _Departures(legs) for airport, legs in by_origin.items()}
+        self.loaded_at = time.monotonic()
+        self.rebuilds += 1
+
+    def search(
+        self,
+        origin: str,
+        destination: str,
+        earliest_departure: datetime,
+        latest_departure: datetime,
+        passengers: int = 1,
+        max_stops: int = 1,
+        min_layover: timedelta = timedelta(minutes=45),
+        max_layover: timedelta = timedelta(hours=12),
+        limit: int = 10
+    ) -> List[Itinerary]:
+        """
+        Find the itineraries arriving earliest at ``destination``.
+
+        Partial itineraries are expanded in order of arrival time. Each leg
+        must leave between ``min_layover`` and ``max_layover`` after the
+        previous one lands, with enough seats, and no airport is visited
+        twice. Each intermediate airport is expanded at most ``limit``
+        times, which bounds the search to the k best labels per airport.
+
+        Args:
+            origin: Normalized origin airport code
+            destination: Normalized destination airport code
+            earliest_departure: Earliest departure of the first leg
+            latest_departure: Latest departure of the first leg
+            passengers: Seats required on every leg
+            max_stops: Maximum number of connections (0 for direct only)
+            min_layover: Minimum connection time
+            max_layover: Maximum connection time
+            limit: Maximum itineraries to return
+
+        Returns:
+            Itineraries (tuples of legs) ordered by arrival time, then by
+            later first departure
+        """
+        airports = self._airports
+        self.searches += 1
+        if not airports or origin not in airports or origin == destination:
+            return []
+
+        min_layover_us = min_layover // timedelta(microseconds=1)
+        max_layover_us = max_layover // timedelta(microseconds=1)
+
+        # Heap entries: (arrival_us, -first_departure_us, sequence, path)
+        heap: List[Tuple[int, int, int, Itinerary]] = []
+        sequence = 0
+        board = airports[origin]
+        for position in board.window(to_epoch_us(earliest_departure), to_epoch_us(latest_departure)):
+            row = board.rows[position]
+            if row.available_seats >= passengers:
+                heap.append((board.arrivals[position], -board.departures[position], sequence, (row,)))
+                sequence += 1
+        heapq.heapify(heap)
+
+        results: List[Itinerary] = []
+        expanded: Dict[str, int] = {}
+        while heap and len(results) < limit:
+            arrival_us, first_departure, _, path = heapq.heappop(heap)
+            airport = path[-1].destination
+            if airport == destination:
+                results.append(path)
+                continue
+            if len(path) > max_stops or expanded.get(airport, 0) >= limit:
+                continue
+            expanded[airport] = expanded.get(airport, 0) + 1
+
+            board = airports.get(airport)
+            if board is None:
+                continue
+            visited = {path[0].origin}
+            visited.update(leg.destination for leg in path)
+            for position in board.window(arrival_us + min_layover_us, arrival_us + max_layover_us):
+                row = board.rows[position]
+                if row.destination in visited or row.available_seats < passengers:
+                    continue
+                heapq.heappush(heap, (board.arrivals[position], first_departure, sequence, path + (row,)))
+                sequence += 1
+        return results
+
+    def refresh(self, db: Session) -> None:
+        """
+        Rebuild the graph from flights that have not departed yet.
+
+        Args:
+            db: Database session
+        """
+        # Imported here: search_service imports this module
+        from src.services.search_service import FLIGHT_COLUMNS
+
+        with self._refresh_lock:
+            query = select(*FLIGHT_COLUMNS).where(FlightModel.departure_time >= datetime.utcnow())
+            self.load([FlightRow(*row) for row in db.execute(query)])
+
+    def refresh_from_db(self) -> None:
+        """Rebuild on a short-lived session of its own."""
+        db = database.SessionLocal()
+        try:
+            self.refresh(db)
+        finally:
+            db.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get graph counters for monitoring.
+
+        Returns:
+            Dictionary of size, search and rebuild counts
+        """
+        airports = self._airports or {}
+        return {
+            "airports": len(airports),
+            "flights": sum(len(board.rows) for board in airports.values()),
+            "searches": self.searches,
+            "rebuilds": self.rebuilds,
+        }
+
+
+# Process-wide route graph, rebuilt every ROUTE_GRAPH_REFRESH_SECONDS
+route_graph = RouteGraph()
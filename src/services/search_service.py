@@ -4,10 +4,23 @@ Search service for flights and hotels.
 Provides database-backed search functionality for flights and hotels.
 """
 
-from typing import List, Optional
+import base64
+import json
+from datetime import datetime, time, timedelta
+from typing import Any, AsyncIterator, Hashable, Iterator, List, Optional, Sequence, Tuple
+from pydantic_core import to_json
+from sqlalchemy import Row, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.schemas.search_schema import Flight, Hotel
-from src.models.flight_model import Flight as FlightModel
+from src.config import settings
+from src.schemas.search_schema import (
+    ConnectionSearchParams, Flight, FlightSearchPage, FlightSearchParams, Hotel, Itinerary
+)
+from src.models.flight_model import Flight as FlightModel, normalize_airport_code
+from src.models.hotel_model import Hotel as HotelModel, normalize_city
+from src.services.cache import TTLCache
+from src.services.flight_snapshot import flight_snapshot
+from src.services.route_graph import RouteGraphNotLoaded, route_graph
 
 
 # Mock flight data
@@ -47,120 +60,318 @@ MOCK_FLIGHTS = [
     }
 ]
 
-# Mock hotel data (hotels will be added to database later)
-MOCK_HOTELS = [
-    {
-        "hotel_id": "HT001",
-        "name": "Burj Al Arab",
-        "city": "Dubai",
-        "address": "Jumeirah Street, Dubai",
-        "rating": 5.0,
-        "price_per_night": 1200.00,
-        "currency": "USD",
-        "available_rooms": 15
-    },
-    {
-        "hotel_id": "HT002",
-        "name": "Atlantis The Palm",
-        "city": "Dubai",
-        "address": "Crescent Road, Palm Jumeirah",
-        "rating": 4.8,
-        "price_per_night": 850.00,
-        "currency": "USD",
-        "available_rooms": 32
-    },
-    {
-        "hotel_id": "HT003",
-        "name": "Pearl Continental",
-        "city": "Lahore",
-        "address": "Shahrah-e-Quaid-e-Azam",
-        "rating": 4.5,
-        "price_per_night": 180.00,
-        "currency": "USD",
-        "available_rooms": 45
-    }
-]
+# Columns returned by flight search, in Flight response field order. Search
+# selects these as plain rows and serializes them straight to JSON, skipping
+# ORM hydration and per-row schema validation.
+FLIGHT_COLUMNS = (
+    FlightModel.id,
+    FlightModel.flight_id,
+    FlightModel.airline,
+    FlightModel.origin,
+    FlightModel.destination,
+    FlightModel.departure_time,
+    FlightModel.arrival_time,
+    FlightModel.price,
+    FlightModel.currency,
+    FlightModel.available_seats,
+)
+FLIGHT_FIELDS = tuple(column.key for column in FLIGHT_COLUMNS)
+
+# Cached flight search pages, tagged by (origin, destination) for invalidation
+flight_search_cache = TTLCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS
+)
+
+# Columns returned by hotel search, in Hotel response field order
+HOTEL_COLUMNS = (
+    HotelModel.hotel_id,
+    HotelModel.name,
+    HotelModel.city,
+    HotelModel.address,
+    HotelModel.rating,
+    HotelModel.price_per_night,
+    HotelModel.currency,
+    HotelModel.available_rooms,
+)
+HOTEL_FIELDS = tuple(column.key for column in HOTEL_COLUMNS)
+
+# In-process hotel indexes, filled read-through from the database: normalized
+# city -> hotels in that city, and hotel_id -> hotel. Bounded so that only the
+# hot part of a large catalog is held in memory.
+hotel_city_index = TTLCache(
+    max_entries=settings.HOTEL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.HOTEL_CACHE_TTL_SECONDS
+)
+hotel_id_index = TTLCache(
+    max_entries=settings.HOTEL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.HOTEL_CACHE_TTL_SECONDS
+)
+
+
+def encode_cursor(sort_time: datetime, row_id: int) -> str:
+    """
+    Encode the keyset position (sort time, id) of the last row on a page.
+    
+    Used for flight search (departure_time, id) and booking history
+    (created_at, id).
+    
+    Args:
+        sort_time: Sort timestamp of the last returned row
+        row_id: Database ID of the last returned row
+        
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    raw = json.dumps([sort_time.isoformat(), row_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Opaque cursor string from a previous page
+        
+    Returns:
+        Tuple of (sort time, database ID)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        sort_time, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(sort_time), int(row_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError("Invalid search cursor") from e
 
 
 class SearchService:
     """Service for searching flights and hotels."""
     
     @staticmethod
-    def search_flights(db: Session, origin: Optional[str] = None, destination: Optional[str] = None) -> List[Flight]:
+    def build_flights_query(params: FlightSearchParams) -> Select:
         """
-        Search for flights matching criteria from database.
+        Build the flight search statement shared by the sync and async services.
+        
+        Results are ordered by (departure_time, id) and fetch one row past the
+        page size so the caller can tell whether another page exists.
         
         Args:
-            db: Database session
-            origin: Origin airport code (optional)
-            destination: Destination airport code (optional)
+            params: Flight search parameters
             
         Returns:
-            List of matching flights
+            SELECT statement for one page of matching flight rows
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        query = db.query(FlightModel)
+        query = select(*FLIGHT_COLUMNS)
         
-        if origin:
-            query = query.filter(FlightModel.origin.ilike(origin))
-        if destination:
-            query = query.filter(FlightModel.destination.ilike(destination))
+        # Codes are stored upper-case, so equality hits ix_flights_route_departure
+        if params.origin:
+            query = query.where(FlightModel.origin == normalize_airport_code(params.origin))
+        if params.destination:
+            query = query.where(FlightModel.destination == normalize_airport_code(params.destination))
         
-        db_flights = query.all()
+        if params.departure_date:
+            window = timedelta(days=params.date_window_days)
+            start = datetime.combine(params.departure_date - window, time.min)
+            end = datetime.combine(params.departure_date + window + timedelta(days=1), time.min)
+            query = query.where(FlightModel.departure_time >= start, FlightModel.departure_time < end)
         
-        # Convert to Pydantic models
-        results = [
-            Flight(
-                id=f.id,
-                flight_id=f.flight_id,
-                airline=f.airline,
-                origin=f.origin,
-                destination=f.destination,
-                departure_time=f.departure_time.isoformat(),
-                arrival_time=f.arrival_time.isoformat(),
-                price=float(f.price),
-                currency=f.currency,
-                available_seats=f.available_seats
+        if params.passengers:
+            query = query.where(FlightModel.available_seats >= params.passengers)
+        
+        if params.cursor:
+            last_departure, last_id = decode_cursor(params.cursor)
+            query = query.where(
+                tuple_(FlightModel.departure_time, FlightModel.id) > (last_departure, last_id)
             )
-            for f in db_flights
-        ]
         
-        return results
+        return query.order_by(FlightModel.departure_time, FlightModel.id).limit(
+            SearchService.page_size(params) + 1
+        )
     
     @staticmethod
-    def search_hotels(city: str) -> List[Hotel]:
+    def cache_key(params: FlightSearchParams) -> Hashable:
         """
-        Search for hotels in a specific city (mock data).
+        Build the cache key for a search from its normalized parameters.
         
         Args:
-            city: City name to search in
+            params: Flight search parameters
             
         Returns:
-            List of matching hotels
+            Hashable key identifying the result page
         """
-        results = [
-            Hotel(**hotel) 
-            for hotel in MOCK_HOTELS 
-            if hotel["city"].lower() == city.lower()
-        ]
-        return results
+        return (
+            normalize_airport_code(params.origin) or None,
+            normalize_airport_code(params.destination) or None,
+            params.departure_date,
+            params.date_window_days if params.departure_date else 0,
+            params.passengers,
+            SearchService.page_size(params),
+            params.cursor,
+        )
     
     @staticmethod
-    def get_flight_by_id(db: Session, flight_id: int) -> Optional[Flight]:
+    def cache_tag(origin: Optional[str], destination: Optional[str]) -> Hashable:
         """
-        Get a specific flight by ID from database.
+        Build the invalidation tag for a route; None acts as a wildcard.
         
         Args:
-            db: Database session
-            flight_id: Flight identifier
+            origin: Origin airport code (optional)
+            destination: Destination airport code (optional)
             
         Returns:
-            Flight object if found, None otherwise
+            Hashable route tag
         """
-        db_flight = db.query(FlightModel).filter(FlightModel.id == flight_id).first()
+        return ("route", normalize_airport_code(origin) or None, normalize_airport_code(destination) or None)
+    
+    @staticmethod
+    def get_cached_page(params: FlightSearchParams) -> Optional[FlightSearchPage]:
+        """
+        Look up a cached search page.
+        
+        Args:
+            params: Flight search parameters
+            
+        Returns:
+            Cached page, or None if caching is disabled or the page is not cached
+        """
+        if not settings.SEARCH_CACHE_ENABLED:
+            return None
+        return flight_search_cache.get(SearchService.cache_key(params))
+    
+    @staticmethod
+    def cache_page(params: FlightSearchParams, page: FlightSearchPage) -> None:
+        """
+        Store a search page, tagged with the route it was searched on.
+        
+        Args:
+            params: Flight search parameters
+            page: Result page to cache
+        """
+        if not settings.SEARCH_CACHE_ENABLED:
+            return
+        key = SearchService.cache_key(params)
+        flight_search_cache.set(key, page, tags=[SearchService.cache_tag(key[0], key[1])])
+    
+    @staticmethod
+    def invalidate_route(origin: str, destination: str) -> None:
+        """
+        Drop cached searches that can contain flights on a route.
+        
+        Called after seat counts on the route change. Searches with an
+        unspecified origin and/or destination also match the route.
+        
+        Args:
+            origin: Origin airport code of the changed flight
+            destination: Destination airport code of the changed flight
+        """
+        for tag_origin in (origin, None):
+            for tag_destination in (destination, None):
+                flight_search_cache.invalidate_tag(SearchService.cache_tag(tag_origin, tag_destination))
+    
+    @staticmethod
+    def page_size(params: FlightSearchParams) -> int:
+        """
+        Get the effective page size for a search, capped by settings.
+        
+        Args:
+            params: Flight search parameters
+            
+        Returns:
+            Number of flights to return per page
+        """
+        return max(1, min(params.limit, settings.SEARCH_MAX_PAGE_SIZE))
+    
+    @staticmethod
+    def search_snapshot(params: FlightSearchParams) -> Optional[FlightSearchPage]:
+        """
+        Answer a search from the in-memory flight snapshot, if enabled.
         
-        if not db_flight:
+        Args:
+            params: Flight search parameters
+            
+        Returns:
+            Result page, or None if the snapshot is disabled or cannot answer
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if not settings.FLIGHT_SNAPSHOT_ENABLED:
             return None
+        after = decode_cursor(params.cursor) if params.cursor else None
+        # Like build_flights_query, fetch one row past the page to detect more
+        rows = flight_snapshot.search(params, SearchService.page_size(params) + 1, after)
+        if rows is None:
+            return None
+        return SearchService.to_page(rows, params)
+    
+    @staticmethod
+    def to_page(rows: Sequence[Row], params: FlightSearchParams) -> FlightSearchPage:
+        """
+        Serialize fetched rows to a result page with its continuation cursor.
+        
+        Args:
+            rows: Rows fetched by build_flights_query (page size + 1 at most)
+            params: Flight search parameters
+            
+        Returns:
+            Page of flights and the cursor for the next page, if any
+        """
+        limit = SearchService.page_size(params)
+        page = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(page[-1].departure_time, page[-1].id)
+        
+        return FlightSearchPage(
+            content=SearchService.serialize_flights(page),
+            next_cursor=next_cursor
+        )
+    
+    @staticmethod
+    def row_to_dict(row: Sequence[Any]) -> dict:
+        """
+        Map a FLIGHT_COLUMNS row to Flight response fields.
+        
+        Args:
+            row: Row selected with FLIGHT_COLUMNS
+            
+        Returns:
+            Dictionary keyed by Flight field name
+        """
+        return dict(zip(FLIGHT_FIELDS, row))
+    
+    @staticmethod
+    def serialize_flights(rows: Sequence[Row]) -> bytes:
+        """
+        Serialize flight rows to a JSON array in one pass.
+        
+        Datetimes are written in ISO 8601, matching the Flight schema.
         
+        Args:
+            rows: Rows selected with FLIGHT_COLUMNS
+            
+        Returns:
+            JSON-encoded array of flights
+        """
+        return to_json([SearchService.row_to_dict(row) for row in rows])
+    
+    @staticmethod
+    def to_flight(db_flight: Any) -> Flight:
+        """
+        Convert a flight row or database object to its response schema.
+        
+        Args:
+            db_flight: Row selected with FLIGHT_COLUMNS or Flight database object
+            
+        Returns:
+            Flight response object
+        """
         return Flight(
             id=db_flight.id,
             flight_id=db_flight.flight_id,
@@ -175,18 +386,428 @@ class SearchService:
         )
     
     @staticmethod
-    def get_hotel_by_id(hotel_id: str) -> Optional[Hotel]:
+    def search_flights(db: Session, params: FlightSearchParams) -> FlightSearchPage:
+        """
+        Search for flights matching criteria from database.
+        
+        Args:
+            db: Database session
+            params: Flight search parameters
+            
+        Returns:
+            Page of matching flights
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        page = SearchService.get_cached_page(params)
+        if page is not None:
+            return page
+        
+        # Snapshot pages are not cached: the snapshot can lag a booking that
+        # just invalidated the route, and caching would keep its seats for a TTL
+        page = SearchService.search_snapshot(params)
+        if page is not None:
+            return page
+        
+        rows = db.execute(SearchService.build_flights_query(params)).all()
+        
+        page = SearchService.to_page(rows, params)
+        SearchService.cache_page(params, page)
+        return page
+    
+    @staticmethod
+    def build_stream_query(params: FlightSearchParams) -> Select:
+        """
+        Build the unpaginated search statement used for streaming.
+        
+        Streams start after ``params.cursor`` when given but are not limited
+        to one page; rows are fetched in batches through a server-side cursor.
+        
+        Args:
+            params: Flight search parameters
+            
+        Returns:
+            SELECT statement for all matching flights
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return SearchService.build_flights_query(params).limit(None).execution_options(
+            yield_per=settings.SEARCH_STREAM_BATCH_SIZE
+        )
+    
+    @staticmethod
+    def stream_flights(db: Session, params: FlightSearchParams) -> Iterator[bytes]:
+        """
+        Stream matching flights as newline-delimited JSON.
+        
+        Args:
+            db: Database session (must stay open while the stream is consumed)
+            params: Flight search parameters
+            
+        Yields:
+            One JSON-encoded flight per line
+        """
+        for row in db.execute(SearchService.build_stream_query(params)):
+            yield to_json(SearchService.row_to_dict(row)) + b"\n"
+    
+    @staticmethod
+    def find_connections(params: ConnectionSearchParams) -> List[Itinerary]:
+        """
+        Find connecting itineraries on the loaded route graph.
+        
+        Args:
+            params: Connection search parameters
+            
+        Returns:
+            Itineraries ordered by arrival time
+        """
+        window = timedelta(days=params.date_window_days)
+        paths = route_graph.search(
+            normalize_airport_code(params.origin),
+            normalize_airport_code(params.destination),
+            earliest_departure=datetime.combine(params.departure_date - window, time.min),
+            latest_departure=datetime.combine(params.departure_date + window, time.max),
+            passengers=params.passengers,
+            max_stops=max(0, min(params.max_stops, settings.CONNECTION_MAX_STOPS)),
+            min_layover=timedelta(minutes=params.min_layover_minutes),
+            max_layover=timedelta(minutes=params.max_layover_minutes),
+            limit=max(1, min(params.limit, settings.CONNECTION_MAX_RESULTS))
+        )
+        return [SearchService.to_itinerary(path) for path in paths]
+    
+    @staticmethod
+    def to_itinerary(path: Sequence[Any]) -> Itinerary:
+        """
+        Convert a sequence of flight rows to its itinerary schema.
+        
+        Args:
+            path: Legs of the itinerary, in travel order
+            
+        Returns:
+            Itinerary response object
+        """
+        legs = [SearchService.to_flight(row) for row in path]
+        departure, arrival = path[0].departure_time, path[-1].arrival_time
+        return Itinerary(
+            legs=legs,
+            stops=len(legs) - 1,
+            departure_time=departure.isoformat(),
+            arrival_time=arrival.isoformat(),
+            duration_minutes=int((arrival - departure).total_seconds() // 60),
+            total_price=round(sum(leg.price for leg in legs), 2),
+            currency=legs[0].currency
+        )
+    
+    @staticmethod
+    def search_connections(params: ConnectionSearchParams) -> List[Itinerary]:
+        """
+        Search for direct and connecting itineraries.
+        
+        The route graph is built by the lifespan refresh task; searches never
+        build it, so a cold worker cannot block the event loop on a full scan.
+        
+        Args:
+            params: Connection search parameters
+            
+        Returns:
+            Itineraries ordered by arrival time
+            
+        Raises:
+            RouteGraphNotLoaded: If the first graph build has not finished yet
+        """
+        if not route_graph.loaded:
+            raise RouteGraphNotLoaded("Route graph is loading, try again shortly")
+        return SearchService.find_connections(params)
+    
+    @staticmethod
+    def build_hotels_query(city: str) -> Select:
+        """
+        Build the hotel city search statement shared by the sync and async services.
+        
+        Filters on ``lower(city)`` so the lookup uses ix_hotels_city_lower.
+        
+        Args:
+            city: City name to search in
+            
+        Returns:
+            SELECT statement for hotel rows in the city
+        """
+        return (
+            select(*HOTEL_COLUMNS)
+            .where(func.lower(HotelModel.city) == normalize_city(city))
+            .order_by(HotelModel.id)
+        )
+    
+    @staticmethod
+    def to_hotel(row: Sequence[Any]) -> Hotel:
+        """
+        Convert a HOTEL_COLUMNS row to its response schema.
+        
+        Args:
+            row: Row selected with HOTEL_COLUMNS
+            
+        Returns:
+            Hotel response object
+        """
+        return Hotel(**dict(zip(HOTEL_FIELDS, row)))
+    
+    @staticmethod
+    def index_hotels(city: str, rows: Sequence[Row]) -> List[Hotel]:
+        """
+        Convert a city's hotel rows and add them to the in-process indexes.
+        
+        Args:
+            city: City name that was searched
+            rows: Rows fetched by build_hotels_query
+            
+        Returns:
+            List of hotels in the city
+        """
+        hotels = [SearchService.to_hotel(row) for row in rows]
+        hotel_city_index.set(normalize_city(city), hotels)
+        for hotel in hotels:
+            hotel_id_index.set(hotel.hotel_id, hotel)
+        return hotels
+    
+    @staticmethod
+    def search_hotels(db: Session, city: str) -> List[Hotel]:
+        """
+        Search for hotels in a specific city from database.
+        
+        Args:
+            db: Database session
+            city: City name to search in (case-insensitive)
+            
+        Returns:
+            List of matching hotels
+        """
+        hotels = hotel_city_index.get(normalize_city(city))
+        if hotels is not None:
+            return hotels
+        
+        rows = db.execute(SearchService.build_hotels_query(city)).all()
+        return SearchService.index_hotels(city, rows)
+    
+    @staticmethod
+    def get_flight_by_id(db: Session, flight_id: int) -> Optional[Flight]:
+        """
+        Get a specific flight by ID from database.
+        
+        Args:
+            db: Database session
+            flight_id: Flight identifier
+            
+        Returns:
+            Flight object if found, None otherwise
+        """
+        row = db.execute(select(*FLIGHT_COLUMNS).where(FlightModel.id == flight_id)).first()
+        
+        if not row:
+            return None
+        
+        return SearchService.to_flight(row)
+    
+    @staticmethod
+    def build_flights_by_ids_query(flight_ids: Sequence[int]) -> Select:
+        """
+        Build the single IN query used for batch flight lookups.
+        
+        Args:
+            flight_ids: Flight database IDs
+            
+        Returns:
+            SELECT statement for the matching flight rows
+        """
+        return select(*FLIGHT_COLUMNS).where(FlightModel.id.in_(set(flight_ids)))
+    
+    @staticmethod
+    def order_by_ids(rows: Sequence[Row], flight_ids: Sequence[int]) -> List[Flight]:
+        """
+        Arrange fetched rows in request order, dropping unknown IDs.
+        
+        Args:
+            rows: Rows fetched by build_flights_by_ids_query
+            flight_ids: Flight database IDs in request order
+            
+        Returns:
+            Flights in the order their IDs were first requested
+        """
+        by_id = {row.id: row for row in rows}
+        ordered = dict.fromkeys(flight_id for flight_id in flight_ids if flight_id in by_id)
+        return [SearchService.to_flight(by_id[flight_id]) for flight_id in ordered]
+    
+    @staticmethod
+    def get_flights_by_ids(db: Session, flight_ids: Sequence[int]) -> List[Flight]:
         """
-        Get a specific hotel by ID (mock data).
+        Get many flights by ID with one query.
         
         Args:
+            db: Database session
+            flight_ids: Flight database IDs, in the order results are wanted
+            
+        Returns:
+            Found flights in request order (duplicates and unknown IDs dropped)
+        """
+        if not flight_ids:
+            return []
+        rows = db.execute(SearchService.build_flights_by_ids_query(flight_ids)).all()
+        return SearchService.order_by_ids(rows, flight_ids)
+    
+    @staticmethod
+    def get_hotel_by_id(db: Session, hotel_id: str) -> Optional[Hotel]:
+        """
+        Get a specific hotel by ID from database.
+        
+        Args:
+            db: Database session
             hotel_id: Hotel identifier
             
         Returns:
             Hotel object if found, None otherwise
         """
-        for hotel in MOCK_HOTELS:
-            if hotel["hotel_id"] == hotel_id:
-                return Hotel(**hotel)
-        return None
+        hotel = hotel_id_index.get(hotel_id)
+        if hotel is not None:
+            return hotel
+        
+        row = db.execute(select(*HOTEL_COLUMNS).where(HotelModel.hotel_id == hotel_id)).first()
+        
+        if not row:
+            return None
+        
+        hotel = SearchService.to_hotel(row)
+        hotel_id_index.set(hotel_id, hotel)
+        return hotel
+
 
+class AsyncSearchService:
+    """Service for searching flights and hotels on an AsyncSession."""
+    
+    @staticmethod
+    async def search_flights(db: AsyncSession, params: FlightSearchParams) -> FlightSearchPage:
+        """
+        Search for flights matching criteria from database.
+        
+        Args:
+            db: Async database session
+            params: Flight search parameters
+            
+        Returns:
+            Page of matching flights
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        page = SearchService.get_cached_page(params)
+        if page is not None:
+            return page
+        
+        # Snapshot pages are not cached: the snapshot can lag a booking that
+        # just invalidated the route, and caching would keep its seats for a TTL
+        page = SearchService.search_snapshot(params)
+        if page is not None:
+            return page
+        
+        result = await db.execute(SearchService.build_flights_query(params))
+        page = SearchService.to_page(result.all(), params)
+        SearchService.cache_page(params, page)
+        return page
+    
+    @staticmethod
+    async def stream_flights(db: AsyncSession, params: FlightSearchParams) -> AsyncIterator[bytes]:
+        """
+        Stream matching flights as newline-delimited JSON.
+        
+        Args:
+            db: Async database session (must stay open while the stream is consumed)
+            params: Flight search parameters
+            
+        Yields:
+            One JSON-encoded flight per line
+        """
+        result = await db.stream(SearchService.build_stream_query(params))
+        async for row in result:
+            yield to_json(SearchService.row_to_dict(row)) + b"\n"
+    
+    @staticmethod
+    async def get_flight_by_id(db: AsyncSession, flight_id: int) -> Optional[Flight]:
+        """
+        Get a specific flight by ID from database.
+        
+        Args:
+            db: Async database session
+            flight_id: Flight identifier
+            
+        Returns:
+            Flight object if found, None otherwise
+        """
+        result = await db.execute(select(*FLIGHT_COLUMNS).where(FlightModel.id == flight_id))
+        row = result.first()
+        
+        if not row:
+            return None
+        
+        return SearchService.to_flight(row)
+    
+    @staticmethod
+    async def get_flights_by_ids(db: AsyncSession, flight_ids: Sequence[int]) -> List[Flight]:
+        """
+        Get many flights by ID with one query.
+        
+        Args:
+            db: Async database session
+            flight_ids: Flight database IDs, in the order results are wanted
+            
+        Returns:
+            Found flights in request order (duplicates and unknown IDs dropped)
+        """
+        if not flight_ids:
+            return []
+        result = await db.execute(SearchService.build_flights_by_ids_query(flight_ids))
+        return SearchService.order_by_ids(result.all(), flight_ids)
+    
+    @staticmethod
+    async def search_hotels(db: AsyncSession, city: str) -> List[Hotel]:
+        """
+        Search for hotels in a specific city from database.
+        
+        Args:
+            db: Async database session
+            city: City name to search in (case-insensitive)
+            
+        Returns:
+            List of matching hotels
+        """
+        hotels = hotel_city_index.get(normalize_city(city))
+        if hotels is not None:
+            return hotels
+        
+        result = await db.execute(SearchService.build_hotels_query(city))
+        return SearchService.index_hotels(city, result.all())
+    
+    @staticmethod
+    async def get_hotel_by_id(db: AsyncSession, hotel_id: str) -> Optional[Hotel]:
+        """
+        Get a specific hotel by ID from database.
+        
+        Args:
+            db: Async database session
+            hotel_id: Hotel identifier
+            
+        Returns:
+            Hotel object if found, None otherwise
+        """
+        hotel = hotel_id_index.get(hotel_id)
+        if hotel is not None:
+            return hotel
+        
+        result = await db.execute(select(*HOTEL_COLUMNS).where(HotelModel.hotel_id == hotel_id))
+        row = result.first()
+        
+        if not row:
+            return None
+        
+        hotel = SearchService.to_hotel(row)
+        hotel_id_index.set(hotel_id, hotel)
+        return hotel
@@ -0,0 +1,133 @@
+"""
+Benchmark: flight search latency during a login storm.
+
+Runs the app in-process (no server needed) on a throwaway SQLite database and
+measures /search/flights latency alone, then while a burst of concurrent
+/auth/login requests is in flight. It does this twice: once with bcrypt on the
+bounded password pool (the default) and once with bcrypt called inline on the
+event loop, as logins used to do. Per-IP and per-account rate limits are
+turned off (every login is the same account from the same client), so only the
+admission gate sheds logins, with 429.
+
+Run with: python tests/performance/bench_login_storm.py [logins] [searches]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench_login_storm.db")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ["SEARCH_CACHE_ENABLED"] = "False"
+os.environ["LOGIN_RATE_LIMIT_ENABLED"] = "False"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import httpx
+
+from src.auth import security
+from src.database import Base, SessionLocal, engine
+from src.main import app
+from src.models.flight_model import Flight
+from src.models.user_model import User
+
+EMAIL = "storm@example.com"
+PASSWORD = "StormPassword123!"
+
+
+def seed() -> None:
+    """Create the schema, one user and a page of flights."""
+    Base.metadata.create_all(engine)
+    start = datetime(2025, 1, 1)
+    with SessionLocal() as session:
+        session.add(User(
+            email=EMAIL, full_name="Storm", hashed_password=security.hash_password(PASSWORD), is_active=True
+        ))
+        session.add_all(
+            Flight(
+                flight_id=f"ST{i:04d}",
+                airline="Storm Air",
+                origin="LHE",
+                destination="DXB",
+                departure_time=start + timedelta(hours=i),
+                arrival_time=start + timedelta(hours=i + 3),
+                price=100.0 + i,
+                available_seats=150
+            )
+            for i in range(200)
+        )
+        session.commit()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of latency samples, in milliseconds."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] * 1000
+
+
+async def search_latencies(client: httpx.AsyncClient, searches: int) -> List[float]:
+    """Run searches one after another and time each."""
+    latencies = []
+    for _ in range(searches):
+        started = time.perf_counter()
+        response = await client.get("/search/flights", params={"origin": "LHE", "destination": "DXB"})
+        latencies.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+async def login(client: httpx.AsyncClient) -> int:
+    """Log in once and return the status code."""
+    response = await client.post("/auth/login", data={"username": EMAIL, "password": PASSWORD})
+    return response.status_code
+
+
+async def measure(logins: int, searches: int) -> tuple:
+    """Search latencies alone and during a storm of concurrent logins."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await search_latencies(client, 10)
+        quiet = await search_latencies(client, searches)
+        storm = asyncio.gather(*(login(client) for _ in range(logins)))
+        await asyncio.sleep(0)
+        loaded = await search_latencies(client, searches)
+        statuses = await storm
+    return quiet, loaded, statuses
+
+
+async def run_inline(fn, *args):
+    """Call bcrypt directly on the event loop (the old behaviour)."""
+    return fn(*args)
+
+
+def report(label: str, quiet: List[float], loaded: List[float], statuses: List[int]) -> None:
+    print(f"  {label}")
+    print(f"    search alone:        p50 {percentile(quiet, 50):7.1f} ms  p99 {percentile(quiet, 99):7.1f} ms")
+    print(f"    during login storm:  p50 {percentile(loaded, 50):7.1f} ms  p99 {percentile(loaded, 99):7.1f} ms"
+          f"  max {max(loaded) * 1000:7.1f} ms")
+    print(f"    logins: {statuses.count(200)} ok, {statuses.count(429)} shed (429), {statuses.count(503)} shed (503), "
+          f"mean search {statistics.mean(loaded) * 1000:.1f} ms")
+
+
+def main() -> None:
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    searches = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    seed()
+    pool = security.password_hasher
+    print(f"{logins} concurrent logins, {searches} sequential searches, "
+          f"pool of {pool.workers} workers + {pool.queue_size} queued")
+
+    report("bcrypt on the bounded pool", *asyncio.run(measure(logins, searches)))
+    pool.shutdown()
+
+    pool.run = run_inline
+    report("bcrypt inline on the event loop", *asyncio.run(measure(logins, searches)))
+
+
+if __name__ == "__main__":
+    main()
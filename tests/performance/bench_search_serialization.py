@@ -0,0 +1,110 @@
+"""
+Micro-benchmark: per-row CPU cost of flight search serialization.
+
+Compares the legacy path (hydrate ORM Flight objects, build a Flight schema
+per row, re-validate the list as FastAPI's response_model does, then encode
+JSON) with the single-pass path used by SearchService (select plain column
+rows and encode them straight to JSON bytes).
+
+Run with: python tests/performance/bench_search_serialization.py [rows]
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.database import Base
+from src.models.flight_model import Flight as FlightModel
+from src.schemas.search_schema import Flight
+from src.services.search_service import FLIGHT_COLUMNS, SearchService
+
+REPEATS = 5
+
+
+def seed(session: Session, rows: int) -> None:
+    """Insert ``rows`` flights on one route."""
+    start = datetime(2025, 1, 1)
+    session.add_all(
+        FlightModel(
+            flight_id=f"BM{i:06d}",
+            airline="Benchmark Air",
+            origin="LHE",
+            destination="DXB",
+            departure_time=start + timedelta(minutes=i),
+            arrival_time=start + timedelta(minutes=i, hours=3),
+            price=100.0 + i % 50,
+            available_seats=150
+        )
+        for i in range(rows)
+    )
+    session.commit()
+
+
+def legacy_path(session: Session) -> bytes:
+    """ORM hydration + per-row schema + response_model validation + JSON."""
+    flights = [
+        Flight(
+            id=f.id,
+            flight_id=f.flight_id,
+            airline=f.airline,
+            origin=f.origin,
+            destination=f.destination,
+            departure_time=f.departure_time.isoformat(),
+            arrival_time=f.arrival_time.isoformat(),
+            price=float(f.price),
+            currency=f.currency,
+            available_seats=f.available_seats
+        )
+        for f in session.scalars(select(FlightModel).order_by(FlightModel.departure_time))
+    ]
+    validated = TypeAdapter(List[Flight]).validate_python([f.model_dump() for f in flights])
+    return json.dumps([f.model_dump() for f in validated]).encode("utf-8")
+
+
+def single_pass_path(session: Session) -> bytes:
+    """Column rows serialized straight to JSON bytes."""
+    rows = session.execute(select(*FLIGHT_COLUMNS).order_by(FlightModel.departure_time)).all()
+    return SearchService.serialize_flights(rows)
+
+
+def best_of(fn, session: Session) -> float:
+    """Best wall time of REPEATS runs, with a fresh identity map each run."""
+    timings = []
+    for _ in range(REPEATS):
+        session.expunge_all()
+        started = time.perf_counter()
+        fn(session)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session, rows)
+        assert json.loads(legacy_path(session)) == json.loads(single_pass_path(session))
+
+        legacy = best_of(legacy_path, session)
+        single_pass = best_of(single_pass_path, session)
+
+    print(f"{rows} rows, best of {REPEATS}")
+    print(f"  legacy (ORM + schema + validation): {legacy * 1000:8.1f} ms  {legacy / rows * 1e6:6.2f} us/row")
+    print(f"  single pass (rows -> JSON bytes):   {single_pass * 1000:8.1f} ms  {single_pass / rows * 1e6:6.2f} us/row")
+    print(f"  speedup: {legacy / single_pass:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Shared helpers for the booking unit tests (the session_factory fixture is in conftest)."""
+from contextlib import contextmanager
+from sqlalchemy import event
+from src.schemas.booking_schema import BookingCreate, PassengerInfo
+
+SEATS = 10
+THREADS = 32
+ATTEMPTS = 96
+
+
+def booking_request(flight_id, passengers=1):
+    """Build a booking request for ``passengers`` travellers."""
+    passenger = PassengerInfo(first_name="A", last_name="B", passport_number="X1", date_of_birth="1990-01-01")
+    return BookingCreate(flight_id=flight_id, passengers=[passenger] * passengers)
+
+
+@contextmanager
+def recorded_statements(engine):
+    """Collect the SQL statements (excluding transaction control) run on ``engine``."""
+    statements = []
+    
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(("BEGIN", "COMMIT", "ROLLBACK")):
+            statements.append(statement.lstrip().split()[0].upper())
+    
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
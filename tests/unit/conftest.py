@@ -5,6 +5,13 @@ Defines fixtures and test configuration for the entire test suite.
 """
 
 import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from src.database import Base
+from src.models.flight_model import Flight as FlightModel
+from src.models.user_model import User  # noqa: F401  (registers the users table)
+from .booking_helpers import SEATS
 
 
 def pytest_configure(config):
@@ -21,3 +28,35 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: mark test as integration test"
     )
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite database (shared across threads) with a hot flight and a small one."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'inventory.db'}",
+        connect_args={"timeout": 30, "check_same_thread": False}
+    )
+    
+    # Take the write lock at BEGIN so concurrent writers queue instead of deadlocking
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, _):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+    
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with factory() as db:
+        departure = datetime.utcnow() + timedelta(days=1)
+        db.add(FlightModel(flight_id="HOT1", airline="PIA", origin="LHE", destination="DXB",
+                           departure_time=departure, arrival_time=departure + timedelta(hours=3),
+                           price=100.0, available_seats=SEATS))
+        db.add(FlightModel(flight_id="SMALL2", airline="PIA", origin="DXB", destination="JFK",
+                           departure_time=departure, arrival_time=departure + timedelta(hours=14),
+                           price=500.0, available_seats=2))
+        db.commit()
+    yield factory
+    engine.dispose()
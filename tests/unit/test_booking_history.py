@@ -0,0 +1,36 @@
+"""Unit tests for keyset-paginated booking history."""
+import pytest
+from src.services.booking_service import BookingService
+from .booking_helpers import booking_request
+
+
+@pytest.mark.booking
+class TestBookingHistory:
+    """Test suite for keyset-paginated booking history."""
+    
+    def test_pages_newest_first(self, session_factory):
+        """Test cursors walk every booking newest first without repeats."""
+        with session_factory() as db:
+            created = [BookingService.create_booking(db, booking_request(1), user_id=1).id for _ in range(5)]
+            BookingService.create_booking(db, booking_request(1), user_id=2)
+            
+            seen, cursor = [], None
+            while True:
+                page = BookingService.get_user_bookings(db, 1, limit=2, cursor=cursor)
+                seen += [b.id for b in page.items]
+                cursor = page.next_cursor
+                if not cursor:
+                    break
+            assert seen == created[::-1]
+    
+    def test_status_filter_and_summary(self, session_factory):
+        """Test status filtering and the summary view without passenger_data."""
+        with session_factory() as db:
+            kept = BookingService.create_booking(db, booking_request(1), user_id=1)
+            cancelled = BookingService.create_booking(db, booking_request(1), user_id=1)
+            BookingService.cancel_booking(db, cancelled.id, user_id=1)
+            
+            page = BookingService.get_user_bookings(db, 1, status="PENDING", summary=True)
+            assert [b.id for b in page.items] == [kept.id]
+            assert "passenger_data" not in page.items[0].model_dump()
+            assert page.next_cursor is None
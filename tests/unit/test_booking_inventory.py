@@ -0,0 +1,213 @@
+"""Unit tests for seat inventory, holds, group and idempotent booking in BookingService."""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from src.models.booking_model import Booking as BookingModel
+from src.models.flight_model import Flight as FlightModel
+from src.schemas.booking_schema import GroupBookingCreate
+from src.config import settings
+from src.services.booking_service import BookingService, IdempotencyKeyReused
+from .booking_helpers import ATTEMPTS, SEATS, THREADS, booking_request, recorded_statements
+
+
+@pytest.mark.booking
+class TestSeatInventory:
+    """Test suite for conditional seat reservation."""
+    
+    def test_booking_takes_and_cancel_returns_seats(self, session_factory):
+        """Test seats are decremented on booking and restored on cancel."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1, passengers=3), user_id=1)
+            assert db.get(FlightModel, 1).available_seats == SEATS - 3
+            BookingService.cancel_booking(db, booking.id, user_id=1)
+            db.expire_all()
+            assert db.get(FlightModel, 1).available_seats == SEATS
+    
+    def test_cancel_unreserved_booking_keeps_inventory(self, session_factory):
+        """Test cancelling a booking that predates seat reservation gives no seats back."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1, passengers=3), user_id=1)
+            db.get(BookingModel, booking.id).seats_reserved = False
+            db.commit()
+            assert BookingService.cancel_booking(db, booking.id, user_id=1).status == "CANCELLED"
+            db.expire_all()
+            assert db.get(FlightModel, 1).available_seats == SEATS - 3
+    
+    def test_cancel_statements(self, session_factory):
+        """Test cancel is one guarded booking UPDATE, the seat give-back and one passenger read."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1, passengers=2), user_id=1)
+            with recorded_statements(session_factory.kw["bind"]) as statements:
+                cancelled = BookingService.cancel_booking(db, booking.id, user_id=1)
+            assert statements == ["UPDATE", "UPDATE", "SELECT"]
+            assert cancelled.status == "CANCELLED"
+            assert cancelled.passenger_data == booking.passenger_data
+            assert db.get(FlightModel, 1).available_seats == SEATS
+    
+    def test_status_changes_bump_row_version(self, session_factory):
+        """Test guarded bulk UPDATEs advance updated_at, which ETags are built from."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1), user_id=1)
+            created = BookingService.get_booking_version(db, booking.id, user_id=1)
+            assert created == booking.updated_at
+            cancelled = BookingService.cancel_booking(db, booking.id, user_id=1)
+            assert cancelled.updated_at > created
+            assert BookingService.get_booking_version(db, booking.id, user_id=1) == cancelled.updated_at
+            assert BookingService.get_booking_version(db, booking.id, user_id=2) is None
+    
+    def test_cancel_guards(self, session_factory):
+        """Test another user's or an already cancelled booking is left alone."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1), user_id=1)
+            assert BookingService.cancel_booking(db, booking.id, user_id=2) is None
+            BookingService.cancel_booking(db, booking.id, user_id=1)
+            with pytest.raises(ValueError, match="already cancelled"):
+                BookingService.cancel_booking(db, booking.id, user_id=1)
+            assert db.get(FlightModel, 1).available_seats == SEATS
+    
+    def test_rejects_oversell_and_unknown_flight(self, session_factory):
+        """Test too many passengers or a missing flight leave inventory untouched."""
+        with session_factory() as db:
+            with pytest.raises(ValueError, match="Not enough available seats"):
+                BookingService.create_booking(db, booking_request(1, passengers=SEATS + 1), user_id=1)
+            with pytest.raises(ValueError, match="not found"):
+                BookingService.create_booking(db, booking_request(99), user_id=1)
+            assert db.get(FlightModel, 1).available_seats == SEATS
+    
+    def test_no_oversell_under_contention(self, session_factory):
+        """Test many parallel bookings on one flight never sell more seats than exist."""
+        def attempt(_):
+            with session_factory() as db:
+                try:
+                    BookingService.create_booking(db, booking_request(1), user_id=1)
+                    return True
+                except ValueError:
+                    return False
+        
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            results = list(pool.map(attempt, range(ATTEMPTS)))
+        
+        with session_factory() as db:
+            assert sum(results) == SEATS
+            assert db.query(BookingModel).count() == SEATS
+            assert db.get(FlightModel, 1).available_seats == 0
+
+
+@pytest.mark.booking
+class TestHoldExpiry:
+    """Test suite for expiring unconfirmed (PENDING) seat holds."""
+    
+    @pytest.fixture(autouse=True)
+    def hold_ttl(self, monkeypatch):
+        """Turn hold expiry on (it is off by default)."""
+        monkeypatch.setattr(settings, "BOOKING_HOLD_TTL_MINUTES", 15)
+    
+    def test_disabled_by_default(self, session_factory, monkeypatch):
+        """Test nothing expires unless BOOKING_HOLD_TTL_MINUTES is set."""
+        monkeypatch.undo()
+        assert settings.BOOKING_HOLD_TTL_MINUTES == 0
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1), user_id=1)
+            assert BookingService.expire_stale_holds(db, now=datetime.utcnow() + timedelta(days=1)) == 0
+            assert db.get(BookingModel, booking.id).status == "PENDING"
+    
+    def test_unreserved_bookings_never_expire(self, session_factory):
+        """Test bookings that predate seat reservation are not expired and release nothing."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1, passengers=3), user_id=1)
+            db.get(BookingModel, booking.id).seats_reserved = False
+            db.commit()
+            assert BookingService.expire_stale_holds(db, now=datetime.utcnow() + timedelta(days=1)) == 0
+            db.expire_all()
+            assert db.get(BookingModel, booking.id).status == "PENDING"
+            assert db.get(FlightModel, 1).available_seats == SEATS - 3
+    
+    def test_sweeper_expires_stale_holds_only(self, session_factory):
+        """Test stale holds expire and give seats back; fresh and confirmed ones stay."""
+        with session_factory() as db:
+            stale = BookingService.create_booking(db, booking_request(1, passengers=2), user_id=1)
+            fresh = BookingService.create_booking(db, booking_request(1), user_id=1)
+            confirmed = BookingService.create_booking(db, booking_request(1), user_id=1)
+            BookingService.confirm_booking(db, confirmed.id, user_id=1)
+            db.get(BookingModel, stale.id).created_at -= timedelta(hours=1)
+            db.get(BookingModel, confirmed.id).created_at -= timedelta(hours=1)
+            db.commit()
+            
+            assert BookingService.expire_stale_holds(db) == 1
+            db.expire_all()
+            assert db.get(BookingModel, stale.id).status == "EXPIRED"
+            assert db.get(BookingModel, fresh.id).status == "PENDING"
+            assert db.get(BookingModel, confirmed.id).status == "CONFIRMED"
+            assert db.get(FlightModel, 1).available_seats == SEATS - 2
+    
+    def test_expired_hold_cannot_be_confirmed_or_cancelled(self, session_factory):
+        """Test an expired booking keeps its status and does not release seats twice."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1), user_id=1)
+            BookingService.expire_stale_holds(db, now=datetime.utcnow() + timedelta(days=1))
+            with pytest.raises(ValueError, match="expired"):
+                BookingService.confirm_booking(db, booking.id, user_id=1)
+            with pytest.raises(ValueError, match="expired"):
+                BookingService.cancel_booking(db, booking.id, user_id=1)
+            assert db.get(FlightModel, 1).available_seats == SEATS
+
+
+@pytest.mark.booking
+class TestGroupBooking:
+    """Test suite for all-or-nothing multi-flight booking."""
+    
+    def test_books_every_leg(self, session_factory):
+        """Test each leg is booked and priced, in request order."""
+        with session_factory() as db:
+            group = GroupBookingCreate(bookings=[booking_request(2, passengers=2), booking_request(1, passengers=2)])
+            bookings = BookingService.create_group_booking(db, group, user_id=1)
+            assert [(b.flight_id, b.total_price) for b in bookings] == [(2, 1000.0), (1, 200.0)]
+            assert db.get(FlightModel, 1).available_seats == SEATS - 2
+            assert db.get(FlightModel, 2).available_seats == 0
+    
+    def test_all_or_nothing(self, session_factory):
+        """Test one sold-out leg (counting repeats of a flight) books nothing."""
+        with session_factory() as db:
+            group = GroupBookingCreate(bookings=[
+                booking_request(1), booking_request(2, passengers=2), booking_request(2)
+            ])
+            with pytest.raises(ValueError, match="flight 2"):
+                BookingService.create_group_booking(db, group, user_id=1)
+            assert db.query(BookingModel).count() == 0
+            assert db.get(FlightModel, 1).available_seats == SEATS
+
+
+@pytest.mark.booking
+class TestIdempotentBooking:
+    """Test suite for Idempotency-Key handling on booking creation."""
+    
+    def test_retry_replays_original_booking(self, session_factory):
+        """Test a retry with the same key returns the first booking without booking again."""
+        with session_factory() as db:
+            first = BookingService.create_booking(db, booking_request(1, passengers=2), 1, "retry-1")
+            again = BookingService.create_booking(db, booking_request(1, passengers=2), 1, "retry-1")
+            assert again == first
+            assert db.query(BookingModel).count() == 1
+            assert db.get(FlightModel, 1).available_seats == SEATS - 2
+    
+    def test_key_reused_with_other_body(self, session_factory):
+        """Test a key cannot be replayed for a different request, but is scoped per user."""
+        with session_factory() as db:
+            BookingService.create_booking(db, booking_request(1), 1, "key")
+            with pytest.raises(IdempotencyKeyReused):
+                BookingService.create_booking(db, booking_request(1, passengers=2), 1, "key")
+            BookingService.create_booking(db, booking_request(1), 2, "key")
+            assert db.query(BookingModel).count() == 2
+    
+    def test_concurrent_retries_book_once(self, session_factory):
+        """Test parallel retries of one request create a single booking."""
+        def attempt(_):
+            with session_factory() as db:
+                return BookingService.create_booking(db, booking_request(1), 1, "storm").id
+        
+        with ThreadPoolExecutor(max_workers=THREADS) as pool:
+            booking_ids = set(pool.map(attempt, range(THREADS)))
+        
+        with session_factory() as db:
+            assert len(booking_ids) == 1
+            assert db.get(FlightModel, 1).available_seats == SEATS - 1
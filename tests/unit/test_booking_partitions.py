@@ -0,0 +1,77 @@
+"""Unit tests for booking partition planning."""
+from datetime import date, datetime
+from src.services import booking_partitions
+from src.services.booking_partitions import (
+    add_months, months_to_create, partition_month, partition_name, partitions_to_archive
+)
+
+
+class RecordingSession:
+    """Stand-in session that records the SQL it is given."""
+    
+    def __init__(self):
+        self.statements = []
+    
+    def execute(self, statement):
+        self.statements.append(str(statement))
+    
+    def commit(self):
+        self.statements.append("COMMIT")
+
+
+class TestBookingPartitions:
+    """Test suite for monthly partition names, creation and archival windows."""
+    
+    def test_add_months_crosses_years(self):
+        """Test month arithmetic wraps forwards and backwards over year ends."""
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    
+    def test_partition_name_round_trips(self):
+        """Test partition names map back to their month; other tables do not."""
+        assert partition_name(date(2026, 3, 1)) == "bookings_y2026m03"
+        assert partition_month("bookings_y2026m03") == date(2026, 3, 1)
+        assert partition_month("bookings_default") is None
+    
+    def test_months_to_create_covers_current_and_ahead(self):
+        """Test the current month and the configured future months are planned."""
+        months = months_to_create(datetime(2026, 12, 15, 8, 30), 2)
+        assert months == [date(2026, 12, 1), date(2027, 1, 1), date(2027, 2, 1)]
+    
+    def test_archive_detaches_only_months_past_horizon(self):
+        """Test only monthly partitions older than the horizon are picked, oldest first."""
+        names = ["bookings_y2026m10", "bookings_y2026m07", "bookings_y2026m06", "bookings_default"]
+        now = datetime(2026, 10, 17)
+        assert partitions_to_archive(names, now, 3) == ["bookings_y2026m06"]
+        assert partitions_to_archive(names, now, 0) == []
+    
+    def test_create_moves_default_rows_before_attaching(self, monkeypatch):
+        """Test a new month takes its rows out of the default partition before it is attached."""
+        monkeypatch.setattr(booking_partitions.settings, "BOOKING_PARTITION_MONTHS_AHEAD", 1)
+        monkeypatch.setattr(booking_partitions, "attached_partitions", lambda db: ["bookings_y2026m10"])
+        db = RecordingSession()
+        
+        assert booking_partitions.create_partitions(db, datetime(2026, 10, 17)) == ["bookings_y2026m11"]
+        create, move, attach, commit = db.statements
+        assert create.startswith("CREATE TABLE bookings_y2026m11 (LIKE bookings ")
+        assert move.startswith("WITH moved AS (DELETE FROM bookings_default WHERE created_at >= '2026-11-01'")
+        assert move.endswith("INSERT INTO bookings_y2026m11 SELECT * FROM moved")
+        assert attach == (
+            "ALTER TABLE bookings ATTACH PARTITION bookings_y2026m11 "
+            "FOR VALUES FROM ('2026-11-01') TO ('2026-12-01')"
+        )
+        assert commit == "COMMIT"
+    
+    def test_archive_moves_passengers_with_their_month(self, monkeypatch):
+        """Test a detached month's passengers move to its archive table in the same transaction."""
+        monkeypatch.setattr(booking_partitions.settings, "BOOKING_ARCHIVE_AFTER_MONTHS", 3)
+        monkeypatch.setattr(booking_partitions, "attached_partitions", lambda db: ["bookings_y2026m06", "bookings_y2026m10"])
+        db = RecordingSession()
+        
+        assert booking_partitions.archive_partitions(db, datetime(2026, 10, 17)) == ["bookings_y2026m06"]
+        detach, create, move, commit = db.statements
+        assert detach == "ALTER TABLE bookings DETACH PARTITION bookings_y2026m06"
+        assert "booking_passengers_y2026m06 (LIKE booking_passengers)" in create
+        assert move.startswith("WITH moved AS (DELETE FROM booking_passengers p USING bookings_y2026m06 b")
+        assert move.endswith("INSERT INTO booking_passengers_y2026m06 SELECT * FROM moved")
+        assert commit == "COMMIT"
@@ -0,0 +1,37 @@
+"""Unit tests for booking passenger rows and flight manifests."""
+import pytest
+from src.models.booking_model import Booking as BookingModel
+from src.schemas.booking_schema import BookingCreate, PassengerInfo
+from src.services.booking_service import BookingService
+from .booking_helpers import booking_request
+
+
+@pytest.mark.booking
+class TestPassengerManifest:
+    """Test suite for normalized passenger rows and flight manifests."""
+    
+    def test_passengers_stored_as_rows(self, session_factory):
+        """Test a booking's passengers become ordered rows and rebuild passenger_data."""
+        with session_factory() as db:
+            booking = BookingService.create_booking(db, booking_request(1, passengers=3), user_id=1)
+            db.expire_all()
+            stored = db.get(BookingModel, booking.id)
+            assert stored.seats == 3
+            assert [p.position for p in stored.passengers] == [0, 1, 2]
+            assert BookingService.get_booking(db, booking.id, user_id=1).passenger_data == booking.passenger_data
+            assert booking.passenger_data["flight_info"]["flight_id"] == "HOT1"
+    
+    def test_manifest_lists_active_passengers_by_name(self, session_factory):
+        """Test the manifest is name-ordered, skips cancelled bookings and flags unknown flights."""
+        passenger = lambda last: PassengerInfo(first_name="A", last_name=last, passport_number=last, date_of_birth="1990-01-01")
+        with session_factory() as db:
+            kept = BookingService.create_booking(
+                db, BookingCreate(flight_id=1, passengers=[passenger("Zed"), passenger("Adams")]), user_id=1
+            )
+            cancelled = BookingService.create_booking(db, BookingCreate(flight_id=1, passengers=[passenger("Moe")]), user_id=2)
+            BookingService.cancel_booking(db, cancelled.id, user_id=2)
+            
+            manifest = BookingService.get_flight_manifest(db, 1)
+            assert [(e.last_name, e.booking_id) for e in manifest] == [("Adams", kept.id), ("Zed", kept.id)]
+            assert BookingService.get_flight_manifest(db, 2) == []
+            assert BookingService.get_flight_manifest(db, 99) is None
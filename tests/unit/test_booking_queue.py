@@ -0,0 +1,101 @@
+"""Unit tests for the background booking queue and its batch writer."""
+import asyncio
+import pytest
+from src import database
+from src.models.flight_model import Flight as FlightModel
+from src.schemas.booking_schema import BookingJobStatus
+from src.services.booking_queue import BookingJob, BookingQueue, BookingQueueFull, process_booking_batch
+from .booking_helpers import SEATS, booking_request
+
+
+@pytest.mark.booking
+class TestBookingQueue:
+    """Test suite for the background booking queue and its batch writer."""
+    
+    def test_batch_groups_by_flight_and_falls_back(self, session_factory, monkeypatch):
+        """Test a batch books whole flights together and splits a flight that runs out of seats."""
+        monkeypatch.setattr(database, "SessionLocal", session_factory)
+        jobs = [BookingJob(f"hot{i}", 1, booking_request(1)) for i in range(3)]
+        jobs += [BookingJob(f"small{i}", 2, booking_request(2)) for i in range(3)]
+        
+        results = process_booking_batch(jobs)
+        
+        assert [results[f"hot{i}"].status for i in range(3)] == ["succeeded"] * 3
+        assert [results[f"small{i}"].status for i in range(3)] == ["succeeded", "succeeded", "failed"]
+        assert "Not enough available seats" in results["small2"].error
+        with session_factory() as db:
+            assert db.get(FlightModel, 1).available_seats == SEATS - 3
+            assert db.get(FlightModel, 2).available_seats == 0
+    
+    def test_submit_poll_and_backpressure(self, session_factory, monkeypatch):
+        """Test jobs are written by a writer, visible only to their owner, and refused when full."""
+        monkeypatch.setattr(database, "SessionLocal", session_factory)
+        
+        async def run():
+            queue = BookingQueue(max_size=2, batch_size=10, result_ttl_seconds=60, max_results=100)
+            with pytest.raises(BookingQueueFull):
+                queue.submit(1, booking_request(1))
+            # Writers only run once this coroutine yields, so both jobs stay queued until then
+            tasks = queue.start(workers=1)
+            first = queue.submit(1, booking_request(1))
+            queue.submit(1, booking_request(1))
+            with pytest.raises(BookingQueueFull):
+                queue.submit(1, booking_request(1))
+            assert queue.get_status(first.job_id, 1).status == "queued"
+            assert queue.get_status(first.job_id, 2) is None
+            
+            await queue.stop(timeout_seconds=10)
+            for task in tasks:
+                task.cancel()
+            return queue, queue.get_status(first.job_id, 1)
+        
+        queue, status = asyncio.run(run())
+        assert status.status == "succeeded"
+        assert status.booking.flight_id == 1
+        assert queue.stats()["succeeded"] == 2
+        assert queue.stats()["rejected"] == 1
+        assert queue.stats()["batches"] == 1
+    
+    def test_finished_statuses_kept_until_ttl(self):
+        """Test finished statuses are never evicted early; a full store refuses new jobs instead."""
+        now = [0.0]
+        done = lambda jobs: {job.job_id: BookingJobStatus(job_id=job.job_id, status="succeeded") for job in jobs}
+        
+        async def run():
+            queue = BookingQueue(max_size=2, batch_size=10, result_ttl_seconds=60, max_results=2,
+                                 processor=done, clock=lambda: now[0])
+            tasks = queue.start(workers=1)
+            jobs = [queue.submit(1, booking_request(1)) for _ in range(2)]
+            while queue.stats()["depth"] or queue.stats()["succeeded"] < 2:
+                await asyncio.sleep(0.01)
+            with pytest.raises(BookingQueueFull):
+                queue.submit(1, booking_request(1))
+            statuses = [queue.get_status(job.job_id, 1).status for job in jobs]
+            
+            now[0] += 61
+            queue.submit(1, booking_request(1))
+            expired = queue.get_status(jobs[0].job_id, 1)
+            for task in tasks:
+                task.cancel()
+            return statuses, expired
+        
+        statuses, expired = asyncio.run(run())
+        assert statuses == ["succeeded", "succeeded"]
+        assert expired is None
+    
+    def test_stop_fails_jobs_left_unwritten(self):
+        """Test stopping refuses new jobs and marks jobs not written in time failed."""
+        async def run():
+            queue = BookingQueue(max_size=2, batch_size=10, result_ttl_seconds=60, max_results=100)
+            queue.start(workers=0)
+            job = queue.submit(1, booking_request(1))
+            await queue.stop(timeout_seconds=0.01)
+            with pytest.raises(BookingQueueFull):
+                queue.submit(1, booking_request(1))
+            return queue, queue.get_status(job.job_id, 1)
+        
+        queue, status = asyncio.run(run())
+        assert status.status == "failed"
+        assert "stopped" in status.error
+        assert queue.stats()["depth"] == 0
+        assert queue.stats()["failed"] == 1
@@ -0,0 +1,76 @@
+"""Unit tests for the TTL/LRU result cache."""
+from src.services.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+    
+    def test_hit_and_miss(self):
+        """Test cached values are returned and misses are counted."""
+        cache = TTLCache(max_entries=4, ttl_seconds=10)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+    
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL has passed."""
+        clock = FakeClock()
+        cache = TTLCache(max_entries=4, ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["size"] == 0
+    
+    def test_entry_ttl_overrides_default(self):
+        """Test a per-entry TTL replaces the cache-wide lifetime."""
+        clock = FakeClock()
+        cache = TTLCache(max_entries=4, ttl_seconds=10, clock=clock)
+        cache.set("short", 1, ttl_seconds=2)
+        cache.set("default", 2)
+        clock.now = 2
+        assert cache.get("short") is None
+        assert cache.get("default") == 2
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(max_entries=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+    
+    def test_invalidate_tag(self):
+        """Test tag invalidation removes only the tagged entries."""
+        cache = TTLCache(max_entries=4, ttl_seconds=10)
+        cache.set("a", 1, tags=["LHE-DXB"])
+        cache.set("b", 2, tags=["LHE-DXB"])
+        cache.set("c", 3, tags=["JFK-LHR"])
+        assert cache.invalidate_tag("LHE-DXB") == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+        assert cache.invalidate_tag("LHE-DXB") == 0
+    
+    def test_overwrite_replaces_tags(self):
+        """Test re-setting a key drops its previous tags."""
+        cache = TTLCache(max_entries=4, ttl_seconds=10)
+        cache.set("a", 1, tags=["old"])
+        cache.set("a", 2, tags=["new"])
+        assert cache.invalidate_tag("old") == 0
+        assert cache.get("a") == 2
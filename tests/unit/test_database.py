@@ -0,0 +1,25 @@
+"""Unit tests for database configuration helpers."""
+from src.database import to_async_url
+
+
+class TestAsyncURL:
+    """Test conversion of sync database URLs to async drivers."""
+    
+    def test_postgresql_uses_asyncpg(self):
+        """Test plain PostgreSQL URLs switch to asyncpg."""
+        url = to_async_url("postgresql://user:pw@localhost:5432/travel")
+        assert url == "postgresql+asyncpg://user:pw@localhost:5432/travel"
+    
+    def test_psycopg2_uses_asyncpg(self):
+        """Test explicit psycopg2 URLs switch to asyncpg."""
+        url = to_async_url("postgresql+psycopg2://user:pw@localhost/travel")
+        assert url == "postgresql+asyncpg://user:pw@localhost/travel"
+    
+    def test_sqlite_uses_aiosqlite(self):
+        """Test SQLite URLs switch to aiosqlite."""
+        assert to_async_url("sqlite:///./travel.db") == "sqlite+aiosqlite:///./travel.db"
+    
+    def test_async_url_unchanged(self):
+        """Test URLs that already name an async driver are left alone."""
+        url = "postgresql+asyncpg://user:pw@localhost/travel"
+        assert to_async_url(url) == url
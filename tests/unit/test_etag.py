@@ -0,0 +1,59 @@
+"""Unit tests for weak ETag helpers."""
+import asyncio
+from datetime import datetime
+from fastapi import Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from src.database import Base
+from src.etag import etag_matches, not_modified, weak_etag
+from src.models.user_model import User as UserModel
+from src.routes import users
+from src.schemas.auth_schema import User
+
+
+class TestWeakETag:
+    """Test suite for ETag generation and If-None-Match matching."""
+    
+    def test_etag_tracks_version(self):
+        """Test the tag is weak and changes with the row version."""
+        etag = weak_etag("booking", 7, datetime(2026, 1, 1, 12, 0, 0, 5))
+        assert etag.startswith('W/"booking-7-')
+        assert etag != weak_etag("booking", 7, datetime(2026, 1, 1, 12, 0, 0, 6))
+    
+    def test_if_none_match_uses_weak_comparison(self):
+        """Test strong or weak forms, lists and '*' match; other tags do not."""
+        etag = weak_etag("user", 1, datetime(2026, 1, 1))
+        assert etag_matches(etag, etag)
+        assert etag_matches(etag.removeprefix("W/"), etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('W/"user-1-0"', etag)
+        assert not etag_matches(None, etag)
+    
+    def test_not_modified_has_no_body(self):
+        """Test the 304 response repeats the ETag and is empty."""
+        response = not_modified('W/"x"')
+        assert response.status_code == 304
+        assert response.headers["etag"] == 'W/"x"'
+        assert response.body == b""
+    
+    def test_profile_304_skips_validation(self, monkeypatch):
+        """Test /users/me answers a matching If-None-Match from the row, before validating it."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add(UserModel(id=1, email="user@example.com", full_name="User", hashed_password="x",
+                             updated_at=datetime(2026, 1, 1)))
+            db.commit()
+            current_user = User(id=1, email="user@example.com", full_name="User")
+            etag = weak_etag("user", 1, datetime(2026, 1, 1))
+            
+            def must_not_validate(row):
+                raise AssertionError("profile validated for a 304")
+            
+            monkeypatch.setattr(users.User, "model_validate", must_not_validate)
+            response = asyncio.run(users.get_current_user_profile(Response(), etag, current_user, db))
+        engine.dispose()
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
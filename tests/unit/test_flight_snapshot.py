@@ -0,0 +1,77 @@
+"""Unit tests for the in-memory columnar flight snapshot."""
+import pytest
+from datetime import date, datetime, timedelta
+from src.schemas.search_schema import FlightSearchParams
+from src.services.flight_snapshot import FlightRow, FlightSnapshot
+
+START = datetime(2025, 1, 15, 8, 0)
+
+
+def make_row(flight_db_id, origin="LHE", destination="DXB", hours=0, seats=100):
+    """Build a flight row departing ``hours`` after START."""
+    departure = START + timedelta(hours=hours)
+    return FlightRow(flight_db_id, f"FL{flight_db_id:03d}", "PIA", origin, destination,
+                     departure, departure + timedelta(hours=3), 400.0, "USD", seats)
+
+
+@pytest.fixture
+def snapshot():
+    """Snapshot loaded with two routes, rows deliberately unsorted."""
+    snap = FlightSnapshot()
+    snap.load([
+        make_row(3, hours=48),
+        make_row(1, hours=0),
+        make_row(2, hours=24, seats=1),
+        make_row(4, origin="JFK", destination="LHR"),
+    ])
+    return snap
+
+
+@pytest.mark.search
+class TestFlightSnapshot:
+    """Test suite for FlightSnapshot search and refresh."""
+    
+    def test_route_sorted_by_departure(self, snapshot):
+        """Test route search returns the route's flights in departure order."""
+        rows = snapshot.search(FlightSearchParams(origin="lhe", destination="dxb"), limit=10)
+        assert [r.id for r in rows] == [1, 2, 3]
+        assert rows[0].departure_time == START
+    
+    def test_unknown_route_falls_back(self, snapshot):
+        """Test searches the snapshot cannot answer return None."""
+        assert snapshot.search(FlightSearchParams(origin="LHE", destination="KHI"), limit=10) is None
+        assert snapshot.search(FlightSearchParams(origin="LHE"), limit=10) is None
+        assert FlightSnapshot().search(FlightSearchParams(origin="LHE", destination="DXB"), limit=10) is None
+    
+    def test_date_window(self, snapshot):
+        """Test departure date window is applied by binary search."""
+        params = FlightSearchParams(origin="LHE", destination="DXB", departure_date=date(2025, 1, 16))
+        assert [r.id for r in snapshot.search(params, limit=10)] == [2]
+    
+    def test_seats_and_limit(self, snapshot):
+        """Test seat filter and row limit."""
+        params = FlightSearchParams(origin="LHE", destination="DXB", passengers=2)
+        assert [r.id for r in snapshot.search(params, limit=1)] == [1]
+        assert [r.id for r in snapshot.search(params, limit=10)] == [1, 3]
+    
+    def test_resume_after_cursor(self, snapshot):
+        """Test keyset resume skips rows up to and including the cursor."""
+        params = FlightSearchParams(origin="LHE", destination="DXB")
+        rows = snapshot.search(params, limit=10, after=(START + timedelta(hours=24), 2))
+        assert [r.id for r in rows] == [3]
+    
+    def test_seat_change_patched_in_place(self, snapshot):
+        """Test seat changes are patched without a rebuild."""
+        snapshot.apply_changes([make_row(2, hours=24, seats=50)])
+        assert snapshot.rebuilds == 1
+        assert snapshot.patches == 1
+        params = FlightSearchParams(origin="LHE", destination="DXB", passengers=2)
+        assert [r.id for r in snapshot.search(params, limit=10)] == [1, 2, 3]
+    
+    def test_moved_flight_rebuilds(self, snapshot):
+        """Test new flights and departure changes trigger a rebuild."""
+        snapshot.apply_changes([make_row(1, hours=72), make_row(5, origin="LHE", destination="KHI")])
+        assert snapshot.rebuilds == 2
+        rows = snapshot.search(FlightSearchParams(origin="LHE", destination="DXB"), limit=10)
+        assert [r.id for r in rows] == [2, 3, 1]
+        assert snapshot.search(FlightSearchParams(origin="LHE", destination="KHI"), limit=10)[0].id == 5
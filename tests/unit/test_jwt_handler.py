@@ -48,6 +48,13 @@ class TestJWTHandler:
         assert payload is not None
         assert payload.get("sub") == email
     
+    def test_tokens_get_unique_ids(self):
+        """Test every token carries its own jti and an issued-at time."""
+        first = decode_access_token(create_access_token({"sub": "test@example.com"}))
+        second = decode_access_token(create_access_token({"sub": "test@example.com"}))
+        assert first["jti"] != second["jti"]
+        assert first["iat"] <= second["iat"]
+    
     def test_verify_invalid_token(self):
         """Test verifying an invalid token."""
         # Arrange
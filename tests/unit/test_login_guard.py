@@ -0,0 +1,132 @@
+"""Unit tests for login throttling and admission control."""
+import asyncio
+import pytest
+from src.auth.login_guard import LoginGuard, LoginThrottled, TokenBucketLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_guard(max_concurrent: int = 1, queue_size: int = 1, timeout_seconds: float = 1.0) -> LoginGuard:
+    """Build a guard whose rate limits never trigger."""
+    return LoginGuard(
+        ip_limiter=TokenBucketLimiter(100, 0, 100),
+        account_limiter=TokenBucketLimiter(100, 0, 100),
+        max_concurrent=max_concurrent,
+        queue_size=queue_size,
+        timeout_seconds=timeout_seconds
+    )
+
+
+class TestTokenBucketLimiter:
+    """Test suite for per-key token buckets."""
+    
+    def test_burst_then_refill(self):
+        """Test a key gets its burst, is refused with a retry time, then refills."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(burst=3, per_minute=60, max_keys=10, clock=clock)
+        assert [limiter.acquire("1.2.3.4") for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire("1.2.3.4") == pytest.approx(1.0)
+        assert limiter.acquire("5.6.7.8") == 0.0
+        
+        clock.now += 1.0
+        assert limiter.acquire("1.2.3.4") == 0.0
+        assert limiter.acquire("1.2.3.4") > 0
+        
+        clock.now += 60.0
+        assert [limiter.acquire("1.2.3.4") for _ in range(3)] == [0.0, 0.0, 0.0]
+    
+    def test_zero_rate_disables(self):
+        """Test a limiter with no refill rate never refuses."""
+        limiter = TokenBucketLimiter(burst=1, per_minute=0, max_keys=10)
+        assert all(limiter.acquire("key") == 0.0 for _ in range(10))
+
+
+class TestLoginGuard:
+    """Test suite for login admission."""
+    
+    def test_ip_and_account_limits(self):
+        """Test attempts are refused per IP and per (case-insensitive) account from one IP."""
+        clock = FakeClock()
+        guard = LoginGuard(
+            ip_limiter=TokenBucketLimiter(3, 60, 10, clock=clock),
+            account_limiter=TokenBucketLimiter(2, 60, 10, clock=clock),
+            max_concurrent=1,
+            queue_size=0,
+            timeout_seconds=1.0
+        )
+        guard.check_limits("1.1.1.1", "victim@example.com")
+        guard.check_limits("1.1.1.1", "VICTIM@example.com ")
+        with pytest.raises(LoginThrottled) as exc:
+            guard.check_limits("1.1.1.1", "victim@example.com")
+        assert exc.value.retry_after_header == "1"
+        # The account's owner on another address is not locked out
+        guard.check_limits("2.2.2.2", "victim@example.com")
+        
+        guard.check_limits("3.3.3.3", "a@example.com")
+        guard.check_limits("3.3.3.3", "b@example.com")
+        guard.check_limits("3.3.3.3", "c@example.com")
+        with pytest.raises(LoginThrottled):
+            guard.check_limits("3.3.3.3", "d@example.com")
+        assert guard.stats()["rejected_ip"] == 1
+        assert guard.stats()["rejected_account"] == 1
+    
+    def test_queue_then_shed(self):
+        """Test attempts beyond the slots wait, and beyond the queue are shed."""
+        guard = make_guard(max_concurrent=1, queue_size=1)
+        
+        async def run():
+            release = asyncio.Event()
+            order = []
+        
+            async def attempt(name):
+                async with guard.admit("1.1.1.1", f"{name}@example.com"):
+                    order.append(name)
+                    await release.wait()
+        
+            first = asyncio.ensure_future(attempt("first"))
+            second = asyncio.ensure_future(attempt("second"))
+            await asyncio.sleep(0)
+            with pytest.raises(LoginThrottled):
+                await attempt("third")
+            release.set()
+            await asyncio.gather(first, second)
+            return order
+        
+        assert asyncio.run(run()) == ["first", "second"]
+        assert guard.stats() == {
+            "served": 2, "queued": 1, "waiting": 0, "rejected_ip": 0,
+            "rejected_account": 0, "shed": 1, "timed_out": 0,
+        }
+    
+    def test_wait_times_out(self):
+        """Test a queued attempt is refused once it waits too long, freeing its place."""
+        guard = make_guard(max_concurrent=1, queue_size=1, timeout_seconds=0.05)
+        
+        async def run():
+            release = asyncio.Event()
+        
+            async def hold():
+                async with guard.admit(None, "holder@example.com"):
+                    await release.wait()
+        
+            holder = asyncio.ensure_future(hold())
+            await asyncio.sleep(0)
+            with pytest.raises(LoginThrottled):
+                async with guard.admit(None, "waiter@example.com"):
+                    pass
+            release.set()
+            await holder
+            async with guard.admit(None, "later@example.com"):
+                pass
+        
+        asyncio.run(run())
+        assert guard.stats()["timed_out"] == 1
+        assert guard.stats()["served"] == 2
@@ -0,0 +1,50 @@
+"""Unit tests for the verified-principal cache."""
+import time
+import pytest
+from src.auth import principal_cache
+from src.schemas.auth_schema import User
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty cache."""
+    principal_cache.principal_cache.clear()
+    yield
+    principal_cache.principal_cache.clear()
+
+
+def make_user(user_id: int = 1) -> User:
+    """Build a user schema as get_current_user returns it."""
+    return User(id=user_id, email=f"user{user_id}@example.com", full_name="Cached User")
+
+
+class TestPrincipalCache:
+    """Test suite for caching the user a token resolves to."""
+    
+    def test_cached_until_invalidated(self):
+        """Test a verified token is served from cache until its user is invalidated."""
+        principal_cache.cache_principal("token-a", make_user(1), time.time() + 3600)
+        principal_cache.cache_principal("token-b", make_user(1), time.time() + 3600)
+        principal_cache.cache_principal("token-c", make_user(2), time.time() + 3600)
+        assert principal_cache.get_principal("token-a").id == 1
+        
+        assert principal_cache.invalidate_user(1) == 2
+        assert principal_cache.get_principal("token-a") is None
+        assert principal_cache.get_principal("token-b") is None
+        assert principal_cache.get_principal("token-c").id == 2
+    
+    def test_entry_never_outlives_token(self):
+        """Test expired tokens are not cached and the TTL is capped at exp."""
+        principal_cache.cache_principal("expired", make_user(), time.time() - 1)
+        assert principal_cache.get_principal("expired") is None
+        
+        principal_cache.cache_principal("expiring", make_user(), time.time() + 0.05)
+        assert principal_cache.get_principal("expiring") is not None
+        time.sleep(0.1)
+        assert principal_cache.get_principal("expiring") is None
+    
+    def test_disabled(self, monkeypatch):
+        """Test nothing is cached when the cache is disabled."""
+        monkeypatch.setattr(principal_cache.settings, "PRINCIPAL_CACHE_ENABLED", False)
+        principal_cache.cache_principal("token", make_user(), time.time() + 3600)
+        assert principal_cache.get_principal("token") is None
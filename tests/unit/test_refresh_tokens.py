@@ -0,0 +1,58 @@
+"""Unit tests for rotating refresh tokens."""
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.database import Base
+from src.models.refresh_token_model import RefreshToken
+from src.models.user_model import User as UserModel
+from src.services.auth_service import AuthService
+
+
+@pytest.fixture
+def db():
+    """In-memory database with one active user."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(UserModel(id=1, email="user@example.com", full_name="User", hashed_password="x", is_active=True))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestRefreshTokens:
+    """Test suite for refresh token issue, rotation and reuse detection."""
+    
+    def test_rotation_issues_successor(self, db):
+        """Test a refresh token works once and its successor works next."""
+        token = AuthService.issue_refresh_token(db, 1)
+        user, successor = AuthService.rotate_refresh_token(db, token)
+        assert user.id == 1
+        assert successor != token
+        assert AuthService.rotate_refresh_token(db, successor) is not None
+        # Only hashes are stored
+        assert db.scalar(select(RefreshToken).where(RefreshToken.token_hash == token)) is None
+    
+    def test_reuse_revokes_session(self, db):
+        """Test replaying a spent token revokes every token of its session, not other sessions."""
+        token = AuthService.issue_refresh_token(db, 1)
+        other_session = AuthService.issue_refresh_token(db, 1)
+        _, successor = AuthService.rotate_refresh_token(db, token)
+        
+        assert AuthService.rotate_refresh_token(db, token) is None
+        assert AuthService.rotate_refresh_token(db, successor) is None
+        assert AuthService.rotate_refresh_token(db, other_session) is not None
+    
+    def test_revoked_inactive_and_unknown_tokens_rejected(self, db):
+        """Test refresh fails after revocation, for inactive users and for unknown tokens."""
+        revoked = AuthService.issue_refresh_token(db, 1)
+        assert AuthService.revoke_refresh_tokens(db, 1) == 1
+        assert AuthService.rotate_refresh_token(db, revoked) is None
+        
+        token = AuthService.issue_refresh_token(db, 1)
+        db.get(UserModel, 1).is_active = False
+        db.commit()
+        assert AuthService.rotate_refresh_token(db, token) is None
+        assert AuthService.rotate_refresh_token(db, "not-a-token") is None
@@ -0,0 +1,57 @@
+"""Unit tests for the access token revocation list."""
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from src.auth.revocation import RevocationList, to_timestamp
+
+
+def claims(jti: str = "t1", uid: int = 1, iat: float = 100.0) -> dict:
+    """Build verified token claims as get_token_claims returns them."""
+    return {"sub": "user@example.com", "uid": uid, "jti": jti, "iat": iat, "exp": time.time() + 60}
+
+
+class TestRevocationList:
+    """Test suite for revoking tokens by ID and by user."""
+    
+    def test_revoke_single_token(self):
+        """Test only the revoked token ID is rejected."""
+        revocations = RevocationList()
+        revocations.revoke_token("t1", time.time() + 60)
+        assert revocations.is_revoked(claims("t1"))
+        assert not revocations.is_revoked(claims("t2"))
+        assert revocations.stats()["rejections"] == 1
+    
+    def test_revoke_user_tokens_issued_before_cutoff(self):
+        """Test a user-wide revocation rejects older tokens of that user only."""
+        revocations = RevocationList()
+        revocations.revoke_user(1, issued_before=200.0, expires_at=time.time() + 60)
+        assert revocations.is_revoked(claims(uid=1, iat=199.5))
+        assert not revocations.is_revoked(claims(uid=1, iat=200.5))
+        assert not revocations.is_revoked(claims(uid=2, iat=199.5))
+    
+    def test_cutoff_applies_to_resolved_legacy_tokens(self):
+        """Test email-only tokens pass the claims check but not their user's cutoff."""
+        revocations = RevocationList()
+        revocations.revoke_user(1, issued_before=200.0, expires_at=time.time() + 60)
+        legacy = {"sub": "user@example.com", "iat": 150.0, "exp": time.time() + 60}
+        assert not revocations.is_revoked(legacy)
+        assert revocations.is_user_revoked(1, legacy["iat"])
+        assert revocations.is_user_revoked(1, 0)
+        assert not revocations.is_user_revoked(1, 250.0)
+        assert not revocations.is_user_revoked(2, 150.0)
+    
+    def test_load_merges_and_drops_expired(self):
+        """Test database rows are merged with local entries and expired ones dropped."""
+        revocations = RevocationList()
+        revocations.revoke_token("local", time.time() + 60)
+        revocations.revoke_token("stale", time.time() - 1)
+        expires = datetime.utcnow() + timedelta(minutes=5)
+        revocations.load([
+            SimpleNamespace(jti="remote", user_id=1, revoked_at=datetime.utcnow(), expires_at=expires),
+            SimpleNamespace(jti=None, user_id=2, revoked_at=datetime(2026, 1, 1), expires_at=expires),
+        ])
+        assert revocations.is_revoked(claims("local"))
+        assert revocations.is_revoked(claims("remote"))
+        assert not revocations.is_revoked(claims("stale"))
+        assert revocations.is_revoked(claims("other", uid=2, iat=to_timestamp(datetime(2025, 12, 31))))
+        assert revocations.stats()["tokens"] == 2
@@ -0,0 +1,93 @@
+"""Unit tests for connecting-flight search over the route graph."""
+import asyncio
+import pytest
+from fastapi import HTTPException
+from datetime import date, datetime, timedelta
+from src.routes import search as search_routes
+from src.schemas.search_schema import ConnectionSearchParams
+from src.services import search_service
+from src.services.flight_snapshot import FlightRow
+from src.services.route_graph import RouteGraph, RouteGraphNotLoaded
+
+START = datetime(2025, 1, 15, 8, 0)
+DAY_END = datetime(2025, 1, 15, 23, 59)
+
+
+def make_leg(flight_db_id, origin, destination, depart_hours, duration_hours=2, seats=100, price=100.0):
+    """Build a flight row departing ``depart_hours`` after START."""
+    departure = START + timedelta(hours=depart_hours)
+    return FlightRow(flight_db_id, f"FL{flight_db_id:03d}", "PIA", origin, destination,
+                     departure, departure + timedelta(hours=duration_hours), price, "USD", seats)
+
+
+@pytest.fixture
+def graph():
+    """Graph with a direct LHE-JFK flight and connections via DXB and DOH."""
+    route_graph = RouteGraph()
+    route_graph.load([
+        make_leg(1, "LHE", "DXB", 0, duration_hours=3),        # lands 11:00
+        make_leg(2, "DXB", "JFK", 4, duration_hours=14),       # 12:00 -> 02:00 +1
+        make_leg(3, "DXB", "JFK", 3.5, duration_hours=14),     # 30 min layover: too short
+        make_leg(4, "LHE", "JFK", 1, duration_hours=20),       # direct, lands 05:00 +1
+        make_leg(5, "LHE", "DOH", 0, duration_hours=3),
+        make_leg(6, "DOH", "DXB", 4, duration_hours=1),        # DOH -> DXB lands 13:00
+        make_leg(7, "DXB", "JFK", 6, duration_hours=14, seats=1),  # lands 04:00 +1
+        make_leg(8, "DXB", "LHE", 5),                          # back to origin
+    ])
+    return route_graph
+
+
+@pytest.mark.search
+class TestRouteGraph:
+    """Test suite for RouteGraph connection search."""
+    
+    def test_orders_by_arrival_and_honours_min_layover(self, graph):
+        """Test itineraries come earliest arrival first and skip too-short layovers."""
+        paths = graph.search("LHE", "JFK", START, DAY_END, max_stops=1)
+        assert [[leg.id for leg in path] for path in paths] == [[1, 2], [1, 7], [4]]
+    
+    def test_direct_only(self, graph):
+        """Test max_stops=0 returns only direct flights."""
+        paths = graph.search("LHE", "JFK", START, DAY_END, max_stops=0)
+        assert [[leg.id for leg in path] for path in paths] == [[4]]
+    
+    def test_seats_and_stops(self, graph):
+        """Test every leg needs enough seats and extra stops are explored."""
+        paths = graph.search("LHE", "JFK", START, DAY_END, passengers=2, max_stops=2)
+        assert [[leg.id for leg in path] for path in paths] == [[1, 2], [4]]
+        paths = graph.search("LHE", "JFK", START, DAY_END, max_stops=2, limit=10)
+        assert [5, 6, 7] in [[leg.id for leg in path] for path in paths]
+    
+    def test_max_layover_and_unloaded(self, graph):
+        """Test long layovers are excluded and an unloaded graph finds nothing."""
+        paths = graph.search("LHE", "JFK", START, DAY_END, max_layover=timedelta(hours=1), max_stops=1)
+        assert [[leg.id for leg in path] for path in paths] == [[1, 2], [4]]
+        assert RouteGraph().search("LHE", "JFK", START, DAY_END) == []
+    
+    def test_search_waits_for_first_build(self, graph, monkeypatch):
+        """Test connection search refuses to run (rather than build) until the graph is loaded."""
+        params = ConnectionSearchParams(origin="lhe", destination="jfk", departure_date=date(2025, 1, 15))
+        monkeypatch.setattr(search_service, "route_graph", RouteGraph())
+        with pytest.raises(RouteGraphNotLoaded):
+            search_service.SearchService.search_connections(params)
+        
+        monkeypatch.setattr(search_service, "route_graph", graph)
+        itineraries = search_service.SearchService.search_connections(params)
+        assert [itinerary.stops for itinerary in itineraries] == [1, 1, 0]
+    
+    def test_route_needs_setting(self, monkeypatch):
+        """Test the endpoint is 404 unless enabled, then 503 until the graph is loaded."""
+        monkeypatch.setattr(search_service, "route_graph", RouteGraph())
+        
+        def status_code():
+            with pytest.raises(HTTPException) as exc:
+                asyncio.run(search_routes.search_connections(
+                    origin="LHE", destination="JFK", departure_date=date(2025, 1, 15), date_window_days=0,
+                    passengers=1, max_stops=1, min_layover_minutes=45, max_layover_minutes=720, limit=10
+                ))
+            return exc.value.status_code
+        
+        monkeypatch.setattr(search_routes.settings, "CONNECTION_SEARCH_ENABLED", False)
+        assert status_code() == 404
+        monkeypatch.setattr(search_routes.settings, "CONNECTION_SEARCH_ENABLED", True)
+        assert status_code() == 503
@@ -0,0 +1,176 @@
+"""Unit tests for flight and hotel search."""
+import pytest
+from datetime import date, datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+from src.database import Base
+from src.models.flight_model import Flight as FlightModel, normalize_airport_code
+from src.models.hotel_model import Hotel as HotelModel
+from src.schemas.search_schema import FlightSearchParams
+from src.services import search_service
+from src.services.flight_snapshot import FlightRow, FlightSnapshot
+from src.services.search_service import (
+    SearchService, decode_cursor, encode_cursor, hotel_city_index, hotel_id_index
+)
+import json
+
+FLIGHT_ROW = FlightRow(1, "PK001", "PIA", "LHE", "DXB", datetime(2025, 1, 15, 8, 0),
+                       datetime(2025, 1, 15, 11, 0), 400.0, "USD", 100)
+
+
+class TestAirportCodes:
+    """Test airport code normalization."""
+    
+    def test_normalize_lowercase(self):
+        """Test codes are upper-cased and trimmed."""
+        assert normalize_airport_code(" lhe ") == "LHE"
+    
+    def test_normalize_none(self):
+        """Test missing codes stay None."""
+        assert normalize_airport_code(None) is None
+    
+    def test_model_stores_uppercase(self):
+        """Test flight model normalizes codes on write."""
+        flight = FlightModel(origin="jfk", destination="Lhr")
+        assert flight.origin == "JFK"
+        assert flight.destination == "LHR"
+
+
+@pytest.mark.search
+class TestFlightsQuery:
+    """Test the flight search statement."""
+    
+    def test_route_uses_equality(self):
+        """Test route filters compile to index-friendly equality predicates."""
+        query = SearchService.build_flights_query(FlightSearchParams(origin="lhe", destination="dxb"))
+        sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+        assert "flights.origin = 'LHE'" in sql
+        assert "flights.destination = 'DXB'" in sql
+        assert "lower(" not in sql.lower()
+    
+    def test_date_window_and_seats(self):
+        """Test date window and seat filters are pushed into SQL."""
+        params = FlightSearchParams(departure_date=date(2025, 1, 15), date_window_days=1, passengers=3)
+        sql = str(SearchService.build_flights_query(params).compile(compile_kwargs={"literal_binds": True}))
+        assert "flights.departure_time >= '2025-01-14 00:00:00'" in sql
+        assert "flights.departure_time < '2025-01-17 00:00:00'" in sql
+        assert "flights.available_seats >= 3" in sql
+    
+    def test_stream_query_unpaginated(self):
+        """Test the streaming statement drops the page limit and streams in batches."""
+        query = SearchService.build_stream_query(FlightSearchParams(origin="LHE"))
+        assert query._limit_clause is None
+        assert query.get_execution_options()["yield_per"] > 0
+    
+    def test_page_size_capped(self):
+        """Test requested page size is capped by settings."""
+        assert SearchService.page_size(FlightSearchParams(limit=10_000)) <= 200
+
+
+class TestSearchCursor:
+    """Test keyset cursor encoding."""
+    
+    def test_cursor_round_trip(self):
+        """Test a cursor decodes to the position it was built from."""
+        departure = datetime(2025, 1, 15, 8, 30)
+        assert decode_cursor(encode_cursor(departure, 42)) == (departure, 42)
+    
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestFlightSerialization:
+    """Test single-pass serialization of flight rows."""
+    
+    def test_rows_match_schema(self):
+        """Test row serialization matches the Flight response schema."""
+        row = (7, "PK301", "PIA", "ISB", "KHI", datetime(2025, 1, 15, 8, 0),
+               datetime(2025, 1, 15, 10, 0), 89.99, "USD", 150)
+        expected = SearchService.to_flight(type("Row", (), SearchService.row_to_dict(row))).model_dump()
+        assert json.loads(SearchService.serialize_flights([row])) == [expected]
+
+
+@pytest.mark.search
+class TestSnapshotSearch:
+    """Test flight search answered from the in-memory snapshot."""
+    
+    def test_snapshot_pages_not_cached(self, monkeypatch):
+        """Test snapshot answers skip the result cache, so a lagging snapshot is not pinned there."""
+        snapshot = FlightSnapshot()
+        snapshot.load([FLIGHT_ROW])
+        monkeypatch.setattr(search_service, "flight_snapshot", snapshot)
+        monkeypatch.setattr(search_service.settings, "FLIGHT_SNAPSHOT_ENABLED", True)
+        params = FlightSearchParams(origin="LHE", destination="DXB")
+        search_service.flight_search_cache.clear()
+        
+        page = SearchService.search_flights(None, params)
+        assert [flight["flight_id"] for flight in json.loads(page.content)] == ["PK001"]
+        assert SearchService.get_cached_page(params) is None
+
+
+@pytest.mark.search
+class TestHotelSearch:
+    """Test database-backed hotel search and its in-process indexes."""
+    
+    @pytest.fixture
+    def db(self):
+        """In-memory database with two hotels and empty hotel indexes."""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[HotelModel.__table__])
+        hotel_city_index.clear()
+        hotel_id_index.clear()
+        with Session(engine) as session:
+            session.add_all([
+                HotelModel(hotel_id="HT001", name="Burj Al Arab", city="Dubai", address="Jumeirah",
+                           rating=5.0, price_per_night=1200, available_rooms=15),
+                HotelModel(hotel_id="HT003", name="Pearl Continental", city="Lahore", address="Mall Road",
+                           rating=4.5, price_per_night=180, available_rooms=45),
+            ])
+            session.commit()
+            yield session
+        hotel_city_index.clear()
+        hotel_id_index.clear()
+    
+    def test_city_query_uses_lower_index(self):
+        """Test city search compiles to the lower(city) index expression."""
+        sql = str(SearchService.build_hotels_query(" DUBAI ").compile(compile_kwargs={"literal_binds": True}))
+        assert "lower(hotels.city) = 'dubai'" in sql
+    
+    def test_model_indexes_city_column(self):
+        """Test the model's index is on lower(city), as in the migration, not on a constant."""
+        index = next(ix for ix in HotelModel.__table__.indexes if ix.name == "ix_hotels_city_lower")
+        assert str(CreateIndex(index).compile(create_engine("sqlite://"))).endswith("(lower(city))")
+    
+    def test_search_is_case_insensitive_and_indexed(self, db):
+        """Test city search ignores case and fills both in-process indexes."""
+        hotels = SearchService.search_hotels(db, "dUBAI")
+        assert [h.hotel_id for h in hotels] == ["HT001"]
+        assert hotel_city_index.get("dubai") == hotels
+        assert hotel_id_index.get("HT001") == hotels[0]
+    
+    def test_get_hotel_by_id(self, db):
+        """Test hotel lookup by ID, including a missing hotel."""
+        assert SearchService.get_hotel_by_id(db, "HT003").price_per_night == 180.0
+        assert SearchService.get_hotel_by_id(db, "HT999") is None
+
+
+@pytest.mark.search
+class TestBatchLookup:
+    """Test batch flight lookup by ID."""
+    
+    def test_single_in_query(self):
+        """Test the batch statement is one IN query over distinct IDs."""
+        sql = str(SearchService.build_flights_by_ids_query([3, 1, 3]).compile(compile_kwargs={"literal_binds": True}))
+        assert "flights.id IN (1, 3)" in sql
+    
+    def test_request_order(self):
+        """Test results follow request order without duplicates or unknown IDs."""
+        rows = [
+            FLIGHT_ROW._replace(id=1, flight_id="PK001"),
+            FLIGHT_ROW._replace(id=3, flight_id="PK003"),
+        ]
+        flights = SearchService.order_by_ids(rows, [3, 99, 1, 3])
+        assert [f.id for f in flights] == [3, 1]
@@ -1,6 +1,8 @@
 """Unit tests for security utilities."""
+import asyncio
+import threading
 import pytest
-from src.auth.security import hash_password, verify_password
+from src.auth.security import PasswordHasher, PasswordHasherBusy, hash_password, verify_password
 
 
 class TestSecurity:
@@ -97,3 +99,43 @@ class TestSecurity:
         
         # Assert
         assert result is True
+
+
+class TestPasswordHasher:
+    """Test suite for the bounded bcrypt pool."""
+    
+    def test_runs_password_work_off_the_loop(self):
+        """Test hashing and verifying through the pool match the sync functions."""
+        hasher = PasswordHasher(workers=2, queue_size=0)
+        
+        async def run():
+            hashed = await hasher.run(hash_password, "PoolPassword123!")
+            verified = await hasher.run(verify_password, "PoolPassword123!", hashed)
+            return verified, await hasher.run(threading.current_thread)
+        
+        try:
+            verified, worker = asyncio.run(run())
+        finally:
+            hasher.shutdown()
+        
+        assert verified is True
+        assert worker.name.startswith("password-hasher")
+    
+    def test_rejects_work_beyond_workers_and_queue(self):
+        """Test requests past workers + queue size fail fast, and slots free up afterwards."""
+        hasher = PasswordHasher(workers=1, queue_size=1)
+        release = threading.Event()
+        
+        async def run():
+            pending = [asyncio.ensure_future(hasher.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(PasswordHasherBusy):
+                await hasher.run(release.wait)
+            release.set()
+            await asyncio.gather(*pending)
+            return await hasher.run(release.wait)
+        
+        try:
+            assert asyncio.run(run()) is True
+        finally:
+            hasher.shutdown()
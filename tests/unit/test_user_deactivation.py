@@ -0,0 +1,90 @@
+"""End-to-end tests for account deactivation through the API."""
+import asyncio
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.auth.jwt_handler import create_access_token
+from src.auth.revocation import revocation_list
+from src.database import Base, get_session
+from src.main import app
+from src.models.user_model import User as UserModel
+from src.services.auth_service import AuthService
+
+CREDENTIALS = {"username": "leaver@example.com", "password": "pw123456"}
+
+
+@pytest.fixture
+def client():
+    """Run requests against the app in-process on an in-memory database."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    def get_test_session():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_session] = get_test_session
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+
+    def request(method, url, **kwargs):
+        async def send():
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                return await http.request(method, url, **kwargs)
+        return asyncio.run(send())
+
+    yield request, SessionLocal
+    app.dependency_overrides.clear()
+    revocation_list.clear()
+    engine.dispose()
+
+
+class TestUserDeactivation:
+    """Test suite for POST /users/me/deactivate."""
+    
+    def test_deactivation_revokes_tokens(self, client):
+        """Test deactivating an account locks out its access (legacy too) and refresh tokens, and later logins."""
+        request, SessionLocal = client
+        response = request("POST", "/auth/register", json={
+            "email": CREDENTIALS["username"], "password": CREDENTIALS["password"], "full_name": "Leaver"
+        })
+        assert response.status_code == 201
+        tokens = request("POST", "/auth/login", data=CREDENTIALS).json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        legacy_headers = {"Authorization": f"Bearer {create_access_token({'sub': CREDENTIALS['username']})}"}
+        assert request("GET", "/users/me", headers=headers).status_code == 200
+        assert request("GET", "/users/me", headers=legacy_headers).status_code == 200
+        
+        assert request("POST", "/users/me/deactivate", headers=headers).status_code == 204
+        
+        with SessionLocal() as db:
+            assert db.query(UserModel).one().is_active is False
+        assert request("GET", "/users/me", headers=headers).status_code == 401
+        assert request("GET", "/users/me", headers=legacy_headers).status_code == 401
+        refreshed = request("POST", "/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert refreshed.status_code == 401
+        
+        relogin = request("POST", "/auth/login", data=CREDENTIALS)
+        assert relogin.status_code == 400
+        assert relogin.json()["detail"] == "Inactive user"
+    
+    def test_inactive_token_cannot_book(self, client):
+        """Test a token carrying the inactive flag is refused by the booking routes."""
+        request, SessionLocal = client
+        with SessionLocal() as db:
+            db.add(UserModel(id=1, email=CREDENTIALS["username"], full_name="Leaver", hashed_password="x", is_active=False))
+            db.commit()
+            headers = {"Authorization": f"Bearer {AuthService.issue_access_token(db.get(UserModel, 1))}"}
+        
+        response = request("POST", "/bookings", headers=headers, json={
+            "flight_id": 1,
+            "passengers": [{"first_name": "A", "last_name": "B", "passport_number": "P1", "date_of_birth": "1990-01-01"}]
+        })
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+        assert request("GET", "/bookings/1", headers=headers).status_code == 400